@@ -0,0 +1,53 @@
+import sys
+from argparse import ArgumentParser
+from typing import Dict, List
+
+from benchmarks.suite import MODELS, NEIGHBORHOODS, SIZES, compare, load, run, save
+
+
+def main(arguments: List[str] | None = None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks", description="SimuLab benchmarks.")
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=None)
+    parser.add_argument("--neighborhoods", nargs="+", choices=list(NEIGHBORHOODS), default=None)
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--steps", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=30.0, help="Seconds per case.")
+    parser.add_argument("--no-plots", action="store_true")
+    parser.add_argument("--no-imports", action="store_true")
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline", default=None, help="Results to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    options = parser.parse_args(arguments)
+
+    def report(name: str, metrics: Dict[str, float] | None) -> None:
+        if metrics is None:
+            print(f"{name:<40} skipped (over budget)")
+        else:
+            times = ", ".join(f"{metric}={value:.4f}" for metric, value in metrics.items())
+            print(f"{name:<40} {times}")
+
+    results = run(
+        models=options.models,
+        neighborhoods=options.neighborhoods,
+        sizes=tuple(options.sizes),
+        steps=options.steps,
+        plots=not options.no_plots,
+        budget=options.budget,
+        report=report,
+        imports=not options.no_imports,
+    )
+    save(results, options.output)
+    print(f"Results saved in {options.output}")
+
+    if options.baseline:
+        regressions = compare(results, load(options.baseline), options.tolerance)
+        for name, metric, ratio in regressions:
+            print(f"REGRESSION {name} {metric}: {ratio:.2f}x the baseline")
+        if regressions:
+            return 1
+        print(f"No regressions against {options.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
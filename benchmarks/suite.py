@@ -0,0 +1,224 @@
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Type
+from unittest import mock
+
+import numpy as np
+import plotly.graph_objects as go
+
+from simulab.models.abstract.model import AbstractLatticeModel
+from simulab.models.computational.condensation.model import Condensation
+from simulab.models.computational.game_of_life.model import GameOfLife
+from simulab.models.computational.real_state_market.model import RealStateMarket
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.equilibrium_criterion import EquilibriumCriterion, WithoutCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.lattice import Lattice
+from simulab.simulation.core.neighborhood import ExpandedMoore, Moore, Neighborhood, VonNeumann
+from simulab.simulation.core.runner import Runner
+from simulab.simulation.plotters.animated_lattice import AnimatedLatticeSeries
+from simulab.simulation.plotters.final_grid import FinalGridSeries
+
+Results = Dict[str, Dict[str, float]]
+
+SIZES = (32, 64, 128, 256, 512, 1024, 2048)
+
+NEIGHBORHOODS: Dict[str, Type[Neighborhood]] = {
+    "VonNeumann": VonNeumann,
+    "Moore": Moore,
+    "ExpandedMoore(2)": ExpandedMoore(vision_range=2),  # type: ignore[dict-item]
+}
+
+# Model, parameters for a length and the series checked by the equilibrium criterion.
+MODELS: Dict[
+    str, Tuple[Type[AbstractLatticeModel], Callable[[int], Dict[str, Any]], str | None]
+] = {
+    "Schelling": (
+        Schelling,
+        lambda length: {"tolerance": 3},
+        "total_average_satisfaction_level",
+    ),
+    "Condensation": (
+        Condensation,
+        lambda length: {"probability": 0.5},
+        "maximum_cluster_size",
+    ),
+    "GameOfLife": (
+        GameOfLife,
+        lambda length: {"seeds": [], "configuration": Lattice.random(2, length)},
+        None,
+    ),
+    "RealStateMarket": (
+        RealStateMarket,
+        lambda length: {"A": 1 / 64},
+        "total_average_utility_level",
+    ),
+}
+
+# Modules whose import time is measured, and dependencies that they should not load.
+IMPORTS = (
+    "simulab.models.abstract.model",
+    "simulab.models.computational.schelling.model",
+    "simulab.models.computational.condensation.model",
+    "simulab.simulation.core.runner",
+    "simulab.simulation.plotters.final_grid",
+    "simulab.simulation.plotters.categorical_animated_lattice",
+    "simulab.simulation.plotters.renderer",
+)
+HEAVY_MODULES = ("plotly", "pandas", "networkx")
+
+
+def case_name(model: str, neighborhood: str, length: int) -> str:
+    return f"{model}/{neighborhood}/{length}"
+
+
+def _timed(action: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def measure(
+    model: str,
+    neighborhood: str,
+    length: int,
+    steps: int = 3,
+    plots: bool = True,
+) -> Dict[str, float]:
+    model_class, parameters, criterion_series = MODELS[model]
+    parameters_set = ExperimentParametersSet(
+        length=[length],
+        neighborhood=[NEIGHBORHOODS[neighborhood]],
+        **{name: [value] for name, value in parameters(length).items()},
+    )
+    runner = Runner(model_class, parameters_set, WithoutCriterion(), max_steps=0)
+    result = {"initialize": _timed(runner.start)}
+    experiment = runner.experiments[0]
+
+    run_step, snapshot = [], []
+    for _ in range(steps):
+        run_step.append(_timed(experiment.run_step))
+        for name in experiment._sorted_series_names:
+            start = time.perf_counter()
+            value = getattr(experiment, name)()
+            snapshot.append(time.perf_counter() - start)
+            experiment.series[name].append(value)
+    result["run_step"] = float(np.median(run_step))
+    result["snapshot"] = float(np.sum(snapshot) / steps)
+
+    if criterion_series is not None:
+        criterion = EquilibriumCriterion(criterion_series, window_size=steps)
+        result["criterion"] = _timed(lambda: criterion.in_equilibrium(experiment.series))
+
+    if plots:
+        # Only the figures are built, without rendering them.
+        with mock.patch.object(go.Figure, "show"):
+            result["final_grid_plot"] = _timed(
+                lambda: FinalGridSeries.show_up("agent_types_lattice", runner, "Benchmark")
+            )
+            result["animated_plot"] = _timed(
+                lambda: AnimatedLatticeSeries.show_up("agent_types_lattice", runner, 0, "Benchmark")
+            )
+    return result
+
+
+def measure_import(module: str) -> Dict[str, float]:
+    # Imports the module in a new interpreter, as a worker process would.
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "seconds = time.perf_counter() - start\n"
+        f"heavy = {{name.split('.')[0] for name in sys.modules}} & set({HEAVY_MODULES!r})\n"
+        "print(json.dumps({'seconds': seconds, 'heavy_modules': len(heavy)}))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    ).stdout
+    result: Dict[str, float] = json.loads(output)
+    return result
+
+
+def run(
+    models: List[str] | None = None,
+    neighborhoods: List[str] | None = None,
+    sizes: Tuple[int, ...] = SIZES,
+    steps: int = 3,
+    plots: bool = True,
+    budget: float = 30.0,
+    report: Callable[[str, Dict[str, float] | None], None] | None = None,
+    imports: bool = True,
+) -> Results:
+    # Sizes grow until a case takes more than the budget (in seconds), the rest are skipped.
+    np.random.seed(0)
+    results: Results = {}
+    for module in IMPORTS if imports else ():
+        results[f"import/{module}"] = measure_import(module)
+        if report:
+            report(f"import/{module}", results[f"import/{module}"])
+    for model in models or list(MODELS):
+        for neighborhood in neighborhoods or list(NEIGHBORHOODS):
+            over_budget = False
+            for length in sorted(sizes):
+                name = case_name(model, neighborhood, length)
+                if over_budget:
+                    if report:
+                        report(name, None)
+                    continue
+                start = time.perf_counter()
+                results[name] = measure(model, neighborhood, length, steps, plots)
+                over_budget = time.perf_counter() - start > budget
+                if report:
+                    report(name, results[name])
+    return results
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "numpy": np.__version__,
+    }
+
+
+def save(results: Results, path: str | Path) -> None:
+    Path(path).write_text(
+        json.dumps({"environment": environment(), "results": results}, indent=2, sort_keys=True)
+    )
+
+
+def load(path: str | Path) -> Results:
+    results: Results = json.loads(Path(path).read_text())["results"]
+    return results
+
+
+def compare(
+    results: Results,
+    baseline: Results,
+    tolerance: float = 0.25,
+) -> List[Tuple[str, str, float]]:
+    # Cases and metrics slower than the baseline by more than the tolerance, with their ratio.
+    regressions = []
+    for name, metrics in sorted(results.items()):
+        for metric, seconds in sorted(metrics.items()):
+            try:
+                reference = baseline[name][metric]
+            except KeyError:
+                continue
+            if reference > 0:
+                ratio = seconds / reference
+            else:
+                ratio = float("inf") if seconds > 0 else 1.0
+            if ratio > 1 + tolerance:
+                regressions.append((name, metric, ratio))
+    return regressions
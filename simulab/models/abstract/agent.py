@@ -1,16 +1,73 @@
 from abc import ABC
+from copy import deepcopy
 from functools import total_ordering
-from typing import cast
+from typing import Any, Dict, Iterator, Type, cast
+
+_SHARED: Dict[int, "Agent"] = {}
+
+
+def _slots_of(cls: Type["Agent"]) -> Iterator[str]:
+    for klass in cls.__mro__:
+        yield from klass.__dict__.get("__slots__", ())
 
 
 @total_ordering
 class Agent(ABC):
+    __slots__ = ("agent_type",)
+
     def __init__(
         self,
         agent_type: int,
     ):
         self.agent_type = agent_type
 
+    @classmethod
+    def of(cls, agent_type: int) -> "Agent":
+        # Basic agents only carry their type, so one immutable instance per type is
+        # shared by every cell of every lattice (and copying them is free).
+        agent_type = int(agent_type)
+        try:
+            return _SHARED[agent_type]
+        except KeyError:
+            return _SHARED.setdefault(agent_type, Agent(agent_type))
+
+    @property
+    def is_shared(self) -> bool:
+        try:
+            return _SHARED.get(self.agent_type) is self
+        except AttributeError:
+            # Agents being built have no type yet.
+            return False
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.is_shared:
+            raise AttributeError(f"Shared agent {self} is immutable, replace it with Agent.of.")
+        super(Agent, self).__setattr__(name, value)
+
+    def __copy__(self) -> "Agent":
+        if self.is_shared:
+            return self
+        clone = object.__new__(type(self))
+        for name in _slots_of(type(self)):
+            if hasattr(self, name):
+                object.__setattr__(clone, name, getattr(self, name))
+        return clone
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Agent":
+        if self.is_shared:
+            return self
+        clone = object.__new__(type(self))
+        memo[id(self)] = clone
+        for name in _slots_of(type(self)):
+            if hasattr(self, name):
+                object.__setattr__(clone, name, deepcopy(getattr(self, name), memo))
+        return clone
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        if self.is_shared:
+            return (Agent.of, (self.agent_type,))
+        return super(Agent, self).__reduce_ex__(protocol)
+
     def __repr__(self) -> str:
         return str(self.agent_type)
 
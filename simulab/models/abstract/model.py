@@ -1,18 +1,66 @@
+import asyncio
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from copy import deepcopy
 from functools import partial
-from typing import Any, Callable, Dict, List, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-import networkx as nx
 import numpy as np
 
 from simulab.models.abstract.agent import Agent
-from simulab.simulation.core.equilibrium_criterion import AbstractCriterion
+from simulab.simulation.core.equilibrium_criterion import AbstractCriterion, WithoutCriterion
 from simulab.simulation.core.lattice import Lattice
 from simulab.simulation.core.neighborhood import Neighborhood, VonNeumann
+from simulab.simulation.core.profiling import Hook
+from simulab.simulation.core.scheduler import ByAgentType, RowMajor, Scheduler
+
+T = TypeVar("T")
+
+
+class SeriesList(list):  # type: ignore[type-arg]
+    # The values of a series, as a list that can be weakly referenced (so that plotters can
+    # cache its statistics without keeping it alive).
+    __slots__ = ("__weakref__",)
 
 
 class AbstractLatticeModel(ABC):
+    # Set to True in models whose step only changes the (i,j) cell, reading its neighborhood.
+    local_step: bool = False
+
+    # Series of the class and their names sorted so that dependencies come first, computed
+    # once when the class is created.
+    _series: Dict[str, Any] = {}
+    _sorted_series_names: List[str] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        series: Dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            for name, attribute in vars(klass).items():
+                if getattr(attribute, "__is_series__", False):
+                    series[name] = attribute
+                else:
+                    series.pop(name, None)
+        cls._series = series
+        cls._sorted_series_names = _sorted_by_dependencies(series)
+
     def __init__(
         self,
         length: int,
@@ -21,58 +69,86 @@ class AbstractLatticeModel(ABC):
         agent_types: int = 2,
         update_simultaneously: bool = False,
         update_sorted_by_agent_type: bool = False,
+        update_active_only: bool = False,
+        full_sweep_threshold: float = 0.5,
+        scheduler: Scheduler | None = None,
+        hooks: List[Hook] | None = None,
     ):
         self.length = length
         self.neighborhood = neighborhood(self.length)
         self.agent_types = agent_types
         self.update_simultaneously = update_simultaneously
         self.update_sorted_by_agent_type = update_sorted_by_agent_type
+        assert not (
+            scheduler and update_sorted_by_agent_type
+        ), "Use the ByAgentType scheduler instead of update_sorted_by_agent_type."
+        if scheduler is None:
+            scheduler = ByAgentType() if update_sorted_by_agent_type else RowMajor()
+        self.scheduler = scheduler
+        if update_active_only:
+            assert (
+                self.local_step and self.update_simultaneously
+            ), "Active-set updates need a model with local and simultaneous steps."
+            assert 0 <= full_sweep_threshold <= 1, "Full sweep threshold should be in [0, 1]."
+        self.update_active_only = update_active_only
+        self.full_sweep_threshold = full_sweep_threshold
         self.series_history: Dict[str, List[List[Union[int, float]]]] = {}
+        self.hooks: List[Hook] = list(hooks) if hooks else []
         self.__initial_configuration = configuration
+        self.__step_arrays: Dict[str, np.ndarray] = {}
 
     def __initialize(self) -> None:
-        self._by_type: Dict[int, Set[Tuple[int, int]]] = {
-            _type: set() for _type in range(self.agent_types)
-        }
-        self.__configure_agents()
+        self._active: Set[Tuple[int, int]] | None = None
+        self._configure_agents()
         self.__configure_series()
 
-    def __configure_agents(self) -> None:
+    def _initial_lattice(self) -> Lattice:
         raw = deepcopy(self.__initial_configuration)
         if isinstance(raw, Lattice):
-            pass
+            return raw
         elif raw is not None:
-            raw = Lattice(raw)
+            return Lattice(raw)
         else:
-            raw = Lattice.random(self.agent_types, self.length)
-        self.configuration = raw
+            return Lattice.random(self.agent_types, self.length)
+
+    def _configure_agents(self) -> None:
+        # Overload this method in your model if it does not need one agent
+        # instance per cell (e.g. engines that keep the state in NumPy arrays).
+        self.configuration = self._initial_lattice()
 
+        self._process_lattice_with(
+            partial(self.__create_agent_as, self.__basic_agent),
+            inplace=True,
+        )
         try:
-            for method in [self.__basic_agent, self._create_agent]:
-                self._process_lattice_with(
-                    partial(self.__create_agent_as, method),
-                    inplace=True,
-                )
+            self._prepare_agents()
+            self._process_lattice_with(
+                partial(self.__create_agent_as, self._create_agent),
+                inplace=True,
+            )
         except NotImplementedError:
             pass
 
     def __create_agent_as(
         self,
-        method: Callable[[int, int, int], Agent],
+        method: Callable[[Any, int, int], Agent],
         i: int,
         j: int,
     ) -> Agent:
         target = self.configuration.at(i, j)
-        agent = (
+        return (
             target
             if isinstance(target, Agent) and type(target) is not Agent
             else method(target, i, j)
         )
-        self._by_type[agent.agent_type].add((i, j))
-        return agent
 
     def __basic_agent(self, agent_type: int, i: int, j: int) -> Agent:
-        return Agent(agent_type=agent_type)
+        return Agent.of(agent_type)
+
+    def _prepare_agents(self) -> None:
+        # Overload this method in your model to compute, once for the whole lattice of
+        # basic agents, the data later used by _create_agent (e.g. with NumPy arrays).
+        pass
 
     def _create_agent(self, basic_agent: Agent, i: int, j: int) -> Agent:
         # Overload this method in your model to create custom agents based on
@@ -92,30 +168,53 @@ class AbstractLatticeModel(ABC):
             flatten=flatten,
         )
 
-    ROOT = "ROOT"
-
     def __configure_series(self) -> None:
-        self.series: Dict[str, Any] = {}
-        self.__dependencies__ = nx.DiGraph()
-        self.__dependencies__.add_node(self.ROOT)
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-            try:
-                if method.__is_series__:
-                    self.series[method.__name__] = []
-                    if method.__depends__:
-                        for dependency in method.__depends__:
-                            self.__dependencies__.add_edge(method.__name__, dependency)
-                    else:
-                        self.__dependencies__.add_edge(method.__name__, self.ROOT)
-            except AttributeError:
-                pass
-        bfs_edges = list(nx.bfs_edges(self.__dependencies__, self.ROOT, reverse=True))
-        self._sorted_series_names = [series_name for dependency, series_name in bfs_edges]
-
-    def __take_snapshot(self) -> None:
-        for name in self._sorted_series_names:
-            self.series[name].append(getattr(self, name)())
+        self.series: Dict[str, Any] = {name: SeriesList() for name in self._sorted_series_names}
+
+    def __take_snapshot(self, names: List[str]) -> None:
+        if self.hooks:
+            for name in names:
+                self.series[name].append(self.__measured(f"series.{name}", getattr(self, name)))
+        else:
+            for name in names:
+                self.series[name].append(getattr(self, name)())
+
+    def __measured(self, section: str, action: Callable[[], T]) -> T:
+        if not self.hooks:
+            return action()
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        result = action()
+        seconds = time.perf_counter() - start
+        blocks = sys.getallocatedblocks() - blocks
+        for hook in self.hooks:
+            hook.measured(self, section, seconds, blocks)
+        return result
+
+    def __streamed_series(
+        self,
+        series: Tuple[str, ...] | None,
+        criterion: AbstractCriterion,
+    ) -> List[str]:
+        # Keeps only the last values needed by the requested series, their dependencies
+        # and the criterion, and returns the names to compute on each snapshot.
+        requested = self._sorted_series_names if series is None else series
+        for name in requested:
+            if name not in self.series:
+                raise ValueError(f"There is no series named as '{name}'.")
+        required = criterion.required_series()
+        if required is None:
+            return self._sorted_series_names
+
+        history: Dict[str, int | None] = dict(required)
+        pending = list(requested) + list(required)
+        while pending:
+            name = pending.pop()
+            history.setdefault(name, 1)
+            depends = self._series[name].__depends__
+            pending.extend(dependency for dependency in depends or () if dependency not in history)
+        self.series = {name: deque(maxlen=history[name]) for name in history}
+        return [name for name in self._sorted_series_names if name in history]
 
     def __save_series_history(self, series: Tuple[str]) -> None:
         if len(series) > 0:
@@ -147,7 +246,7 @@ class AbstractLatticeModel(ABC):
         agent_type: int | None = None,
         count_myself: bool = False,
     ) -> int:
-        _agent_type = agent_type if agent_type else self.get_agent(i, j).agent_type
+        _agent_type = agent_type if agent_type is not None else self.get_agent(i, j).agent_type
         like_minded_neighbors = [
             1
             for row, col in self.neighborhood.indexes_for(i, j)
@@ -161,30 +260,183 @@ class AbstractLatticeModel(ABC):
         max_steps: int,
         criterion: AbstractCriterion,
         saving_series: Tuple[str],
+        on_step: Callable[[int], None] | None = None,
     ) -> None:
-        self.__initialize()
-        self.__take_snapshot()
-        for _ in range(max_steps):
-            self.run_step()
-            self.__take_snapshot()
-            if criterion.in_equilibrium(self.series):
-                break
+        for step, _ in enumerate(self.__run(max_steps, criterion, self.__prepare_run)):
+            if on_step is not None:
+                on_step(step)
         self.__save_series_history(series=saving_series)
 
+    def __prepare_run(self) -> List[str]:
+        self.__initialize()
+        return self._sorted_series_names
+
+    def stream(
+        self,
+        max_steps: int,
+        criterion: AbstractCriterion | None = None,
+        series: Tuple[str, ...] | None = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        # Yields the values of the requested series (all by default) on each step. The
+        # next step only runs when the consumer asks for it, and self.series only keeps
+        # the values still needed, instead of the whole run.
+        _criterion = criterion if criterion is not None else WithoutCriterion()
+        prepare = partial(self.__prepare_stream, series, _criterion)
+        for names in self.__run(max_steps, _criterion, prepare):
+            yield {name: self.series[name][-1] for name in (names if series is None else series)}
+
+    def __prepare_stream(
+        self,
+        series: Tuple[str, ...] | None,
+        criterion: AbstractCriterion,
+    ) -> List[str]:
+        self.__initialize()
+        return self.__streamed_series(series, criterion)
+
+    async def astream(
+        self,
+        max_steps: int,
+        criterion: AbstractCriterion | None = None,
+        series: Tuple[str, ...] | None = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # Same as stream, running each step in a thread so the event loop is not blocked.
+        steps = self.stream(max_steps, criterion, series)
+        step: "asyncio.Future[Dict[str, Any] | None] | None" = None
+        try:
+            while True:
+                step = asyncio.ensure_future(asyncio.to_thread(next, steps, None))
+                snapshot = await asyncio.shield(step)
+                step = None
+                if snapshot is None:
+                    break
+                yield snapshot
+        finally:
+            # Runs the hooks of the end of the experiment when the consumer stops early. If
+            # it is cancelled during a step, the generator is closed once the step ends.
+            if step is not None:
+                await asyncio.wait([step])
+            steps.close()
+
+    def __run(
+        self,
+        max_steps: int,
+        criterion: AbstractCriterion,
+        prepare: Callable[[], List[str]],
+    ) -> Iterator[List[str]]:
+        for hook in self.hooks:
+            hook.before_experiment(self)
+        try:
+            names = self.__measured("initialize", prepare)
+            self.__take_snapshot(names)
+            yield names
+            for step in range(1, max_steps + 1):
+                for hook in self.hooks:
+                    hook.before_step(self, step)
+                self.__measured("step", self.run_step)
+                self.__take_snapshot(names)
+                for hook in self.hooks:
+                    hook.after_step(self, step)
+                yield names
+                if self.__measured("criterion", partial(criterion.in_equilibrium, self.series)):
+                    break
+        finally:
+            for hook in self.hooks:
+                hook.after_experiment(self)
+
     def run_step(self) -> None:
-        configuration = (
-            deepcopy(self.configuration) if self.update_simultaneously else self.configuration
-        )
-        if self.update_sorted_by_agent_type:
-            for _type in range(self.agent_types):
-                for position in self._by_type[_type]:
-                    self.step(*position, configuration=configuration)
+        active = self._active_positions()
+        batches: Iterable[Sequence[Tuple[int, int]]]
+        if active is None:
+            configuration = (
+                self.__measured("copy", partial(deepcopy, self.configuration))
+                if self.update_simultaneously
+                else self.configuration
+            )
+            batches = self.scheduler.batches(self)
         else:
-            for i, j in ((i, j) for i in range(self.length) for j in range(self.length)):
-                self.step(i, j, configuration=configuration)
+            configuration = self.configuration.copy_at(active)
+            batches = [active]
+        if self.update_active_only:
+            batches = list(batches)
+        try:
+            for batch in batches:
+                self._step_batch(batch, configuration)
+        finally:
+            self.__step_arrays.clear()
+        if self.update_active_only:
+            self.__track_changes(
+                [position for batch in batches for position in batch], configuration
+            )
         if self.update_simultaneously:
             self.configuration = configuration
 
+    def _step_batch(self, positions: Sequence[Tuple[int, int]], configuration: Lattice) -> None:
+        # Overload this method in your model to update a whole batch at once (e.g. with
+        # NumPy arrays) when _vectorized_batch is True.
+        for position in positions:
+            self.step(*position, configuration=configuration)
+
+    def _independent_batch(self) -> bool:
+        # Local steps of a batch can be computed at once, from the same agent types, when
+        # they read the previous configuration or no two cells of the batch are neighbors.
+        return self.local_step and (
+            self.update_simultaneously or self.scheduler.independent_batches
+        )
+
+    def _vectorized_batch(self, positions: Sequence[Tuple[int, int]]) -> bool:
+        # Whether to update the batch from arrays of the whole lattice: when its steps are
+        # independent and the arrays are already built in this step, or cost less than
+        # reading the neighbors of each position (unlike small active sets).
+        if not self._independent_batch():
+            return False
+        reads = len(positions) * (self.neighborhood.size() + 1)
+        return bool(self.__step_arrays) or reads >= self.length**2
+
+    def _step_array(self, name: str, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        # Arrays of the lattice computed once per step with simultaneous updates, where the
+        # agent types do not change until the step ends, and on each call otherwise.
+        if not self.update_simultaneously:
+            return compute()
+        if name not in self.__step_arrays:
+            self.__step_arrays[name] = compute()
+        return self.__step_arrays[name]
+
+    def _agent_types(self) -> np.ndarray:
+        return self._step_array(
+            "agent_types",
+            lambda: np.array(
+                self._process_lattice_with(lambda i, j: self.get_agent(i, j).agent_type)
+            ),
+        )
+
+    def _active_positions(self) -> List[Tuple[int, int]] | None:
+        # Cells far from any change keep their state, so only the changed cells and their
+        # neighborhoods are updated, unless they are too many to beat a full sweep.
+        if self._active is None or len(self._active) > self.full_sweep_threshold * self.length**2:
+            return None
+        return sorted(self._active)
+
+    def __track_changes(
+        self,
+        positions: List[Tuple[int, int]],
+        configuration: Lattice,
+    ) -> None:
+        active = set()
+        for i, j in positions:
+            if configuration.at(i, j).agent_type != self.get_agent(i, j).agent_type:
+                active.add((i, j))
+                active.update(self.neighborhood.indexes_for(i, j))
+        self._active = active
+
+    def rate(self, i: int, j: int) -> float:
+        # Overload this method in your model to set how often the (i,j) cell is updated by
+        # the EventDriven scheduler (e.g. 0 for cells that cannot change).
+        return 1.0
+
+    def affected_by(self, i: int, j: int) -> List[Tuple[int, int]]:
+        # Cells whose rate may change after a step in the (i,j) cell.
+        return [(i, j)] + self.neighborhood.indexes_for(i, j)
+
     @abstractmethod
     def step(
         self,
@@ -198,6 +450,29 @@ class AbstractLatticeModel(ABC):
         return sum(self.series[series_name][-1], [])
 
 
+def _sorted_by_dependencies(series: Dict[str, Any]) -> List[str]:
+    # Topological order (Kahn), taking the ready series alphabetically.
+    pending: Dict[str, Set[str]] = {}
+    for name in sorted(series):
+        depends = set(series[name].__depends__ or ())
+        for dependency in depends:
+            assert dependency in series, f"Series '{name}' depends on unknown '{dependency}'."
+        pending[name] = depends
+    result: List[str] = []
+    ready = [name for name, depends in pending.items() if not depends]
+    while ready:
+        name = ready.pop(0)
+        result.append(name)
+        del pending[name]
+        for other, depends in pending.items():
+            if name in depends:
+                depends.remove(name)
+                if not depends:
+                    ready.append(other)
+    assert not pending, f"Circular dependencies between the series {sorted(pending)}."
+    return result
+
+
 def __as_series(
     model_function: Callable[[Any], Any],
     depends: Tuple[str] | None = None,
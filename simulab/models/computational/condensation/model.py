@@ -1,14 +1,22 @@
-from typing import List, cast
+from typing import TYPE_CHECKING, List, Sequence, Tuple, cast
 
-import networkx as nx
+import numpy as np
 
+from simulab.models.abstract.agent import Agent
 from simulab.models.abstract.model import AbstractLatticeModel, as_series
 from simulab.simulation.core.lattice import Lattice
+from simulab.simulation.core.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import networkx as nx
+else:
+    nx = lazy_import("networkx", extra="graphs")
 
 
 class Condensation(AbstractLatticeModel):
     CONDENSES = 1
     EVAPORATES = 0
+    local_step = True
 
     def __init__(  # type: ignore[no-untyped-def]
         self,
@@ -18,7 +26,7 @@ class Condensation(AbstractLatticeModel):
     ):
         self.probability: float = probability
         length = kwargs.get("length")
-        configuration = kwargs.get(
+        configuration = kwargs.pop(
             "configuration", Lattice.with_probability(self.probability, cast(int, length))
         )
         super(Condensation, self).__init__(  # type: ignore[misc]
@@ -40,9 +48,27 @@ class Condensation(AbstractLatticeModel):
         agent_type = self.get_agent(i, j).agent_type
         neighbors = self.__condensed_amount(i, j) + agent_type
         if agent_type == self.EVAPORATES and neighbors >= 4:
-            configuration.at(i, j).agent_type = self.CONDENSES
+            configuration.set(i, j, _with=Agent.of(self.CONDENSES))
         if agent_type == self.CONDENSES and neighbors < 4:
-            configuration.at(i, j).agent_type = self.EVAPORATES
+            configuration.set(i, j, _with=Agent.of(self.EVAPORATES))
+
+    def _step_batch(self, positions: Sequence[Tuple[int, int]], configuration: Lattice) -> None:
+        if not self._vectorized_batch(positions):
+            return super()._step_batch(positions, configuration)
+        agent_types = self._agent_types()
+        neighbors = self._step_array(
+            "neighbors",
+            lambda: self.neighborhood.count(agent_types == self.CONDENSES) + agent_types,
+        )
+        rows, cols = np.array(positions, dtype=int).reshape(-1, 2).T
+        condenses = neighbors[rows, cols] >= 4
+        changed = condenses != (agent_types[rows, cols] == self.CONDENSES)
+        for i, j, condensed in zip(
+            rows[changed].tolist(), cols[changed].tolist(), condenses[changed].tolist()
+        ):
+            configuration.set(
+                i, j, _with=Agent.of(self.CONDENSES if condensed else self.EVAPORATES)
+            )
 
     @as_series
     def agent_types_lattice(self) -> List[List[int]]:
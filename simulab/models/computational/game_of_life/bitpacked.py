@@ -0,0 +1,89 @@
+from typing import List
+
+import numpy as np
+
+from simulab.models.abstract.agent import Agent
+from simulab.models.abstract.model import as_series
+from simulab.models.computational.game_of_life.model import GameOfLife
+from simulab.models.computational.game_of_life.seeds import Seed
+from simulab.simulation.core.neighborhood import Moore
+
+WORD_SIZE = 64
+WORD = np.dtype("<u8")
+ONE = np.uint64(1)
+LAST_BIT = np.uint64(WORD_SIZE - 1)
+
+
+def pack(cells: np.ndarray) -> np.ndarray:
+    rows, columns = cells.shape
+    words = -(-columns // WORD_SIZE)
+    padded = np.zeros((rows, words * WORD_SIZE), dtype=np.uint8)
+    padded[:, :columns] = cells != 0
+    return np.packbits(padded, axis=1, bitorder="little").view(WORD)
+
+
+def unpack(words: np.ndarray, columns: int) -> np.ndarray:
+    bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder="little")
+    return bits[:, :columns]
+
+
+def _west_neighbors(words: np.ndarray, columns: int) -> np.ndarray:
+    # Bit j of the result holds the cell at column j - 1 (periodic).
+    last_word, last_bit = divmod(columns - 1, WORD_SIZE)
+    shifted = words << ONE
+    shifted[:, 1:] |= words[:, :-1] >> LAST_BIT
+    shifted[:, 0] |= (words[:, last_word] >> np.uint64(last_bit)) & ONE
+    shifted[:, last_word] &= np.uint64((1 << (last_bit + 1)) - 1)
+    return shifted
+
+
+def _east_neighbors(words: np.ndarray, columns: int) -> np.ndarray:
+    # Bit j of the result holds the cell at column j + 1 (periodic).
+    last_word, last_bit = divmod(columns - 1, WORD_SIZE)
+    shifted = words >> ONE
+    shifted[:, :-1] |= words[:, 1:] << LAST_BIT
+    shifted[:, last_word] |= (words[:, 0] & ONE) << np.uint64(last_bit)
+    return shifted
+
+
+def next_generation(words: np.ndarray, columns: int) -> np.ndarray:
+    north = np.roll(words, 1, axis=0)
+    south = np.roll(words, -1, axis=0)
+    neighbors: List[np.ndarray] = [north, south]
+    for row in (north, words, south):
+        neighbors.append(_west_neighbors(row, columns))
+        neighbors.append(_east_neighbors(row, columns))
+
+    # Bit-sliced counter: ones and twos hold the count bits, fours flags four or more.
+    ones = np.zeros_like(words)
+    twos = np.zeros_like(words)
+    fours = np.zeros_like(words)
+    for neighbor in neighbors:
+        carry = ones & neighbor
+        ones ^= neighbor
+        fours |= twos & carry
+        twos ^= carry
+    return twos & ~fours & (ones | words)
+
+
+class BitPackedGameOfLife(GameOfLife):
+    def __init__(self, seeds: List[Seed], *args, **kwargs):  # type: ignore[no-untyped-def]
+        kwargs.setdefault("neighborhood", Moore)
+        super(BitPackedGameOfLife, self).__init__(seeds, *args, **kwargs)
+        assert isinstance(
+            self.neighborhood, Moore
+        ), "The bit-packed engine only supports the Moore neighborhood (B3/S23 rule)."
+
+    def _configure_agents(self) -> None:
+        self._words = pack(np.array(self._initial_lattice().configuration))
+
+    def get_agent(self, i: int, j: int) -> Agent:
+        word = self._words[i, j // WORD_SIZE]
+        return Agent.of(int((word >> np.uint64(j % WORD_SIZE)) & ONE))
+
+    def run_step(self) -> None:
+        self._words = next_generation(self._words, self.length)
+
+    @as_series
+    def agent_types_lattice(self) -> List[List[int]]:
+        return unpack(self._words, self.length).tolist()
@@ -0,0 +1,234 @@
+from collections import OrderedDict
+from typing import List, Tuple
+
+import numpy as np
+
+from simulab.models.abstract.agent import Agent
+from simulab.models.abstract.model import as_series
+from simulab.models.computational.game_of_life.model import GameOfLife
+from simulab.models.computational.game_of_life.seeds import Seed
+from simulab.simulation.core.neighborhood import Moore
+
+
+class Node:
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(
+        self,
+        nw: "Node",
+        ne: "Node",
+        sw: "Node",
+        se: "Node",
+        level: int,
+        population: int,
+    ) -> None:
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+    def __repr__(self) -> str:
+        return f"Node(level={self.level}, population={self.population})"
+
+
+class HashLife:
+    def __init__(self, cache_size: int = 2**18) -> None:
+        assert cache_size > 0, "Cache size should be greater than 0"
+        self.cache_size = cache_size
+        # Leaves are the only nodes without children.
+        self.dead = Node(None, None, None, None, 0, 0)  # type: ignore[arg-type]
+        self.alive = Node(None, None, None, None, 0, 1)  # type: ignore[arg-type]
+        self._nodes: OrderedDict[Tuple[Node, Node, Node, Node], Node] = OrderedDict()
+        self._results: OrderedDict[Tuple[Node, int], Node] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._nodes) + len(self._results)
+
+    def join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        key = (nw, ne, sw, se)
+        try:
+            node = self._nodes[key]
+        except KeyError:
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw, ne, sw, se, nw.level + 1, population)
+            self._nodes[key] = node
+            if len(self._nodes) > self.cache_size:
+                # Evicted nodes stay valid, they only stop being canonical.
+                self._nodes.popitem(last=False)
+        else:
+            self._nodes.move_to_end(key)
+        return node
+
+    def empty(self, level: int) -> Node:
+        # Empty nodes are memoized by join, in the same bounded table as the others.
+        node = self.dead
+        for _ in range(level):
+            node = self.join(node, node, node, node)
+        return node
+
+    def from_array(self, cells: np.ndarray) -> Node:
+        size = len(cells)
+        if size == 1:
+            return self.alive if cells[0, 0] else self.dead
+        level = size.bit_length() - 1
+        if not cells.any():
+            return self.empty(level)
+        half = size // 2
+        return self.join(
+            self.from_array(cells[:half, :half]),
+            self.from_array(cells[:half, half:]),
+            self.from_array(cells[half:, :half]),
+            self.from_array(cells[half:, half:]),
+        )
+
+    def to_array(self, node: Node) -> np.ndarray:
+        cells = np.zeros((1 << node.level, 1 << node.level), dtype=np.int8)
+        self.__fill(cells, node, 0, 0)
+        return cells
+
+    def __fill(self, cells: np.ndarray, node: Node, i: int, j: int) -> None:
+        if node.population == 0:
+            return
+        if node.level == 0:
+            cells[i, j] = 1
+            return
+        half = 1 << (node.level - 1)
+        self.__fill(cells, node.nw, i, j)
+        self.__fill(cells, node.ne, i, j + half)
+        self.__fill(cells, node.sw, i + half, j)
+        self.__fill(cells, node.se, i + half, j + half)
+
+    def cell(self, node: Node, i: int, j: int) -> int:
+        while node.level > 0:
+            half = 1 << (node.level - 1)
+            if i < half:
+                node = node.nw if j < half else node.ne
+            else:
+                node = node.sw if j < half else node.se
+            i, j = i % half, j % half
+        return node.population
+
+    def __life_4x4(self, node: Node) -> Node:
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        grid = [
+            [nw.nw, nw.ne, ne.nw, ne.ne],
+            [nw.sw, nw.se, ne.sw, ne.se],
+            [sw.nw, sw.ne, se.nw, se.ne],
+            [sw.sw, sw.se, se.sw, se.se],
+        ]
+        cells = [[leaf.population for leaf in row] for row in grid]
+
+        def rule(i: int, j: int) -> Node:
+            amount = (
+                sum(cells[x][y] for x in range(i - 1, i + 2) for y in range(j - 1, j + 2))
+                - cells[i][j]
+            )
+            alive = amount == 3 or (amount == 2 and cells[i][j] == 1)
+            return self.alive if alive else self.dead
+
+        return self.join(rule(1, 1), rule(1, 2), rule(2, 1), rule(2, 2))
+
+    def successor(self, node: Node, j: int) -> Node:
+        # Center of `node` (one level below) after 2**j generations, with j <= level - 2.
+        if node.population == 0:
+            return self.empty(node.level - 1)
+        key = (node, j)
+        try:
+            result = self._results[key]
+        except KeyError:
+            pass
+        else:
+            self._results.move_to_end(key)
+            return result
+
+        if node.level == 2:
+            result = self.__life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join = self.join
+            # fmt: off
+            parts = [
+                nw, join(nw.ne, ne.nw, nw.se, ne.sw), ne,
+                join(nw.sw, nw.se, sw.nw, sw.ne),
+                join(nw.se, ne.sw, sw.ne, se.nw),
+                join(ne.sw, ne.se, se.nw, se.ne),
+                sw, join(sw.ne, se.nw, sw.se, se.sw), se,
+            ]
+            # fmt: on
+            if j == node.level - 2:
+                c = [self.successor(part, j - 1) for part in parts]
+                result = join(
+                    self.successor(join(c[0], c[1], c[3], c[4]), j - 1),
+                    self.successor(join(c[1], c[2], c[4], c[5]), j - 1),
+                    self.successor(join(c[3], c[4], c[6], c[7]), j - 1),
+                    self.successor(join(c[4], c[5], c[7], c[8]), j - 1),
+                )
+            else:
+                c = [self.successor(part, j) for part in parts]
+                result = join(
+                    join(c[0].se, c[1].sw, c[3].ne, c[4].nw),
+                    join(c[1].se, c[2].sw, c[4].ne, c[5].nw),
+                    join(c[3].se, c[4].sw, c[6].ne, c[7].nw),
+                    join(c[4].se, c[5].sw, c[7].ne, c[8].nw),
+                )
+
+        self._results[key] = result
+        if len(self._results) > self.cache_size:
+            self._results.popitem(last=False)
+        return result
+
+    def advance(self, torus: Node, generations: int) -> Node:
+        # A periodic board evolves as the infinite plane tiled with copies of itself,
+        # so any quadrant of the tiled universe aligned to the board is the new board.
+        while generations > 0:
+            j = generations.bit_length() - 1
+            universe = torus
+            while universe.level < max(torus.level, j) + 2:
+                universe = self.join(universe, universe, universe, universe)
+            result = self.successor(universe, j)
+            while result.level > torus.level:
+                result = result.nw
+            torus = result
+            generations -= 1 << j
+        return torus
+
+
+class HashLifeGameOfLife(GameOfLife):
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        seeds: List[Seed],
+        generations_per_step: int = 1,
+        cache_size: int = 2**18,
+        *args,
+        **kwargs,
+    ):
+        kwargs.setdefault("neighborhood", Moore)
+        super(HashLifeGameOfLife, self).__init__(seeds, *args, **kwargs)
+        assert isinstance(
+            self.neighborhood, Moore
+        ), "The HashLife engine only supports the Moore neighborhood (B3/S23 rule)."
+        assert (
+            self.length > 1 and self.length & (self.length - 1) == 0
+        ), "The HashLife engine needs a length that is a power of two."
+        assert generations_per_step > 0, "Generations per step should be greater than 0"
+        self.generations_per_step = generations_per_step
+        self.cache_size = cache_size
+
+    def _configure_agents(self) -> None:
+        self._engine = HashLife(self.cache_size)
+        cells = np.array(self._initial_lattice().configuration) != 0
+        self._root = self._engine.from_array(cells)
+        self.generation = 0
+
+    def get_agent(self, i: int, j: int) -> Agent:
+        return Agent.of(self._engine.cell(self._root, i, j))
+
+    def run_step(self) -> None:
+        self._root = self._engine.advance(self._root, self.generations_per_step)
+        self.generation += self.generations_per_step
+
+    @as_series
+    def agent_types_lattice(self) -> List[List[int]]:
+        return self._engine.to_array(self._root).tolist()
@@ -1,5 +1,8 @@
-from typing import List, cast
+from typing import List, Sequence, Tuple, cast
 
+import numpy as np
+
+from simulab.models.abstract.agent import Agent
 from simulab.models.abstract.model import AbstractLatticeModel, as_series
 from simulab.models.computational.game_of_life.seeds import Seed
 from simulab.simulation.core.lattice import Lattice
@@ -8,13 +11,13 @@ from simulab.simulation.core.lattice import Lattice
 class GameOfLife(AbstractLatticeModel):
     ALIVE = 1
     DEAD = 0
+    local_step = True
 
     def __init__(self, seeds: List[Seed], *args, **kwargs):  # type: ignore[no-untyped-def]
         length = kwargs.get("length")
-        configuration = kwargs.get("configuration", Lattice.zeros(cast(int, length)))
+        configuration = kwargs.pop("configuration", Lattice.zeros(cast(int, length)))
         self.seeds = seeds
-        for seed in self.seeds:
-            seed.apply_on(configuration)
+        Seed.apply_all(self.seeds, on=configuration)
 
         super(GameOfLife, self).__init__(
             *args,
@@ -40,7 +43,17 @@ class GameOfLife(AbstractLatticeModel):
                 new_state = self.ALIVE
             else:
                 new_state = self.DEAD
-        configuration.at(i, j).agent_type = new_state
+        configuration.set(i, j, _with=Agent.of(new_state))
+
+    def _step_batch(self, positions: Sequence[Tuple[int, int]], configuration: Lattice) -> None:
+        if not self._vectorized_batch(positions):
+            return super()._step_batch(positions, configuration)
+        alive = self._step_array("alive", lambda: self._agent_types() == self.ALIVE)
+        amounts = self._step_array("amounts", lambda: self.neighborhood.count(alive))
+        rows, cols = np.array(positions, dtype=int).reshape(-1, 2).T
+        new_states = (amounts[rows, cols] == 3) | (alive[rows, cols] & (amounts[rows, cols] == 2))
+        for i, j, new_state in zip(rows.tolist(), cols.tolist(), new_states.tolist()):
+            configuration.set(i, j, _with=Agent.of(self.ALIVE if new_state else self.DEAD))
 
     @as_series
     def agent_types_lattice(self) -> List[List[int]]:
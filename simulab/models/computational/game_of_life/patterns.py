@@ -0,0 +1,123 @@
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from simulab.models.computational.game_of_life.seeds import Seed, as_cells
+
+RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)")
+
+
+def _to_cells(rows: List[List[int]], height: int = 0, width: int = 0) -> np.ndarray:
+    while rows and not rows[-1]:
+        rows.pop()
+    height = max(height, len(rows))
+    width = max([width] + [len(row) for row in rows])
+    cells = np.zeros((height, width), dtype=np.int8)
+    for i, row in enumerate(rows):
+        cells[i, : len(row)] = row
+    return as_cells(cells)
+
+
+def parse_rle(text: str) -> np.ndarray:
+    height = width = 0
+    body = []
+    for line in (line.strip() for line in text.splitlines()):
+        if not line or line.startswith("#"):
+            continue
+        header = RLE_HEADER.match(line)
+        if header:
+            width, height = int(header.group(1)), int(header.group(2))
+        else:
+            body.append(line)
+
+    rows: List[List[int]] = []
+    row: List[int] = []
+    run = ""
+    for char in "".join(body):
+        if char.isdigit():
+            run += char
+            continue
+        amount = int(run) if run else 1
+        run = ""
+        if char == "!":
+            break
+        elif char == "$":
+            rows.append(row)
+            rows.extend([] for _ in range(amount - 1))
+            row = []
+        elif char in "b.":
+            row.extend([0] * amount)
+        elif char.isalpha():
+            # Multi-state rules use other letters, all of them are live cells here.
+            row.extend([1] * amount)
+    rows.append(row)
+    return _to_cells(rows, height, width)
+
+
+def parse_plaintext(text: str) -> np.ndarray:
+    rows = [
+        [1 if char in "O*" else 0 for char in line.rstrip()]
+        for line in text.splitlines()
+        if not line.startswith("!")
+    ]
+    while rows and not rows[0]:
+        rows.pop(0)
+    return _to_cells(rows)
+
+
+PARSERS: Dict[str, Callable[[str], np.ndarray]] = {
+    ".rle": parse_rle,
+    ".cells": parse_plaintext,
+    ".txt": parse_plaintext,
+}
+
+
+PATTERNS_CACHE_SIZE = 32
+
+
+def load_pattern(path: str | Path) -> np.ndarray:
+    _path = Path(path)
+    if _path.suffix.lower() not in PARSERS:
+        raise ValueError(f"Unknown pattern format '{_path.suffix}', use one of {list(PARSERS)}.")
+    # Keyed by the modification time too, so edited files are read again.
+    return _load_pattern(_path, _path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=PATTERNS_CACHE_SIZE)
+def _load_pattern(path: Path, mtime: int) -> np.ndarray:
+    return PARSERS[path.suffix.lower()](path.read_text())
+
+
+class Pattern(Seed):
+    def __init__(
+        self,
+        i: int,
+        j: int,
+        cells: np.ndarray | List[List[int]],
+        name: str | None = None,
+    ) -> None:
+        super(Pattern, self).__init__(i, j)
+        self.__pattern = cells if isinstance(cells, np.ndarray) else as_cells(cells)
+        self.name = name if name else type(self).__name__
+
+    @property
+    def pattern(self) -> np.ndarray:
+        return self.__pattern
+
+    @classmethod
+    def from_rle(cls, i: int, j: int, text: str, name: str | None = None) -> "Pattern":
+        return cls(i, j, parse_rle(text), name)
+
+    @classmethod
+    def from_plaintext(cls, i: int, j: int, text: str, name: str | None = None) -> "Pattern":
+        return cls(i, j, parse_plaintext(text), name)
+
+    @classmethod
+    def from_file(cls, i: int, j: int, path: str | Path) -> "Pattern":
+        return cls(i, j, load_pattern(path), Path(path).stem)
+
+    def __str__(self) -> str:
+        return f"{self.name}({self.i},{self.j})"
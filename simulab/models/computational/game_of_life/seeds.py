@@ -1,23 +1,40 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, List
 
 import numpy as np
 
 from simulab.simulation.core.lattice import Lattice
 
 
+def as_cells(cells: np.ndarray | List[List[int]]) -> np.ndarray:
+    array = np.array(cells, dtype=np.int8)
+    array.setflags(write=False)
+    return array
+
+
 class Seed(ABC):
     def __init__(self, i: int, j: int) -> None:
         self.i = i
         self.j = j
 
+    @property
+    @abstractmethod
+    def pattern(self) -> np.ndarray:
+        pass
+
     def apply_on(self, lattice: Lattice) -> None:
-        temp = np.array(lattice.configuration)
-        self._apply_on(temp)
-        lattice.update_with(temp)
+        self.apply_all([self], on=lattice)
+
+    @classmethod
+    def apply_all(cls, seeds: Iterable["Seed"], on: Lattice) -> None:
+        temp = np.array(on.configuration)
+        for seed in seeds:
+            seed._apply_on(temp)
+        on.update_with(temp)
 
-    @abstractmethod
     def _apply_on(self, configuration: np.ndarray) -> None:
-        pass
+        height, width = self.pattern.shape
+        configuration[self.i : self.i + height, self.j : self.j + width] = self.pattern
 
     def __str__(self) -> str:
         return f"{type(self).__name__}({self.i},{self.j})"
@@ -28,124 +45,96 @@ class Seed(ABC):
 
 # Still lifes
 class Block(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        block = np.array([[1, 1], [1, 1]])
-        configuration[self.i : self.i + 2, self.j : self.j + 2] = block
+    pattern = as_cells([[1, 1], [1, 1]])
 
 
 class BeeHive(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        bee_hive = np.array([[0, 1, 1, 0], [1, 0, 0, 1], [0, 1, 1, 0]])
-        configuration[self.i : self.i + 3, self.j : self.j + 4] = bee_hive
+    pattern = as_cells([[0, 1, 1, 0], [1, 0, 0, 1], [0, 1, 1, 0]])
 
 
 class Loaf(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        loaf = np.array([[0, 1, 1, 0], [1, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1, 0]])
-        configuration[self.i : self.i + 4, self.j : self.j + 4] = loaf
+    pattern = as_cells([[0, 1, 1, 0], [1, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1, 0]])
 
 
 class Boat(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        boat = np.array([[1, 1, 0], [1, 0, 1], [0, 1, 0]])
-        configuration[self.i : self.i + 3, self.j : self.j + 3] = boat
+    pattern = as_cells([[1, 1, 0], [1, 0, 1], [0, 1, 0]])
 
 
 class Tub(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        tub = np.array([[0, 1, 0], [1, 0, 1], [0, 1, 0]])
-        configuration[self.i : self.i + 3, self.j : self.j + 3] = tub
+    pattern = as_cells([[0, 1, 0], [1, 0, 1], [0, 1, 0]])
 
 
 # Oscilators
 class Blinker(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        blinker = np.array([[1, 1, 1]])
-        configuration[self.i : self.i + 3, self.j] = blinker
+    pattern = as_cells([[1], [1], [1]])
 
 
 class Toad(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        toad = np.array([[0, 1, 1, 1], [1, 1, 1, 0]])
-        configuration[self.i : self.i + 2, self.j : self.j + 4] = toad
+    pattern = as_cells([[0, 1, 1, 1], [1, 1, 1, 0]])
 
 
 class Beacon(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        beacon = np.array([[1, 1, 0, 0], [1, 1, 0, 0], [0, 0, 1, 1], [0, 0, 1, 1]])
-        configuration[self.i : self.i + 4, self.j : self.j + 4] = beacon
+    pattern = as_cells([[1, 1, 0, 0], [1, 1, 0, 0], [0, 0, 1, 1], [0, 0, 1, 1]])
 
 
 class Pulsar(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        pulsar = np.array(
-            [
-                [0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-                [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
-                [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
-                [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
-                [0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0],
-                [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
-                [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
-                [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
-                [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0],
-            ]
-        )
-        configuration[self.i : self.i + 13, self.j : self.j + 13] = pulsar
+    pattern = as_cells(
+        [
+            [0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
+            [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
+            [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
+            [0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0],
+            [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
+            [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
+            [1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0],
+        ]
+    )
 
 
 class Pentadecathlon(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        pentadecathlon = np.array(
-            [
-                [0, 0, 1, 0, 0, 0, 0, 1, 0, 0],
-                [1, 1, 0, 1, 1, 1, 1, 0, 1, 1],
-                [0, 0, 1, 0, 0, 0, 0, 1, 0, 0],
-            ]
-        )
-        configuration[self.i : self.i + 3, self.j : self.j + 10] = pentadecathlon
+    pattern = as_cells(
+        [
+            [0, 0, 1, 0, 0, 0, 0, 1, 0, 0],
+            [1, 1, 0, 1, 1, 1, 1, 0, 1, 1],
+            [0, 0, 1, 0, 0, 0, 0, 1, 0, 0],
+        ]
+    )
 
 
 # Spaceships
 class Glider(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        glider = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]])
-        configuration[self.i : self.i + 3, self.j : self.j + 3] = glider
+    pattern = as_cells([[0, 1, 0], [0, 0, 1], [1, 1, 1]])
 
 
 class LightWeightSpaceship(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        lwss = np.array([[0, 1, 0, 0, 1], [1, 0, 0, 0, 0], [1, 0, 0, 0, 1], [1, 1, 1, 1, 0]])
-        configuration[self.i : self.i + 4, self.j : self.j + 5] = lwss
+    pattern = as_cells([[0, 1, 0, 0, 1], [1, 0, 0, 0, 0], [1, 0, 0, 0, 1], [1, 1, 1, 1, 0]])
 
 
 class MiddleWeightSpaceship(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        mwss = np.array(
-            [
-                [0, 0, 0, 1, 0, 0],
-                [0, 1, 0, 0, 0, 1],
-                [1, 0, 0, 0, 0, 0],
-                [1, 0, 0, 0, 0, 1],
-                [1, 1, 1, 1, 1, 0],
-            ]
-        )
-        configuration[self.i : self.i + 5, self.j : self.j + 6] = mwss
+    pattern = as_cells(
+        [
+            [0, 0, 0, 1, 0, 0],
+            [0, 1, 0, 0, 0, 1],
+            [1, 0, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 1],
+            [1, 1, 1, 1, 1, 0],
+        ]
+    )
 
 
 class HeavyWeightSpaceship(Seed):
-    def _apply_on(self, configuration: np.ndarray) -> None:
-        hwss = np.array(
-            [
-                [0, 0, 0, 1, 1, 0, 0],
-                [0, 1, 0, 0, 0, 0, 1],
-                [1, 0, 0, 0, 0, 0, 0],
-                [1, 0, 0, 0, 0, 0, 1],
-                [1, 1, 1, 1, 1, 1, 0],
-            ]
-        )
-        configuration[self.i : self.i + 5, self.j : self.j + 7] = hwss
+    pattern = as_cells(
+        [
+            [0, 0, 0, 1, 1, 0, 0],
+            [0, 1, 0, 0, 0, 0, 1],
+            [1, 0, 0, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 1],
+            [1, 1, 1, 1, 1, 1, 0],
+        ]
+    )
@@ -6,6 +6,18 @@ from simulab.simulation.core.lattice import Lattice
 
 
 class Transfer:
+    __slots__ = (
+        "payer",
+        "price_to_pay",
+        "seller",
+        "price_to_charge",
+        "average",
+        "is_convenient",
+        "new_capital",
+        "new_utility",
+        "__original_seller_position",
+    )
+
     def __init__(
         self,
         payer: "RealStateAgent",
@@ -40,6 +52,8 @@ class Transfer:
 
 
 class Transaction:
+    __slots__ = ("agent_A", "agent_B", "payment_A", "payment_B", "average")
+
     def __init__(
         self,
         between: "RealStateAgent",
@@ -78,6 +92,8 @@ class Transaction:
 
 
 class RealStateAgent(Agent):
+    __slots__ = ("position", "utility", "capital")
+
     def __init__(
         self,
         agent_type: int,
@@ -0,0 +1,102 @@
+from typing import TYPE_CHECKING, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from simulab.models.computational.real_state_market.model import RealStateMarket
+
+
+class TransactionBatch:
+    def __init__(self, model: "RealStateMarket") -> None:
+        self.model = model
+        self.neighbors = model.neighborhood.neighbor_indexes()
+        self.agents = [agent for row in model.configuration.configuration for agent in row]
+        self.agent_types = np.array([agent.agent_type for agent in self.agents])
+        self.capitals = np.array([agent.capital for agent in self.agents], dtype=float)
+        self.utilities = np.array([agent.utility for agent in self.agents], dtype=float)
+
+    def random_candidates(self, amount: int) -> np.ndarray:
+        return np.random.randint(0, self.model.length, size=(amount, 2, 2))
+
+    def run(self, candidates: np.ndarray) -> None:
+        # Candidates are (position_1, position_2) pairs, processed in rounds of transactions
+        # that do not interact, so the result is the same as trading them in order.
+        length = self.model.length
+        payers = candidates[:, 0, 0] * length + candidates[:, 0, 1]
+        sellers = candidates[:, 1, 0] * length + candidates[:, 1, 1]
+        while len(payers) > 0:
+            accepted = self.__conflict_free(payers, sellers)
+            self.__trade(payers[accepted], sellers[accepted])
+            payers, sellers = payers[~accepted], sellers[~accepted]
+
+    def __conflict_free(self, payers: np.ndarray, sellers: np.ndarray) -> np.ndarray:
+        # A transaction writes both positions and reads their neighborhoods. It is accepted
+        # if no previous candidate writes what it reads or reads what it writes.
+        amount = len(payers)
+        order = np.arange(amount)
+        writes = np.stack([payers, sellers], axis=1)
+        reads = np.concatenate([writes, self.neighbors[payers], self.neighbors[sellers]], axis=1)
+
+        cells = len(self.agents)
+        first_writer = np.full(cells, amount)
+        np.minimum.at(first_writer, writes.ravel(), np.repeat(order, writes.shape[1]))
+        first_reader = np.full(cells, amount)
+        np.minimum.at(first_reader, reads.ravel(), np.repeat(order, reads.shape[1]))
+
+        reads_allowed = (first_writer[reads] >= order[:, None]).all(axis=1)
+        writes_allowed = (first_reader[writes] >= order[:, None]).all(axis=1)
+        return reads_allowed & writes_allowed
+
+    def __target_prices(self, buyers: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        buyer_types = self.agent_types[buyers]
+        similar = self.agent_types[self.neighbors[targets]] == buyer_types[:, None]
+        return self.model.property_prices(similar.sum(axis=1) + 1)
+
+    def __offer(
+        self,
+        agents: np.ndarray,
+        to_pay: np.ndarray,
+        to_charge: np.ndarray,
+        average: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        new_capitals = self.capitals[agents] + to_charge - average
+        return new_capitals, self.model.utilities(new_capitals, to_pay)
+
+    def __trade(self, payers: np.ndarray, sellers: np.ndarray) -> None:
+        payment_payers = self.__target_prices(payers, sellers)
+        payment_sellers = self.__target_prices(sellers, payers)
+        average = (payment_payers + payment_sellers) / 2
+        capital_payers, utility_payers = self.__offer(
+            payers, payment_payers, payment_sellers, average
+        )
+        capital_sellers, utility_sellers = self.__offer(
+            sellers, payment_sellers, payment_payers, average
+        )
+        with np.errstate(invalid="ignore"):
+            done = (
+                (payment_payers - average < self.capitals[payers])
+                & (payment_sellers - average < self.capitals[sellers])
+                & (utility_payers > self.utilities[payers])
+                & (utility_sellers > self.utilities[sellers])
+            )
+
+        payers, sellers = payers[done], sellers[done]
+        payer_types, seller_types = self.agent_types[payers], self.agent_types[sellers]
+        self.agent_types[sellers], self.agent_types[payers] = payer_types, seller_types
+        self.capitals[sellers], self.capitals[payers] = capital_payers[done], capital_sellers[done]
+        self.utilities[sellers], self.utilities[payers] = (
+            utility_payers[done],
+            utility_sellers[done],
+        )
+
+        length = self.model.length
+        configuration = self.model.configuration
+        for payer, seller in zip(payers.tolist(), sellers.tolist()):
+            payer_agent, seller_agent = self.agents[payer], self.agents[seller]
+            for agent, position in ((payer_agent, seller), (seller_agent, payer)):
+                agent.capital = float(self.capitals[position])
+                agent.utility = float(self.utilities[position])
+                i, j = divmod(position, length)
+                agent.position = (i, j)
+                configuration.set(i, j, _with=agent)
+                self.agents[position] = agent
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class UtilityFormula:
     def __init__(self, alpha: float) -> None:
         self.alpha = alpha
@@ -5,6 +8,9 @@ class UtilityFormula:
     def apply(self, capital: float, price: float) -> float:
         return (capital ** (self.alpha)) * (price ** (1 - self.alpha))
 
+    def apply_all(self, capitals: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        return np.power(capitals, self.alpha) * np.power(prices, 1 - self.alpha)
+
 
 class PriceFormula:
     def __init__(self, A: float, B: float, neighborhood_size: int) -> None:
@@ -15,3 +21,10 @@ class PriceFormula:
     def apply(self, similar_neighbors_amount: int) -> float:
         distinct_amount = self.neighborhood_size - similar_neighbors_amount + 1
         return self.A * (similar_neighbors_amount - distinct_amount) + self.B
+
+    def apply_all(self, similar_neighbors_amounts: np.ndarray) -> np.ndarray:
+        return self.apply(similar_neighbors_amounts)  # type: ignore[arg-type, return-value]
+
+    def table(self) -> np.ndarray:
+        # Prices for every possible amount of similar agents, counting the agent itself.
+        return self.apply_all(np.arange(self.neighborhood_size + 2))
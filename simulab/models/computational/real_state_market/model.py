@@ -1,9 +1,12 @@
 from typing import List, Tuple
 from typing import cast as typing_cast
 
+import numpy as np
+
 from simulab.models.abstract.agent import Agent
 from simulab.models.abstract.model import AbstractLatticeModel, as_series, as_series_with
 from simulab.models.computational.real_state_market.agent import RealStateAgent
+from simulab.models.computational.real_state_market.batch import TransactionBatch
 from simulab.models.computational.real_state_market.formulas import PriceFormula, UtilityFormula
 from simulab.simulation.core.lattice import Lattice
 
@@ -15,37 +18,74 @@ class RealStateMarket(AbstractLatticeModel):
         A: float = 1 / 16,
         B: float = 0.5,
         utility_tolerance: float = 0.85,
+        batched_transactions: bool = False,
         *args,
         **kwargs,
     ):
         super(RealStateMarket, self).__init__(*args, **kwargs)
+        assert not (
+            batched_transactions and self.update_simultaneously
+        ), "Batched transactions are only available for sequential updates."
         self.alpha = alpha
         self.A = A
         self.B = B
         self.utility_tolerance = utility_tolerance
+        self.batched_transactions = batched_transactions
         self.__utility_formula = UtilityFormula(self.alpha)
         self.__price_formula = PriceFormula(self.A, self.B, self.neighborhood.size())
+        self.__price_table = self.__price_formula.table()
+
+    INITIAL_CAPITAL = 1.0
+
+    def _prepare_agents(self) -> None:
+        capitals = np.full((self.length, self.length), self.INITIAL_CAPITAL)
+        self.__initial_utilities = self.utility_lattice(capitals)
 
     def _create_agent(self, basic_agent: Agent, i: int, j: int) -> RealStateAgent:
-        similar_amount = self.similar_neighbors_amount(i, j, count_myself=True)
-        initial_capital = 1.0
-        property_price = self.property_price(similar_amount)
         return RealStateAgent(
             agent_type=basic_agent.agent_type,
             position=(i, j),
-            capital=initial_capital,
-            utility=self.utility(initial_capital, property_price),
+            capital=self.INITIAL_CAPITAL,
+            utility=float(self.__initial_utilities[i, j]),
         )
 
     def get_real_state_agent(self, i: int, j: int) -> RealStateAgent:
         return typing_cast(RealStateAgent, self.get_agent(i, j))
 
     def property_price(self, similar_amount: int) -> float:
-        return self.__price_formula.apply(similar_amount)
+        return float(self.__price_table[similar_amount])
+
+    def property_prices(self, similar_amounts: np.ndarray) -> np.ndarray:
+        return self.__price_table[similar_amounts]
+
+    def agent_types_array(self) -> np.ndarray:
+        return np.array(
+            [[agent.agent_type for agent in row] for row in self.configuration.configuration]
+        )
+
+    def capitals_array(self) -> np.ndarray:
+        return np.array(
+            [[agent.capital for agent in row] for row in self.configuration.configuration]
+        )
+
+    def utility_lattice(self, capitals: np.ndarray) -> np.ndarray:
+        # Utility of every agent for its current property, as a few array operations.
+        similar_amounts = self.neighborhood.similar_count(self.agent_types_array()) + 1
+        return self.utilities(capitals, self.property_prices(similar_amounts))
 
     def utility(self, capital: float, price: float) -> float:
         return self.__utility_formula.apply(capital, price)
 
+    def utilities(self, capitals: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        return self.__utility_formula.apply_all(capitals, prices)
+
+    def run_step(self) -> None:
+        if self.batched_transactions:
+            batch = TransactionBatch(self)
+            batch.run(batch.random_candidates(self.length**2))
+        else:
+            super(RealStateMarket, self).run_step()
+
     def step(
         self,
         i: int,
@@ -78,7 +118,8 @@ class RealStateMarket(AbstractLatticeModel):
 
     @as_series
     def updated_utility_level_lattice(self, flatten: bool = False) -> List[List[float]]:
-        return self._process_lattice_with(self.updated_utility_of, flatten=flatten)
+        utilities = self.utility_lattice(self.capitals_array())
+        return (utilities.ravel() if flatten else utilities).tolist()
 
     @as_series
     def capital_level_lattice(self, flatten: bool = False) -> List[List[float]]:
@@ -0,0 +1,186 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from simulab.models.abstract.agent import Agent
+from simulab.models.abstract.model import as_series, as_series_with
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.lattice import Lattice
+from simulab.simulation.core.pool import IndexedPool
+
+Position = Tuple[int, int]
+
+
+class VacancySchelling(Schelling):
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        tolerance: int,
+        density: float = 0.9,
+        nearest_vacancy: bool = False,
+        *args,
+        **kwargs,
+    ):
+        self.__random_configuration = kwargs.get("configuration") is None
+        super(VacancySchelling, self).__init__(tolerance, *args, **kwargs)
+        assert 0 < density < 1, "Density should be in range (0, 1)."
+        assert not self.update_simultaneously, "Agents relocate one by one."
+        self.density = density
+        self.nearest_vacancy = nearest_vacancy
+        self.__rings: Dict[int, List[Position]] = {}
+
+    @property
+    def EMPTY(self) -> int:
+        return self.agent_types
+
+    def _initial_lattice(self) -> Lattice:
+        if self.__random_configuration:
+            return Lattice.with_vacancies(self.agent_types, self.density, self.length)
+        return super(VacancySchelling, self)._initial_lattice()
+
+    def _configure_agents(self) -> None:
+        super(VacancySchelling, self)._configure_agents()
+        self.__types = np.array(self.configuration.process_with(self.__agent_type_at))
+        self.__counts = np.stack(
+            [self.neighborhood.count(self.__types == _type) for _type in range(self.agent_types)]
+        )
+        self.__vacancies: IndexedPool[Position] = IndexedPool(
+            (int(i), int(j)) for i, j in zip(*np.nonzero(self.__types == self.EMPTY))
+        )
+        # Vacancies where an agent of each type would be satisfied.
+        self.__acceptable: List[IndexedPool[Position]] = [
+            IndexedPool(
+                position for position in self.__vacancies if self.__accepts(_type, position)
+            )
+            for _type in range(self.agent_types)
+        ]
+
+    def __agent_type_at(self, i: int, j: int) -> int:
+        return int(self.get_agent(i, j).agent_type)
+
+    def __accepts(self, agent_type: int, position: Position) -> bool:
+        return bool(self.__counts[agent_type][position] >= self.tolerance)
+
+    def similar_neighbors_amount(
+        self,
+        i: int,
+        j: int,
+        agent_type: int | None = None,
+        count_myself: bool = False,
+    ) -> int:
+        _agent_type = agent_type if agent_type is not None else self.get_agent(i, j).agent_type
+        if _agent_type == self.EMPTY:
+            return super(VacancySchelling, self).similar_neighbors_amount(
+                i, j, agent_type=_agent_type, count_myself=count_myself
+            )
+        total = int(self.__counts[_agent_type, i, j])
+        return total + 1 if count_myself else total
+
+    def step(
+        self,
+        i: int,
+        j: int,
+        configuration: Lattice,
+    ) -> None:
+        agent = self.get_agent(i, j)
+        if agent.agent_type == self.EMPTY or self.similar_neighbors_amount(i, j) >= self.tolerance:
+            return
+        destination = self.__destination_for(agent.agent_type, (i, j))
+        if destination is not None:
+            self.__move(agent, (i, j), destination, configuration)
+
+    def __destination_for(self, agent_type: int, origin: Position) -> Position | None:
+        acceptable = self.__acceptable[agent_type]
+        if len(acceptable) == 0:
+            return None
+        leaving = set(self.neighborhood.indexes_for(*origin))
+
+        def still_acceptable(position: Position) -> bool:
+            # Vacancies next to the origin lose the neighbor that is moving.
+            similar = self.__counts[agent_type][position] - (position in leaving)
+            return bool(similar >= self.tolerance)
+
+        if not self.nearest_vacancy:
+            candidate = acceptable.sample()
+            return candidate if still_acceptable(candidate) else None
+
+        for distance in range(1, self.length // 2 + 1):
+            candidates = [
+                position
+                for di, dj in self.__ring_at(distance)
+                if (position := ((origin[0] + di) % self.length, (origin[1] + dj) % self.length))
+                in acceptable
+                and still_acceptable(position)
+            ]
+            if candidates:
+                return candidates[np.random.randint(len(candidates))]
+        return None
+
+    def __ring_at(self, distance: int) -> List[Position]:
+        try:
+            return self.__rings[distance]
+        except KeyError:
+            ring = [
+                (di, dj)
+                for di in range(-distance, distance + 1)
+                for dj in range(-distance, distance + 1)
+                if max(abs(di), abs(dj)) == distance
+            ]
+            self.__rings[distance] = ring
+            return ring
+
+    def __move(
+        self,
+        agent: Agent,
+        origin: Position,
+        destination: Position,
+        configuration: Lattice,
+    ) -> None:
+        agent_type = agent.agent_type
+        configuration.set(*destination, _with=agent)
+        configuration.set(*origin, _with=Agent.of(self.EMPTY))
+        self.__types[destination], self.__types[origin] = agent_type, self.EMPTY
+
+        self.__vacancies.remove(destination)
+        self.__vacancies.add(origin)
+        for acceptable in self.__acceptable:
+            acceptable.discard(destination)
+
+        for position, delta in [(origin, -1), (destination, 1)]:
+            for neighbor in self.neighborhood.indexes_for(*position):
+                self.__counts[agent_type][neighbor] += delta
+                if neighbor in self.__vacancies:
+                    self.__update_acceptable(agent_type, neighbor)
+        for _type in range(self.agent_types):
+            self.__update_acceptable(_type, origin)
+
+    def __update_acceptable(self, agent_type: int, position: Position) -> None:
+        if self.__accepts(agent_type, position):
+            self.__acceptable[agent_type].add(position)
+        else:
+            self.__acceptable[agent_type].discard(position)
+
+    def __satisfaction(self) -> np.ndarray:
+        occupied = self.__types != self.EMPTY
+        types = np.where(occupied, self.__types, 0)
+        similar = np.take_along_axis(self.__counts, types[None], axis=0)[0]
+        return np.where(occupied, similar, 0)
+
+    @as_series
+    def satisfaction_level_lattice(self, flatten: bool = False) -> List[List[int]]:
+        satisfaction = self.__satisfaction()
+        return satisfaction.ravel().tolist() if flatten else satisfaction.tolist()
+
+    @as_series_with(metadata={"states": ["satisfied", "dissatisfied", "vacant"]})
+    def dissatisfaction_threshold_lattice(self) -> List[List[int]]:
+        dissatisfied = self.__satisfaction() < self.tolerance
+        result = self.__types + np.where(dissatisfied, self.agent_types, 0)
+        return np.where(self.__types == self.EMPTY, 2 * self.agent_types, result).tolist()
+
+    @as_series
+    def total_average_satisfaction_level(self) -> float:
+        occupied = self.length**2 - len(self.__vacancies)
+        return float(self.__satisfaction().sum()) / occupied
+
+    @as_series
+    def vacancy_rate(self) -> float:
+        return len(self.__vacancies) / self.length**2
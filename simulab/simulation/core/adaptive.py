@@ -0,0 +1,149 @@
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Dict, List, Sequence, Type
+
+import numpy as np
+
+from simulab.models.abstract.model import AbstractLatticeModel
+from simulab.simulation.core.equilibrium_criterion import AbstractCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.runner import Execute, Runner
+
+
+class SweepPoint:
+    # A value of the swept parameter, with the metric of each repetition run with it.
+    __slots__ = ("value", "metrics", "mean", "std")
+
+    def __init__(self, value: Any, metrics: Sequence[float]) -> None:
+        self.value = value
+        self.metrics = list(metrics)
+        self.mean = float(np.mean(self.metrics))
+        self.std = float(np.std(self.metrics))
+
+    def __repr__(self) -> str:
+        return f"SweepPoint({self.value}, mean={self.mean:.4g}, std={self.std:.4g})"
+
+
+def _run_point(
+    model: Type[AbstractLatticeModel],
+    parameters: Dict[str, Any],
+    criterion: AbstractCriterion,
+    max_steps: int,
+    repeat: Execute,
+) -> AbstractLatticeModel:
+    # A module function, so that process pools can run it.
+    runner = Runner(
+        model,
+        ExperimentParametersSet(**{name: [value] for name, value in parameters.items()}),
+        criterion,
+        max_steps=max_steps,
+        repeat=repeat,
+    )
+    runner.start()
+    return runner.experiments[0]
+
+
+class AdaptiveSweep:
+    # Sweeps the only parameter that varies in the set, starting with its values and then
+    # adding, between the neighboring values whose metric differs the most (in mean, plus
+    # the standard deviation of their repetitions), their midpoint. Runs stop after budget
+    # values, or when no interval scores over tolerance or is wider than min_width. The
+    # metric is the final value of the series, unless other function of it is given.
+    def __init__(
+        self,
+        model: Type[AbstractLatticeModel],
+        experiment_parameters_set: ExperimentParametersSet,
+        equilibrium_criterion: AbstractCriterion,
+        series_name: str,
+        max_steps: int = 150,
+        repetitions: int = 1,
+        budget: int = 32,
+        tolerance: float = 0.0,
+        min_width: float = 0.0,
+        batch: int = 4,
+        metric: Callable[[Sequence[Any]], float] | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        parameters_to_vary = experiment_parameters_set.parameters_to_vary
+        assert len(parameters_to_vary) == 1, "Adaptive sweeps refine only one parameter."
+        assert repetitions > 0, "There should be at least one repetition."
+        assert batch > 0, "At least one value should be added on each round."
+        self.parameter = parameters_to_vary[0]
+        values = sorted(set(experiment_parameters_set[self.parameter]))
+        assert all(
+            isinstance(value, (int, float)) for value in values
+        ), "Adaptive sweeps refine numerical parameters."
+        assert budget >= len(values), "The budget should include the initial values."
+        self.initial_values = values
+        self.integer = all(isinstance(value, int) for value in values)
+        self.fixed = {
+            name: fixed_values[0]
+            for name, fixed_values in experiment_parameters_set._raw.items()
+            if name != self.parameter
+        }
+        self.model = model
+        self.equilibrium_criterion = equilibrium_criterion
+        self.series_name = series_name
+        self.max_steps = max_steps
+        self.repeat = Execute(series_name, times=repetitions)  # type: ignore[arg-type]
+        self.budget = budget
+        self.tolerance = tolerance
+        self.min_width = min_width
+        self.batch = batch
+        self.metric = metric if metric else (lambda series: float(series[-1]))
+        self.executor = executor
+        self.points: List[SweepPoint] = []
+        self.experiments: List[AbstractLatticeModel] = []
+        self.experiment_parameters_set = experiment_parameters_set
+
+    def start(self) -> None:
+        self.run(self.initial_values)
+        while len(self.points) < self.budget:
+            values = self.refinements()
+            if not values:
+                break
+            self.run(values[: self.budget - len(self.points)])
+
+    def run(self, values: Sequence[Any]) -> None:
+        run = partial(
+            _run_point,
+            self.model,
+            criterion=self.equilibrium_criterion,
+            max_steps=self.max_steps,
+            repeat=self.repeat,
+        )
+        parameters = [{**self.fixed, self.parameter: value} for value in values]
+        mapper = self.executor.map if self.executor else map
+        for value, experiment in zip(values, mapper(run, parameters)):
+            history = experiment.series_history[self.series_name]
+            point = SweepPoint(value, [self.metric(series) for series in history])
+            index = sum(each.value < value for each in self.points)
+            self.points.insert(index, point)
+            self.experiments.insert(index, experiment)
+        # Plotters name the experiments by the values of the parameters that vary.
+        self.experiment_parameters_set = ExperimentParametersSet(
+            **{name: [value] for name, value in self.fixed.items()},
+            **{self.parameter: [point.value for point in self.points]},
+        )
+
+    def score(self, left: SweepPoint, right: SweepPoint) -> float:
+        return abs(right.mean - left.mean) + (left.std + right.std) / 2
+
+    def refinements(self) -> List[Any]:
+        # Midpoints of the batch intervals with the highest scores, which are run in
+        # parallel when there is an executor.
+        candidates = []
+        for left, right in zip(self.points, self.points[1:]):
+            if right.value - left.value <= self.min_width:
+                continue
+            total = left.value + right.value
+            middle = total // 2 if self.integer else total / 2
+            score = self.score(left, right)
+            if left.value < middle < right.value and score > self.tolerance:
+                candidates.append((score, middle))
+        candidates.sort(key=lambda candidate: -candidate[0])
+        return [middle for _, middle in candidates[: self.batch]]
+
+    @property
+    def values(self) -> List[Any]:
+        return [point.value for point in self.points]
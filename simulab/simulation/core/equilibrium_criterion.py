@@ -9,11 +9,19 @@ class AbstractCriterion(ABC):
     def in_equilibrium(self, series: Dict[str, Any]) -> bool:
         pass
 
+    def required_series(self) -> Dict[str, int | None] | None:
+        # Series names and how many of their last values are needed to decide (None for
+        # all of them). Streaming runs keep only those, or every series if it returns None.
+        return None
+
 
 class WithoutCriterion(AbstractCriterion):
     def in_equilibrium(self, series: Dict[str, Any]) -> bool:
         return False
 
+    def required_series(self) -> Dict[str, int | None] | None:
+        return {}
+
 
 class EquilibriumCriterion(AbstractCriterion):
     def __init__(
@@ -26,6 +34,9 @@ class EquilibriumCriterion(AbstractCriterion):
         self.window_size: int = window_size
         self.tolerance: float = tolerance
 
+    def required_series(self) -> Dict[str, int | None] | None:
+        return {self.series_name: self.window_size + 1}
+
     def in_equilibrium(self, series: Dict[str, Any]) -> bool:
         try:
             _series = series[self.series_name]
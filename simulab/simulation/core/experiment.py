@@ -1,5 +1,8 @@
+import math
 from itertools import product as cartesian_product
-from typing import Any
+from typing import Any, Dict, List
+
+from simulab.simulation.core.sampling import unit_samples
 
 
 class ExperimentParameters(dict):  # type: ignore[type-arg]
@@ -47,3 +50,90 @@ class ExperimentParametersSet:
         else:
             self.__index = 0
             raise StopIteration
+
+
+class Interval:
+    # Range of values of a sampled parameter, from low to high (both included for integers),
+    # uniformly or in logarithmic scale.
+    def __init__(self, low: float, high: float, integer: bool = False, log: bool = False) -> None:
+        assert low <= high, "Interval low value should not be greater than the high one."
+        assert not log or low > 0, "Logarithmic intervals should be positive."
+        self.low = low
+        self.high = high
+        self.integer = integer
+        self.log = log
+
+    def __repr__(self) -> str:
+        return f"Interval({self.low}, {self.high}, integer={self.integer}, log={self.log})"
+
+    def value(self, unit: float) -> Any:
+        # The value at the given position in [0, 1) of the interval.
+        low, high = self.low, self.high + 1 if self.integer else self.high
+        if self.log:
+            value = math.exp(math.log(low) + unit * (math.log(high) - math.log(low)))
+        else:
+            value = low + unit * (high - low)
+        return min(int(math.floor(value)), int(self.high)) if self.integer else value
+
+
+class SampledParametersSet(ExperimentParametersSet):
+    # A space-filling design of samples experiments instead of a cartesian product: each
+    # parameter is an Interval, or a list of values to choose from (fixed if it has only
+    # one). Points are the same for the same seed, and each ExperimentParameters is built
+    # when it is iterated.
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        samples: int,
+        design: str = "sobol",
+        seed: int | None = 0,
+        **kwargs,
+    ):
+        assert all(
+            (isinstance(values, (list, Interval)) for values in kwargs.values())
+        ), "Sampled parameters should be passed using lists or intervals."
+        assert all(
+            (len(values) > 0 for values in kwargs.values() if isinstance(values, list))
+        ), "Sampled parameters lists should not be empty."
+
+        self.parameters_to_vary = [
+            name
+            for name, values in kwargs.items()
+            if isinstance(values, Interval) or len(values) > 1
+        ]
+        self.design = design
+        self.seed = seed
+        self.units = unit_samples(design, samples, len(self.parameters_to_vary), seed)
+        self._raw = dict(**kwargs)
+        self.__total = samples
+        self.__index = 0
+
+    def __len__(self) -> int:
+        return self.__total
+
+    def __getitem__(self, parameter_name: str) -> Any:
+        # The values of the parameter in every sample.
+        return [parameters[parameter_name] for parameters in self.samples()]
+
+    def __next__(self) -> ExperimentParameters:
+        if self.__index < self.__total:
+            current = self.sample(self.__index)
+            self.__index += 1
+            return current
+        else:
+            self.__index = 0
+            raise StopIteration
+
+    def sample(self, index: int) -> ExperimentParameters:
+        units = dict(zip(self.parameters_to_vary, self.units[index]))
+        parameters: Dict[str, Any] = {}
+        for name, values in self._raw.items():
+            if isinstance(values, Interval):
+                parameters[name] = values.value(float(units[name]))
+            elif name in units:
+                parameters[name] = values[min(int(units[name] * len(values)), len(values) - 1)]
+            else:
+                parameters[name] = values[0]
+        return ExperimentParameters(**parameters)
+
+    def samples(self) -> List[ExperimentParameters]:
+        return [self.sample(index) for index in range(self.__total)]
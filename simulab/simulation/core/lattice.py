@@ -1,4 +1,5 @@
-from typing import Any, Callable, List
+from copy import copy
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
 
 import numpy as np
 
@@ -15,6 +16,7 @@ class Lattice:
         self.configuration = (
             configuration.tolist() if isinstance(configuration, np.ndarray) else configuration
         )
+        self.__by_type: Dict[Any, Set[Tuple[int, int]]] | None = None
 
     def __repr__(self) -> str:
         representation = str(self.configuration[0])
@@ -46,12 +48,46 @@ class Lattice:
         np.random.shuffle(result)
         return cls(result.reshape((length, length)))
 
+    @classmethod
+    def with_vacancies(cls, agent_types: int, density: float, length: int) -> "Lattice":
+        # Cells are occupied by random agent types with the given density, the rest
+        # are vacant and hold the next type (agent_types).
+        occupied = int(length * length * density)
+        result = np.full(length * length, agent_types)
+        result[:occupied] = np.random.randint(agent_types, size=occupied)
+        np.random.shuffle(result)
+        return cls(result.reshape((length, length)))
+
     def at(self, i: int, j: int) -> Any:
         return self.configuration[i][j]
 
     def set(self, i: int, j: int, _with: Any) -> None:
+        if self.__by_type is not None:
+            self.__by_type[_type_of(self.configuration[i][j])].discard((i, j))
+            self.__by_type.setdefault(_type_of(_with), set()).add((i, j))
         self.configuration[i][j] = _with
 
+    def by_type(self) -> Dict[Any, Set[Tuple[int, int]]]:
+        # Positions of each agent type. Built on the first call and then kept up to date by
+        # set, so agents should be replaced (not modified) to change the type of a cell.
+        if self.__by_type is None:
+            by_type: Dict[Any, Set[Tuple[int, int]]] = {}
+            for i, row in enumerate(self.configuration):
+                for j, cell in enumerate(row):
+                    by_type.setdefault(_type_of(cell), set()).add((i, j))
+            self.__by_type = by_type
+        return self.__by_type
+
+    def copy_at(self, positions: Iterable[Tuple[int, int]]) -> "Lattice":
+        # Copies the rows and only the cells at the given positions, the rest are shared.
+        lattice = copy(self)
+        lattice.configuration = [list(row) for row in self.configuration]
+        if self.__by_type is not None:
+            lattice.__by_type = {_type: set(cells) for _type, cells in self.__by_type.items()}
+        for i, j in positions:
+            lattice.set(i, j, copy(self.at(i, j)))
+        return lattice
+
     def process_with(
         self,
         action: Callable[[int, int], Any],
@@ -66,3 +102,7 @@ class Lattice:
         else:
             result = [[action(i, j) for j in range(self.length)] for i in range(self.length)]
             return sum(result, []) if flatten else result
+
+
+def _type_of(cell: Any) -> Any:
+    return getattr(cell, "agent_type", cell)
@@ -0,0 +1,36 @@
+import importlib
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    # Stands for a module that is only imported on its first attribute access, so heavy
+    # or optional dependencies cost nothing to processes that never use them.
+    def __init__(self, name: str, extra: str | None = None) -> None:
+        super(LazyModule, self).__init__(name)
+        self.__extra = extra
+        self.__module: ModuleType | None = None
+
+    def load(self) -> ModuleType:
+        if self.__module is None:
+            try:
+                self.__module = importlib.import_module(self.__name__)
+            except ImportError as error:
+                if self.__extra is None:
+                    raise
+                raise ImportError(
+                    f"{self.__name__} is needed by this feature. "
+                    f"Install it with: pip install simulab[{self.__extra}]"
+                ) from error
+        return self.__module
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        status = "loaded" if self.__module is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({status})>"
+
+
+def lazy_import(name: str, extra: str | None = None) -> Any:
+    return LazyModule(name, extra)
@@ -0,0 +1,379 @@
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import deque
+from itertools import count
+from typing import (
+    IO,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    get_args,
+    get_origin,
+    get_type_hints,
+    overload,
+)
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from simulab.models.abstract.model import AbstractLatticeModel
+from simulab.simulation.core.equilibrium_criterion import AbstractCriterion
+from simulab.simulation.core.profiling import Hook
+
+POLICIES = ("refuse", "spill", "decimate")
+
+_POINTER = 8
+_LIST = sys.getsizeof([])
+_TUPLE = sys.getsizeof(())
+_OBJECT = 64
+
+
+def sizeof(value: Any) -> int:
+    # Bytes held by a series value, without the small ints and booleans shared by Python.
+    if isinstance(value, (list, tuple, deque)):
+        return sys.getsizeof(value) + sum(sizeof(item) for item in value)
+    elif isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    elif value is None or isinstance(value, bool):
+        return 0
+    elif isinstance(value, int) and -5 <= value <= 256:
+        return 0
+    elif isinstance(value, np.ndarray):
+        return sys.getsizeof(value) + (value.nbytes if value.base is not None else 0)
+    return sys.getsizeof(value)
+
+
+def annotation_bytes(annotation: Any, length: int, nested: bool = False) -> int:
+    # Bytes of a value of the annotated type, assuming every list has one item per row
+    # (or column) of the lattice.
+    origin = get_origin(annotation)
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        return _LIST + length * (_POINTER + annotation_bytes(item, length, nested=True))
+    elif origin is tuple:
+        items = get_args(annotation)
+        return _TUPLE + sum(_POINTER + annotation_bytes(item, length, True) for item in items)
+    elif annotation is float:
+        return sys.getsizeof(0.0)
+    elif annotation is int:
+        # Lattices hold small ints (types, levels), shared by Python.
+        return 0 if nested else sys.getsizeof(2**30)
+    elif annotation is bool or annotation is None or annotation is type(None):
+        return 0
+    return _OBJECT
+
+
+def series_bytes(model: AbstractLatticeModel, name: str) -> int:
+    # Estimated bytes of each value of a series, from its return annotation.
+    try:
+        annotation = get_type_hints(model._series[name]).get("return", Any)
+    except (NameError, TypeError):
+        annotation = Any
+    return _POINTER + annotation_bytes(annotation, model.length)
+
+
+def estimate(
+    model: AbstractLatticeModel,
+    max_steps: int,
+    repetitions: int = 1,
+    saving_series: Sequence[str] = (),
+) -> int:
+    # Estimated bytes of a run: every series of the last repetition, the saved series of
+    # the previous ones and the lattice of agents (twice for simultaneous updates).
+    snapshots = max_steps + 1
+    sizes = {name: series_bytes(model, name) for name in model._sorted_series_names}
+    total = snapshots * sum(sizes.values())
+    total += (repetitions - 1) * snapshots * sum(sizes.get(name, 0) for name in saving_series)
+    custom_agents = type(model)._create_agent is not AbstractLatticeModel._create_agent
+    lattice = _LIST + model.length * (_LIST + model.length * _POINTER)
+    lattice += model.length**2 * (_OBJECT if custom_agents else 0)
+    return total + lattice * (2 if model.update_simultaneously else 1)
+
+
+def megabytes(amount: int) -> str:
+    return f"{amount / 2**20:.1f} MB"
+
+
+class SpilledSeries(Sequence[Any]):
+    # A series that keeps its last values in memory and pickles the older ones to a file.
+    # It can be read like a list (values on disk are loaded on each access), and its file
+    # is deleted by close().
+    def __init__(self, path: str, keep: int = 1, values: Iterable[Any] = ()) -> None:
+        assert keep > 0, "Spilled series should keep at least one value in memory."
+        self.path = path
+        self.keep = keep
+        self.__offsets: List[int] = []
+        self.__memory: Deque[Any] = deque()
+        self.__file: IO[bytes] | None = None
+        for value in values:
+            self.append(value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        if self.__file is not None:
+            self.__file.flush()
+        state = self.__dict__.copy()
+        state["_SpilledSeries__file"] = None
+        return state
+
+    def __len__(self) -> int:
+        return len(self.__offsets) + len(self.__memory)
+
+    @property
+    def in_memory(self) -> int:
+        return len(self.__memory)
+
+    def append(self, value: Any) -> None:
+        self.__memory.append(value)
+        if len(self.__memory) > self.keep:
+            file = self.__open()
+            file.seek(0, os.SEEK_END)
+            self.__offsets.append(file.tell())
+            pickle.dump(self.__memory.popleft(), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.append(value)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Spilled series index out of range.")
+        if index >= len(self.__offsets):
+            return self.__memory[index - len(self.__offsets)]
+        file = self.__open()
+        file.flush()
+        file.seek(self.__offsets[index])
+        return pickle.load(file)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"SpilledSeries({self.path}, {len(self)} values, {self.in_memory} in memory)"
+
+    def __open(self) -> IO[bytes]:
+        if self.__file is None:
+            self.__file = open(self.path, "a+b")
+        return self.__file
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class _Watch:
+    def __init__(self, keep: int | None) -> None:
+        self.keep = keep
+        self.sizes: Dict[str, int] = {}
+        self.steps: List[int] = []
+        self.stride = 1
+
+
+class MemoryBudget(Hook):
+    # Tracks the memory used by the series of the watched models, measuring their values
+    # every measure_every steps. Over the limit (in bytes), a run is stopped with a
+    # MemoryError ("refuse"), its largest series are moved to disk ("spill"), or half of
+    # its older snapshots are dropped, and then only one out of every 2, 4, 8... steps
+    # is kept ("decimate"). The last values needed by the criterion are always kept.
+    def __init__(
+        self,
+        limit: int,
+        policy: str = "refuse",
+        directory: str | None = None,
+        measure_every: int = 10,
+    ) -> None:
+        assert limit > 0, "Memory limit should be greater than 0."
+        assert policy in POLICIES, f"Memory policy should be one of {POLICIES}."
+        assert measure_every > 0, "Measure interval should be greater than 0."
+        self.limit = limit
+        self.policy = policy
+        self.directory = directory
+        self.measure_every = measure_every
+        self.peak = 0
+        self.spilled: List[SpilledSeries] = []
+        self.__watches: WeakKeyDictionary[AbstractLatticeModel, _Watch] = WeakKeyDictionary()
+        self.__lock = threading.Lock()
+        self.__names = count()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Each process of a pool enforces its own copy of the budget, starting without
+        # watches: the runner watches again the model it sends.
+        return {
+            "limit": self.limit,
+            "policy": self.policy,
+            "directory": self.directory,
+            "measure_every": self.measure_every,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.peak = 0
+        self.spilled = []
+        self.__watches = WeakKeyDictionary()
+        self.__lock = threading.Lock()
+        self.__names = count()
+
+    def watch(self, model: AbstractLatticeModel, criterion: AbstractCriterion) -> None:
+        required = criterion.required_series()
+        amounts = list(required.values()) if required is not None else [None]
+        keep = None if None in amounts else max([1, *(a for a in amounts if a is not None)])
+        self.__watches[model] = _Watch(keep)
+        if self not in model.hooks:
+            model.hooks.append(self)
+
+    def check(
+        self,
+        models: Sequence[AbstractLatticeModel],
+        max_steps: int,
+        repetitions: int = 1,
+        saving_series: Sequence[str] = (),
+    ) -> int:
+        needed = sum(estimate(model, max_steps, repetitions, saving_series) for model in models)
+        if needed > self.limit and self.policy == "refuse":
+            raise MemoryError(
+                f"The run needs about {megabytes(needed)} for {len(models)} experiments "
+                f"({max_steps} steps, {repetitions} repetitions), over the memory budget of "
+                f"{megabytes(self.limit)}. Reduce the steps, the lengths or the recorded "
+                "series, or use the 'spill' or 'decimate' policy."
+            )
+        return needed
+
+    def before_experiment(self, model: AbstractLatticeModel) -> None:
+        watch = self.__watches.get(model)
+        assert watch is not None, "Models should be added with MemoryBudget.watch."
+        self.__watches[model] = _Watch(watch.keep)
+
+    def after_step(self, model: AbstractLatticeModel, step: int) -> None:
+        with self.__lock:
+            watch = self.__watches[model]
+            if not watch.steps:
+                watch.steps.append(0)
+            watch.steps.append(step)
+            for name, values in model.series.items():
+                if name not in watch.sizes or step % self.measure_every == 0:
+                    watch.sizes[name] = _POINTER + sizeof(values[-1]) if len(values) else 0
+            if watch.stride > 1:
+                self.__drop_leaving(model, watch)
+            used = self.usage()
+            if used > self.limit:
+                used = self.__enforce(model, watch, used)
+            self.peak = max(self.peak, used)
+
+    def usage(self, model: AbstractLatticeModel | None = None) -> int:
+        # Bytes of the series of a watched model (or all of them) still in memory,
+        # including the history of previous repetitions.
+        models = [model] if model is not None else list(self.__watches.keys())
+        total = 0
+        counted = set()
+        for each in models:
+            watch = self.__watches[each]
+            for name, size in watch.sizes.items():
+                kept = [each.series.get(name, ())] + each.series_history.get(name, [])
+                # The last repetition's series can also be in its history.
+                for values in kept:
+                    if id(values) not in counted:
+                        counted.add(id(values))
+                        total += size * _in_memory(values)
+        return total
+
+    def steps(self, model: AbstractLatticeModel) -> List[int]:
+        # Steps of the snapshots kept in the series of a decimated model.
+        return list(self.__watches[model].steps)
+
+    def __enforce(self, model: AbstractLatticeModel, watch: _Watch, used: int) -> int:
+        if self.policy == "spill" and watch.keep is not None:
+            used = self.__spill(model, watch, used)
+        elif self.policy == "decimate" and watch.keep is not None:
+            while used > self.limit and self.__decimate(model, watch):
+                used = self.usage()
+        if used > self.limit:
+            raise MemoryError(
+                f"The series use {megabytes(used)}, over the memory budget of "
+                f"{megabytes(self.limit)} (policy '{self.policy}')."
+            )
+        return used
+
+    def __spill(self, model: AbstractLatticeModel, watch: _Watch, used: int) -> int:
+        assert watch.keep is not None
+        largest = sorted(watch.sizes, key=lambda name: -watch.sizes[name])
+        for name in largest:
+            if used <= self.limit:
+                break
+            history: List[Any] = model.series_history.get(name, [])
+            for index, values in enumerate(history):
+                if isinstance(values, list):
+                    history[index] = self.__spilled(model, name, watch.keep, values)
+            if isinstance(model.series[name], list):
+                model.series[name] = self.__spilled(model, name, watch.keep, model.series[name])
+            used = self.usage()
+        return used
+
+    def __spilled(
+        self,
+        model: AbstractLatticeModel,
+        name: str,
+        keep: int,
+        values: List[Any],
+    ) -> SpilledSeries:
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="simulab-")
+        path = os.path.join(self.directory, f"{name}-{id(model)}-{next(self.__names)}.pickle")
+        series = SpilledSeries(path, keep, values)
+        self.spilled.append(series)
+        return series
+
+    def __decimate(self, model: AbstractLatticeModel, watch: _Watch) -> bool:
+        # Doubles the stride and drops the older snapshots out of it. Returns False when
+        # there is nothing left to drop.
+        assert watch.keep is not None
+        older = len(watch.steps) - watch.keep
+        if older <= 1:
+            return False
+        watch.stride *= 2
+        kept = [index for index in range(older) if watch.steps[index] % watch.stride == 0] + list(
+            range(older, len(watch.steps))
+        )
+        watch.steps = [watch.steps[index] for index in kept]
+        for name, values in model.series.items():
+            if isinstance(values, list):
+                values[:] = [values[index] for index in kept]
+        return True
+
+    def __drop_leaving(self, model: AbstractLatticeModel, watch: _Watch) -> None:
+        # The snapshot leaving the window kept for the criterion stays only on the stride.
+        assert watch.keep is not None
+        index = len(watch.steps) - 1 - watch.keep
+        if index > 0 and watch.steps[index] % watch.stride != 0:
+            del watch.steps[index]
+            for values in model.series.values():
+                if isinstance(values, list):
+                    del values[index]
+
+    def cleanup(self) -> None:
+        for series in self.spilled:
+            series.close()
+        self.spilled = []
+
+
+def _in_memory(values: Any) -> int:
+    return values.in_memory if isinstance(values, SpilledSeries) else len(values)
@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
-from functools import partial, partialmethod
+from functools import partial
 from typing import List, Tuple
 
+import numpy as np
+
 
 class Neighborhood(ABC):
+    # Neighborhoods without OFFSETS should overload indexes_for, and their counts are
+    # computed from it.
+    OFFSETS: Tuple[Tuple[int, int], ...] = ()
+    __neighbor_indexes: np.ndarray | None = None
+
     def __init__(self, world_size: int):
         self._world_size = world_size
 
@@ -15,75 +22,97 @@ class Neighborhood(ABC):
     def _norm(self, index: int) -> int:
         return index % self._world_size
 
-    @abstractmethod
     def indexes_for(self, i: int, j: int) -> List[Tuple[int, int]]:
-        pass
+        return [(self._norm(i + di), self._norm(j + dj)) for di, dj in self.OFFSETS]
+
+    def neighbor_indexes(self) -> np.ndarray:
+        # Flat indexes (i * world_size + j) of the neighbors of each cell, one row per cell.
+        if self.__neighbor_indexes is None:
+            length = self._world_size
+            if self.OFFSETS:
+                indexes = np.arange(length * length).reshape((length, length))
+                neighbors = [
+                    np.roll(indexes, (-di, -dj), axis=(0, 1)).ravel() for di, dj in self.OFFSETS
+                ]
+                self.__neighbor_indexes = np.stack(neighbors, axis=1)
+            else:
+                self.__neighbor_indexes = np.array(
+                    [
+                        [x * length + y for x, y in self.indexes_for(i, j)]
+                        for i in range(length)
+                        for j in range(length)
+                    ],
+                    dtype=np.int64,
+                ).reshape((length * length, -1))
+        return self.__neighbor_indexes
+
+    def count(self, mask: np.ndarray) -> np.ndarray:
+        # Amount of neighbors where the mask is set, for every cell of the lattice.
+        if not self.OFFSETS:
+            neighbors = mask.ravel()[self.neighbor_indexes()]
+            return neighbors.sum(axis=1, dtype=np.int64).reshape(mask.shape)
+        total = np.zeros(mask.shape, dtype=np.int64)
+        for di, dj in self.OFFSETS:
+            total += np.roll(mask, (-di, -dj), axis=(0, 1))
+        return total
+
+    def similar_count(self, agent_types: np.ndarray) -> np.ndarray:
+        # Amount of neighbors with the same agent type, for every cell of the lattice.
+        if not self.OFFSETS:
+            types = agent_types.ravel()
+            similar = types[self.neighbor_indexes()] == types[:, None]
+            return similar.sum(axis=1, dtype=np.int64).reshape(agent_types.shape)
+        total = np.zeros(agent_types.shape, dtype=np.int64)
+        for di, dj in self.OFFSETS:
+            total += np.roll(agent_types, (-di, -dj), axis=(0, 1)) == agent_types
+        return total
 
 
 class Immediate(Neighborhood):
+    OFFSETS = ((0, -1), (0, 1))
+
     @classmethod
     def size(cls) -> int:
         return 2
 
-    def indexes_for(self, i: int, j: int) -> List[Tuple[int, int]]:
-        return [(self._norm(x), self._norm(y)) for x, y in [(i, j - 1), (i, j + 1)]]
-
 
 class VonNeumann(Neighborhood):
+    OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
     @classmethod
     def size(cls) -> int:
         return 4
 
-    def indexes_for(self, i: int, j: int) -> List[Tuple[int, int]]:
-        return [
-            (self._norm(x), self._norm(y))
-            for x, y in [(i, j - 1), (i, j + 1), (i - 1, j), (i + 1, j)]
-        ]
-
 
 class Moore(Neighborhood):
+    OFFSETS = (
+        (0, -1),
+        (0, 1),
+        (-1, 0),
+        (1, 0),
+        (1, -1),
+        (1, 1),
+        (-1, -1),
+        (-1, 1),
+    )
+
     @classmethod
     def size(cls) -> int:
         return 8
 
-    def indexes_for(self, i: int, j: int) -> List[Tuple[int, int]]:
-        return [
-            (self._norm(x), self._norm(y))
-            for x, y in [
-                (i, j - 1),
-                (i, j + 1),
-                (i - 1, j),
-                (i + 1, j),
-                (i + 1, j - 1),
-                (i + 1, j + 1),
-                (i - 1, j - 1),
-                (i - 1, j + 1),
-            ]
-        ]
-
 
 def _size(vision_range: int) -> int:
     side = 2 * vision_range + 1
     return side * side - 1
 
 
-def _indexes_at_range(  # type: ignore[no-untyped-def]
-    self,
-    vision_range: int,
-    i: int,
-    j: int = 0,
-) -> List[Tuple[int, int]]:
-    start_i = i - vision_range
-    start_j = j - vision_range
-    end_i = i + vision_range
-    end_j = j + vision_range
-
-    return [
-        (self._norm(x), self._norm(y))
-        for x in range(start_i, end_i + 1)
-        for y in range(start_j, end_j + 1)
-        if (x, y) != (i, j)
-    ]
+def _offsets_at_range(vision_range: int) -> Tuple[Tuple[int, int], ...]:
+    return tuple(
+        (x, y)
+        for x in range(-vision_range, vision_range + 1)
+        for y in range(-vision_range, vision_range + 1)
+        if (x, y) != (0, 0)
+    )
 
 
 class ExpandedMoore:
@@ -94,7 +123,7 @@ class ExpandedMoore:
             (Neighborhood,),
             {
                 "size": partial(_size, vision_range),
-                "indexes_for": partialmethod(_indexes_at_range, vision_range),
+                "OFFSETS": _offsets_at_range(vision_range),
             },
         )
         return WrappedExpandedMoore
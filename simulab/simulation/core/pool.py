@@ -0,0 +1,47 @@
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, TypeVar
+
+import numpy as np
+
+T = TypeVar("T", bound=Hashable)
+
+
+class IndexedPool(Generic[T]):
+    # A set that also keeps its items in a list, so it can add, remove and
+    # sample a random item in O(1) (removals move the last item to the hole).
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self.__items: List[T] = []
+        self.__index: Dict[T, int] = {}
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.__index
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__items)
+
+    def __repr__(self) -> str:
+        return f"IndexedPool({self.__items})"
+
+    def add(self, item: T) -> None:
+        if item not in self.__index:
+            self.__index[item] = len(self.__items)
+            self.__items.append(item)
+
+    def remove(self, item: T) -> None:
+        index = self.__index.pop(item)
+        last = self.__items.pop()
+        if index < len(self.__items):
+            self.__items[index] = last
+            self.__index[last] = index
+
+    def discard(self, item: T) -> None:
+        if item in self.__index:
+            self.remove(item)
+
+    def sample(self) -> T:
+        assert len(self.__items) > 0, "There are no items to sample from."
+        return self.__items[np.random.randint(len(self.__items))]
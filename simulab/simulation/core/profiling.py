@@ -0,0 +1,127 @@
+import time
+from typing import TYPE_CHECKING, Dict, List
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from simulab.models.abstract.model import AbstractLatticeModel
+
+
+class Hook:
+    # Overload the methods you need. Measured sections are "initialize", "step" (run_step),
+    # "copy" (the copy of the lattice made by simultaneous updates, inside "step"),
+    # "criterion" and "series.<name>" for each series, with their wall time and the net
+    # amount of memory blocks allocated by them.
+    def before_experiment(self, model: "AbstractLatticeModel") -> None:
+        pass
+
+    def after_experiment(self, model: "AbstractLatticeModel") -> None:
+        pass
+
+    def before_step(self, model: "AbstractLatticeModel", step: int) -> None:
+        pass
+
+    def after_step(self, model: "AbstractLatticeModel", step: int) -> None:
+        pass
+
+    def measured(
+        self,
+        model: "AbstractLatticeModel",
+        section: str,
+        seconds: float,
+        blocks: int,
+    ) -> None:
+        pass
+
+
+class SectionStats:
+    __slots__ = ("calls", "seconds", "blocks", "max_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.blocks = 0
+        self.max_seconds = 0.0
+
+    def add(self, seconds: float, blocks: int) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.blocks += blocks
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "mean_seconds": self.seconds / self.calls if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+            "blocks": self.blocks,
+        }
+
+
+class Profiler(Hook):
+    # Stats are kept by experiment, in the order they started. Experiments get their index
+    # through a weak reference, so a collected model's id reused by a new one starts anew.
+    def __init__(self) -> None:
+        self.__stats: List[Dict[str, SectionStats]] = []
+        self.__experiments: List[str] = []
+        self.__indexes: WeakKeyDictionary["AbstractLatticeModel", int] = WeakKeyDictionary()
+        self.__started: WeakKeyDictionary["AbstractLatticeModel", float] = WeakKeyDictionary()
+
+    def before_experiment(self, model: "AbstractLatticeModel") -> None:
+        self.__index(model)
+        self.__started[model] = time.perf_counter()
+
+    def after_experiment(self, model: "AbstractLatticeModel") -> None:
+        seconds = time.perf_counter() - self.__started.pop(model)
+        self.__section(model, "experiment").add(seconds, 0)
+
+    def measured(
+        self,
+        model: "AbstractLatticeModel",
+        section: str,
+        seconds: float,
+        blocks: int,
+    ) -> None:
+        self.__section(model, section).add(seconds, blocks)
+
+    def __index(self, model: "AbstractLatticeModel") -> int:
+        if model not in self.__indexes:
+            self.__indexes[model] = len(self.__stats)
+            self.__stats.append({})
+            self.__experiments.append(type(model).__name__)
+        return self.__indexes[model]
+
+    def __section(self, model: "AbstractLatticeModel", section: str) -> SectionStats:
+        stats = self.__stats[self.__index(model)]
+        try:
+            return stats[section]
+        except KeyError:
+            stats[section] = SectionStats()
+            return stats[section]
+
+    def report(self, model: "AbstractLatticeModel") -> Dict[str, Dict[str, float]]:
+        index = self.__indexes.get(model)
+        stats = self.__stats[index] if index is not None else {}
+        return {section: stats[section].as_dict() for section in sorted(stats)}
+
+    def reports(self) -> List[Dict[str, Dict[str, float]]]:
+        return [
+            {section: stats[section].as_dict() for section in sorted(stats)}
+            for stats in self.__stats
+        ]
+
+    def summary(self) -> str:
+        lines = []
+        for index, (name, stats) in enumerate(zip(self.__experiments, self.__stats)):
+            lines.append(f"# Experiment {index} ({name})")
+            lines.append(
+                f"{'section':<40}{'calls':>8}{'total (s)':>12}{'mean (s)':>12}{'blocks':>10}"
+            )
+            ranking = sorted(stats.items(), key=lambda item: -item[1].seconds)
+            for section, section_stats in ranking:
+                values = section_stats.as_dict()
+                lines.append(
+                    f"{section:<40}{values['calls']:>8.0f}{values['seconds']:>12.4f}"
+                    f"{values['mean_seconds']:>12.6f}{values['blocks']:>10.0f}"
+                )
+        return "\n".join(lines)
@@ -1,8 +1,14 @@
-from typing import List, Tuple, Type
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Callable, List, Tuple, Type
 
 from simulab.models.abstract.model import AbstractLatticeModel
 from simulab.simulation.core.equilibrium_criterion import AbstractCriterion
 from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.memory import MemoryBudget, estimate
+from simulab.simulation.core.profiling import Hook
 
 
 class Execute:
@@ -19,10 +25,12 @@ class Runner:
         equilibrium_criterion: AbstractCriterion,
         max_steps: int = 150,
         repeat: Execute = Execute(),
+        hooks: List[Hook] | None = None,
+        memory_budget: MemoryBudget | None = None,
     ):
         if repeat.times > 1:
-            assert all(
-                (len(each) == 1 for each in experiment_parameters_set._raw.values())
+            assert (
+                len(experiment_parameters_set) == 1
             ), """Repetition mode only supports one experiment per runner. \
                 Please, reduce your Parameters Set."""
         self.experiments: List[AbstractLatticeModel] = []
@@ -30,9 +38,13 @@ class Runner:
         self.max_steps = max_steps
         self.repeat = repeat
         self.experiment_parameters_set = experiment_parameters_set
+        self.memory_budget = memory_budget
         try:
             for experiment_parameters in experiment_parameters_set:
                 experiment = model(**experiment_parameters)
+                experiment.hooks.extend(hooks if hooks else [])
+                if memory_budget is not None:
+                    memory_budget.watch(experiment, equilibrium_criterion)
                 self.experiments.append(experiment)
         except TypeError as error:
             raise TypeError(
@@ -41,7 +53,23 @@ class Runner:
                 f"They should be named equal to the names expected by the {model.__name__} model."
             )
 
+    def estimated_memory(self) -> int:
+        return sum(
+            estimate(experiment, self.max_steps, self.repeat.times, self.repeat.series_names)
+            for experiment in self.experiments
+        )
+
+    def _check_memory_budget(self) -> None:
+        if self.memory_budget is not None:
+            self.memory_budget.check(
+                self.experiments,
+                self.max_steps,
+                self.repeat.times,
+                self.repeat.series_names,
+            )
+
     def start(self) -> None:
+        self._check_memory_budget()
         for _ in range(self.repeat.times):
             for experiment in self.experiments:
                 experiment.run_with(
@@ -49,3 +77,148 @@ class Runner:
                     criterion=self.equilibrium_criterion,
                     saving_series=self.repeat.series_names,
                 )
+
+
+class Progress:
+    __slots__ = ("experiment", "repetition", "step", "finished", "error")
+
+    def __init__(
+        self,
+        experiment: int,
+        repetition: int | None = None,
+        step: int | None = None,
+        finished: bool = False,
+        error: BaseException | None = None,
+    ) -> None:
+        self.experiment = experiment
+        self.repetition = repetition
+        self.step = step
+        self.finished = finished
+        self.error = error
+
+    def __repr__(self) -> str:
+        if self.finished:
+            status = "cancelled" if isinstance(self.error, asyncio.CancelledError) else self.error
+            return f"Progress(experiment={self.experiment}, finished, {status or 'done'})"
+        return f"Progress(experiment={self.experiment}, {self.repetition}, step={self.step})"
+
+
+def _run_experiment(
+    experiment: AbstractLatticeModel,
+    max_steps: int,
+    criterion: AbstractCriterion,
+    repeat: Execute,
+    on_step: Callable[[int, int], None] | None = None,
+) -> AbstractLatticeModel:
+    for hook in experiment.hooks:
+        # A budget copied to a worker process has no watches.
+        if isinstance(hook, MemoryBudget):
+            hook.watch(experiment, criterion)
+    for repetition in range(repeat.times):
+        experiment.run_with(
+            max_steps=max_steps,
+            criterion=criterion,
+            saving_series=repeat.series_names,
+            on_step=partial(on_step, repetition) if on_step else None,
+        )
+    return experiment
+
+
+class _Stopped(Exception):
+    # Raised in the worker threads of a cancelled AsyncRunner, where CancelledError would be
+    # taken for a cancellation of the thread's own code.
+    pass
+
+
+class AsyncRunner(Runner):
+    # Runs the experiments in an executor (a thread pool by default) without blocking the
+    # event loop. With threads, progress is reported on every step and cancellation stops
+    # running experiments too. With processes, only when each experiment finishes, and
+    # only pending experiments can be cancelled.
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        *args,
+        executor: Executor | None = None,
+        **kwargs,
+    ):
+        super(AsyncRunner, self).__init__(*args, **kwargs)
+        self.executor = executor
+        self.futures: List["asyncio.Future[AbstractLatticeModel]"] = []
+        self.__cancelled = threading.Event()
+        self.__events: "asyncio.Queue[Progress | None]" = asyncio.Queue()
+        self.__pending = 0
+
+    def submit(self) -> List["asyncio.Future[AbstractLatticeModel]"]:
+        if self.futures:
+            return self.futures
+        self._check_memory_budget()
+        self.__cancelled.clear()
+        loop = asyncio.get_running_loop()
+        in_threads = not isinstance(self.executor, ProcessPoolExecutor)
+        self.__pending = len(self.experiments)
+        for index, experiment in enumerate(self.experiments):
+            run = partial(
+                _run_experiment,
+                experiment,
+                self.max_steps,
+                self.equilibrium_criterion,
+                self.repeat,
+                partial(self.__on_step, loop, index) if in_threads else None,
+            )
+            future = asyncio.ensure_future(self.__run_in_executor(loop, run))
+            future.add_done_callback(partial(self.__on_finished, index))
+            self.futures.append(future)
+        return self.futures
+
+    async def __run_in_executor(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        run: Callable[[], AbstractLatticeModel],
+    ) -> AbstractLatticeModel:
+        try:
+            return await loop.run_in_executor(self.executor, run)
+        except _Stopped:
+            raise asyncio.CancelledError
+
+    def __on_step(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        index: int,
+        repetition: int,
+        step: int,
+    ) -> None:
+        # Runs in the worker thread.
+        if self.__cancelled.is_set():
+            raise _Stopped
+        loop.call_soon_threadsafe(self.__events.put_nowait, Progress(index, repetition, step))
+
+    def __on_finished(self, index: int, future: "asyncio.Future[AbstractLatticeModel]") -> None:
+        error: BaseException | None
+        if future.cancelled():
+            error = asyncio.CancelledError()
+        else:
+            error = future.exception()
+            if error is None:
+                self.experiments[index] = future.result()
+        self.__events.put_nowait(Progress(index, finished=True, error=error))
+        self.__pending -= 1
+        if self.__pending == 0:
+            self.__events.put_nowait(None)
+
+    async def run(self) -> List[AbstractLatticeModel]:
+        await asyncio.gather(*self.submit())
+        return self.experiments
+
+    async def progress(self) -> AsyncIterator[Progress]:
+        self.submit()
+        while (event := await self.__events.get()) is not None:
+            yield event
+
+    async def as_completed(self) -> AsyncIterator[AbstractLatticeModel]:
+        for future in asyncio.as_completed(self.submit()):
+            yield await future
+
+    def cancel(self) -> None:
+        self.__cancelled.set()
+        for future in self.futures:
+            future.cancel()
@@ -0,0 +1,114 @@
+from typing import List, Tuple
+
+import numpy as np
+
+DESIGNS = ("random", "latin_hypercube", "halton", "sobol")
+BITS = 32
+
+# Joe and Kuo's direction numbers (new-joe-kuo-6.21201) for the dimensions after the first
+# one: degree and coefficients of the primitive polynomial, and the initial numbers.
+SOBOL_DIRECTIONS: List[Tuple[int, int, Tuple[int, ...]]] = [
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+]
+
+
+def primes(amount: int) -> List[int]:
+    found: List[int] = []
+    candidate = 2
+    while len(found) < amount:
+        if all(candidate % prime for prime in found):
+            found.append(candidate)
+        candidate += 1
+    return found
+
+
+def latin_hypercube(samples: int, dimensions: int, rng: np.random.Generator) -> np.ndarray:
+    # One sample in each of the samples intervals of every dimension, at a random place.
+    strata = np.stack([rng.permutation(samples) for _ in range(dimensions)], axis=1)
+    return (strata + rng.random((samples, dimensions))) / samples
+
+
+def halton(samples: int, dimensions: int, rng: np.random.Generator | None) -> np.ndarray:
+    # Radical inverses of 0, 1, 2, ... in the first prime bases. With a generator, the digits
+    # of each base are randomly permuted (keeping 0, so the points stay in [0, 1)).
+    points = np.zeros((samples, dimensions))
+    for dimension, base in enumerate(primes(dimensions)):
+        digits = np.arange(base)
+        if rng is not None:
+            digits[1:] = rng.permutation(digits[1:])
+        indexes = np.arange(samples)
+        scale = 1.0
+        while indexes.any():
+            scale /= base
+            points[:, dimension] += scale * digits[indexes % base]
+            indexes //= base
+    return points
+
+
+def sobol_directions(dimensions: int) -> np.ndarray:
+    assert dimensions <= len(SOBOL_DIRECTIONS) + 1, (
+        f"Sobol designs support up to {len(SOBOL_DIRECTIONS) + 1} parameters, "
+        "use 'halton' for more."
+    )
+    directions = np.zeros((dimensions, BITS), dtype=np.uint64)
+    directions[0] = [1 << (BITS - 1 - bit) for bit in range(BITS)]
+    for dimension, (degree, coefficients, initial) in enumerate(
+        SOBOL_DIRECTIONS[: dimensions - 1], start=1
+    ):
+        numbers = [number << (BITS - 1 - bit) for bit, number in enumerate(initial)]
+        for bit in range(degree, BITS):
+            number = numbers[bit - degree] ^ (numbers[bit - degree] >> degree)
+            for term in range(1, degree):
+                if (coefficients >> (degree - 1 - term)) & 1:
+                    number ^= numbers[bit - term]
+            numbers.append(number)
+        directions[dimension] = numbers
+    return directions
+
+
+def sobol(samples: int, dimensions: int, rng: np.random.Generator | None) -> np.ndarray:
+    # Points 0, 1, 2, ... of the Sobol sequence, in Gray code order. With a generator, they
+    # are scrambled by a random digital shift, which keeps their balance.
+    directions = sobol_directions(dimensions)
+    indexes = np.arange(samples, dtype=np.uint64)
+    gray = indexes ^ (indexes >> np.uint64(1))
+    points = np.zeros((samples, dimensions), dtype=np.uint64)
+    for bit in range(BITS):
+        mask = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        points[mask] ^= directions[:, bit]
+    if rng is not None:
+        points ^= rng.integers(0, 2**BITS, dimensions, dtype=np.uint64)
+    return points.astype(float) / 2**BITS
+
+
+def unit_samples(design: str, samples: int, dimensions: int, seed: int | None = 0) -> np.ndarray:
+    # A samples x dimensions matrix of points in [0, 1), the same for the same seed. Halton
+    # and Sobol designs are not scrambled when the seed is None.
+    assert design in DESIGNS, f"Design should be one of {DESIGNS}."
+    assert samples > 0, "There should be at least one sample."
+    if dimensions == 0:
+        # Every parameter is fixed.
+        return np.zeros((samples, 0))
+    rng = np.random.default_rng(seed) if seed is not None else None
+    if design == "halton":
+        return halton(samples, dimensions, rng)
+    elif design == "sobol":
+        return sobol(samples, dimensions, rng)
+    _rng = rng if rng is not None else np.random.default_rng()
+    if design == "latin_hypercube":
+        return latin_hypercube(samples, dimensions, _rng)
+    return _rng.random((samples, dimensions))
@@ -0,0 +1,148 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from heapq import heapify, heappop, heappush
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from simulab.models.abstract.model import AbstractLatticeModel
+
+Position = Tuple[int, int]
+# Colorings kept by Checkerboard, one per length and neighborhood.
+COLORINGS_CACHE_SIZE = 8
+
+
+class Scheduler(ABC):
+    # Set to True in schedulers whose batches never hold two neighbor positions, so a local
+    # step gives the same result updating a whole batch at once or one position at a time.
+    independent_batches: bool = False
+
+    @abstractmethod
+    def batches(self, model: "AbstractLatticeModel") -> Iterable[Sequence[Position]]:
+        pass
+
+    def __repr__(self) -> str:
+        return type(self).__name__
+
+
+def _all_positions(length: int) -> List[Position]:
+    return [(i, j) for i in range(length) for j in range(length)]
+
+
+class RowMajor(Scheduler):
+    def batches(self, model: "AbstractLatticeModel") -> Iterable[Sequence[Position]]:
+        return [_all_positions(model.length)]
+
+
+class ByAgentType(Scheduler):
+    def batches(self, model: "AbstractLatticeModel") -> Iterable[Sequence[Position]]:
+        by_type = model.configuration.by_type()
+        return [list(by_type[_type]) for _type in sorted(by_type)]
+
+
+class RandomPermutation(Scheduler):
+    def batches(self, model: "AbstractLatticeModel") -> Iterable[Sequence[Position]]:
+        order = np.random.permutation(model.length**2)
+        return [[divmod(index, model.length) for index in order.tolist()]]
+
+
+class RandomAsynchronous(Scheduler):
+    # Updates length² random positions per step (with replacement), sampled by batches.
+    def __init__(self, batch_size: int | None = None) -> None:
+        assert batch_size is None or batch_size > 0, "Batch size should be greater than 0."
+        self.batch_size = batch_size
+
+    def batches(self, model: "AbstractLatticeModel") -> Iterable[Sequence[Position]]:
+        remaining = model.length**2
+        batch_size = self.batch_size if self.batch_size else model.length
+        while remaining > 0:
+            amount = min(batch_size, remaining)
+            remaining -= amount
+            yield [(i, j) for i, j in np.random.randint(0, model.length, size=(amount, 2)).tolist()]
+
+
+class Checkerboard(Scheduler):
+    # Red-black sweeps generalized to any neighborhood: positions are colored so that
+    # no two neighbors share a color, and each color is a batch.
+    independent_batches = True
+
+    def batches(self, model: "AbstractLatticeModel") -> Iterable[Sequence[Position]]:
+        assert model.neighborhood.OFFSETS, "Checkerboard needs a neighborhood with OFFSETS."
+        return self.colors(model.length, tuple(model.neighborhood.OFFSETS))
+
+    @staticmethod
+    @lru_cache(maxsize=COLORINGS_CACHE_SIZE)
+    def colors(
+        length: int,
+        offsets: Tuple[Position, ...],
+    ) -> Tuple[Tuple[Position, ...], ...]:
+        if all((di + dj) % 2 for di, dj in offsets):
+            # Every neighbor has the opposite parity, like in VonNeumann.
+            period, amount = 2, 2
+            color = lambda i, j: (i + j) % 2
+        else:
+            period = max(max(abs(di), abs(dj)) for di, dj in offsets) + 1
+            amount = period * period
+            color = lambda i, j: (i % period) * period + j % period
+        assert length % period == 0, f"Checkerboard needs a length multiple of {period}."
+        colors: List[List[Position]] = [[] for _ in range(amount)]
+        for i, j in _all_positions(length):
+            colors[color(i, j)].append((i, j))
+        return tuple(tuple(positions) for positions in colors)
+
+
+class _EventQueue:
+    def __init__(self, model: "AbstractLatticeModel") -> None:
+        self.configuration = model.configuration
+        self.time = 0.0
+        self.versions = [[0] * model.length for _ in range(model.length)]
+        self.events: List[Tuple[float, int, int, int]] = []
+        for i, j in _all_positions(model.length):
+            self.__schedule(model, i, j, push=False)
+        heapify(self.events)
+
+    def __schedule(self, model: "AbstractLatticeModel", i: int, j: int, push: bool = True) -> None:
+        # Exponential clocks are memoryless, so a cell whose rate may have changed gets a new
+        # event, and its previous one is left in the heap with an outdated version.
+        self.versions[i][j] += 1
+        rate = model.rate(i, j)
+        if rate > 0:
+            event = (self.time + np.random.exponential(1 / rate), self.versions[i][j], i, j)
+            if push:
+                heappush(self.events, event)
+            else:
+                self.events.append(event)
+
+    def until(self, model: "AbstractLatticeModel", end: float) -> Iterator[Sequence[Position]]:
+        while self.events and self.events[0][0] < end:
+            time, version, i, j = heappop(self.events)
+            if version != self.versions[i][j]:
+                continue
+            self.time = time
+            yield [(i, j)]
+            for position in model.affected_by(i, j):
+                self.__schedule(model, *position)
+        self.time = end
+
+
+class EventDriven(Scheduler):
+    # Each cell is updated after exponential waiting times with rate model.rate(i, j), one
+    # event at a time, and each step advances the simulated time by time_step.
+    def __init__(self, time_step: float = 1.0) -> None:
+        assert time_step > 0, "Time step should be greater than 0."
+        self.time_step = time_step
+        self.__queues: WeakKeyDictionary["AbstractLatticeModel", _EventQueue] = WeakKeyDictionary()
+
+    def batches(self, model: "AbstractLatticeModel") -> Iterable[Sequence[Position]]:
+        assert not model.update_simultaneously, "Events are processed one at a time."
+        queue = self.__queues.get(model)
+        if queue is None or queue.configuration is not model.configuration:
+            queue = _EventQueue(model)
+            self.__queues[model] = queue
+        return queue.until(model, queue.time + self.time_step)
+
+    def time(self, model: "AbstractLatticeModel") -> float:
+        queue = self.__queues.get(model)
+        return queue.time if queue is not None else 0.0
@@ -1,9 +1,27 @@
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
 
 import numpy as np
-import plotly.graph_objs as go
 
+from simulab.simulation.core.lazy import lazy_import
 from simulab.simulation.core.runner import Runner
+from simulab.simulation.plotters.frames import (
+    ENCODINGS,
+    LEVELS,
+    data_uri,
+    downsample,
+    frame_indexes,
+    level_ticks,
+    palette,
+    payload_size,
+    png,
+    quantize,
+)
+from simulab.simulation.plotters.statistics import statistics
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+else:
+    go = lazy_import("plotly.graph_objects", extra="plots")
 
 
 class AnimatedLatticeSeries:
@@ -22,6 +40,10 @@ class AnimatedLatticeSeries:
         colorscale: str = "Viridis",
         zmin: float | None = None,
         zmax: float | None = None,
+        max_frames: int = 200,
+        max_side: int = 200,
+        max_bytes: int = 16 * 2**20,
+        encoding: str = "float",
     ) -> None:
         assert (
             0 <= experiment_id < len(runner.experiments)
@@ -38,23 +60,28 @@ class AnimatedLatticeSeries:
             ),
         )
         _plot_title = f"{plot_title}<br>{params_data[0]}"
-        series = experiment.series[series_name]
-        _zmin, _zmax = cls.calculate_global_min_max(series)
-        zmin = _zmin if zmin is None else zmin
-        zmax = _zmax if zmax is None else zmax
-
+        steps, traces = cls.encoded_frames(
+            experiment.series[series_name],
+            max_frames=max_frames,
+            max_side=max_side,
+            max_bytes=max_bytes,
+            encoding=encoding,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+        )
         figure = go.Figure(
             frames=[
                 go.Frame(
-                    data=[cls.heatmap(data=series[i], zmax=zmax, zmin=zmin, colorscale=colorscale)],
+                    data=[trace],
                     layout=go.Layout(title_text=_plot_title),
-                    name=f"Step {i}",
+                    name=f"Step {step}",
                 )
-                for i in range(len(series))
+                for step, trace in zip(steps, traces)
             ]
         )
 
-        figure.add_trace(cls.heatmap(data=series[0], zmax=zmax, zmin=zmin, colorscale=colorscale))
+        figure.add_trace(traces[0])
 
         sliders = [
             {
@@ -65,10 +92,10 @@ class AnimatedLatticeSeries:
                 "steps": [
                     {
                         "args": [[f.name], cls.frame_args(0)],
-                        "label": str(k),
+                        "label": str(step),
                         "method": "animate",
                     }
-                    for k, f in enumerate(figure.frames)
+                    for step, f in zip(steps, figure.frames)
                 ],
             }
         ]
@@ -146,32 +173,93 @@ class AnimatedLatticeSeries:
             "transition": {"duration": duration, "easing": "linear"},
         }
 
+    @classmethod
+    def encoded_frames(
+        cls,
+        series: Sequence[List[List[float]]],
+        max_frames: int = 200,
+        max_side: int = 200,
+        max_bytes: int = 16 * 2**20,
+        encoding: str = "float",
+        zmin: float | None = None,
+        zmax: float | None = None,
+        colorscale: str = "Viridis",
+    ) -> Tuple[List[int], List[Any]]:
+        # Steps and traces of the frames: at most max_frames (fewer if their payload goes
+        # over max_bytes), with at most max_side cells per side, as float or uint8 heatmaps
+        # or as PNG images.
+        assert encoding in ENCODINGS, f"Encoding should be one of {ENCODINGS}."
+        steps = frame_indexes(len(series), max_frames)
+        if zmin is None or zmax is None:
+            _zmin, _zmax = statistics(series).range
+            zmin = _zmin if zmin is None else zmin
+            zmax = _zmax if zmax is None else zmax
+        rgb = palette(colorscale) if encoding == "png" else None
+
+        def encoded(step: int) -> Tuple[Any, int]:
+            lattice, factor = downsample(np.asarray(series[step], dtype=float), max_side)
+            if encoding == "float":
+                return lattice, factor
+            levels = quantize(lattice, zmin, zmax)
+            return (data_uri(png(levels, rgb)) if rgb is not None else levels), factor
+
+        first = encoded(steps[0])
+        allowed = max(2, max_bytes // max(1, payload_size(first[0])))
+        if allowed < len(steps):
+            steps = frame_indexes(len(series), allowed)
+        frames = [first] + [encoded(step) for step in steps[1:]]
+        traces = [
+            cls.trace(frame, encoding, zmin, zmax, colorscale, factor) for frame, factor in frames
+        ]
+        return steps, traces
+
+    @classmethod
+    def trace(
+        cls,
+        frame: Any,
+        encoding: str,
+        zmin: float,
+        zmax: float,
+        colorscale: str = "Viridis",
+        factor: int = 1,
+    ) -> Any:
+        # Downsampled frames keep the coordinates of the original lattice.
+        position = {"dx": factor, "dy": factor, "x0": (factor - 1) / 2, "y0": (factor - 1) / 2}
+        if encoding == "png":
+            return go.Image(
+                source=frame, hovertemplate="x: %{y}<br>y: %{x}<extra></extra>", **position
+            )
+        elif encoding == "uint8":
+            tickvals, ticktext = level_ticks(zmin, zmax)
+            return go.Heatmap(
+                z=frame,
+                colorscale=colorscale,
+                zmin=0,
+                zmax=LEVELS - 1,
+                colorbar={"tickvals": tickvals, "ticktext": ticktext},
+                hovertemplate="x: %{y}<br>y: %{x}<br>level: %{z}<extra></extra>",
+                **position,
+            )
+        return cls.heatmap(frame, zmax, zmin, colorscale, **position)
+
     @classmethod
     def heatmap(
         cls,
-        data: List[List[float]],
+        data: List[List[float]] | np.ndarray,
         zmax: float | None,
         zmin: float | None,
         colorscale: str = "Viridis",
-    ) -> go.Heatmap:
+        **kwargs: Any,
+    ) -> "go.Heatmap":
         return go.Heatmap(
             z=data,
             colorscale=colorscale,
             zmax=zmax,
             zmin=zmin,
             hovertemplate="x: %{y}<br>y: %{x}<br>z: %{z}<extra></extra>",
+            **kwargs,
         )
 
     @classmethod
-    def calculate_global_min_max(cls, series: List[List[List[float]]]) -> Tuple[float, float]:
-        current_min = current_max = 0.0
-        for iteration in series:
-            lattice = sum(iteration, [])
-            try:
-                _min = np.nanmin(lattice)
-                _max = np.nanmax(lattice)
-                current_min = min(current_min, _min)
-                current_max = max(current_max, _max)
-            except RuntimeWarning:
-                pass
-        return _min, _max
+    def calculate_global_min_max(cls, series: Sequence[List[List[float]]]) -> Tuple[float, float]:
+        return statistics(series).range
@@ -1,10 +1,16 @@
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 import numpy as np
-import pandas as pd
-import plotly.graph_objs as go
 
+from simulab.simulation.core.lazy import lazy_import
 from simulab.simulation.core.runner import Runner
+from simulab.simulation.plotters.frames import frame_indexes
+from simulab.simulation.plotters.statistics import statistics
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+else:
+    go = lazy_import("plotly.graph_objects", extra="plots")
 
 
 class CategoricalAnimatedLatticeSeries:
@@ -25,6 +31,7 @@ class CategoricalAnimatedLatticeSeries:
         show_labels: bool = False,
         zmin: float | None = None,
         zmax: float | None = None,
+        max_frames: int = 200,
     ) -> None:
         assert (
             0 <= experiment_id < len(runner.experiments)
@@ -42,41 +49,19 @@ class CategoricalAnimatedLatticeSeries:
         )
         _plot_title = f"{plot_title}<br>{params_data[0]}"
         series = experiment.series[series_name]
-        _zmin, _zmax = cls.calculate_global_min_max(series)
+        steps = frame_indexes(len(series), max_frames)
+        channels = {step: cls.channels(series[step]) for step in steps}
+        _zmin, _zmax = statistics(series, channel=0).range
         zmin = _zmin if zmin is None else zmin
         zmax = _zmax if zmax is None else zmax
         categories = [str(agent_type) for agent_type in range(experiment.agent_types)]
         categories = [all_categories_name] + categories
 
-        frames = []
-        for step in range(len(series)):
-            frame_data = []
-            for category in categories:
-                frame_data.append(
-                    cls.heatmap(
-                        series[step],
-                        zname,
-                        zmin,
-                        zmax,
-                        category,
-                        all_categories_name,
-                        colorscale,
-                        show_labels,
-                    )
-                )
-                frames.append(
-                    go.Frame(
-                        data=frame_data,
-                        layout=go.Layout(title_text=_plot_title),
-                        name=f"Step {step}",
-                    )
-                )
-        figure = go.Figure(frames=frames)
-
-        for category in categories:
-            figure.add_trace(
+        def traces(step: int) -> List["go.Heatmap"]:
+            values, types = channels[step]
+            return [
                 cls.heatmap(
-                    series[0],
+                    (values, types),
                     zname,
                     zmin,
                     zmax,
@@ -85,14 +70,30 @@ class CategoricalAnimatedLatticeSeries:
                     colorscale,
                     show_labels,
                 )
-            )
+                for category in categories
+            ]
+
+        # One frame per step, with a trace per category.
+        figure = go.Figure(
+            frames=[
+                go.Frame(
+                    data=traces(step),
+                    layout=go.Layout(title_text=_plot_title),
+                    name=f"Step {step}",
+                )
+                for step in steps
+            ]
+        )
+        for category, trace in zip(categories, traces(steps[0])):
+            trace.visible = category == all_categories_name
+            figure.add_trace(trace)
 
         category_dropdown = [
             {
                 "label": category,
                 "method": "update",
                 "args": [
-                    {"visible": [cat == category for cat in categories] * len(frames)},
+                    {"visible": [cat == category for cat in categories]},
                     {"title": f"{_plot_title}<br>Category: {category}"},
                 ],
             }
@@ -172,10 +173,10 @@ class CategoricalAnimatedLatticeSeries:
                     "steps": [
                         {
                             "args": [[f.name], cls.frame_args(0)],
-                            "label": str(k // len(categories)),
+                            "label": str(step),
                             "method": "animate",
                         }
-                        for k, f in enumerate(figure.frames)
+                        for step, f in zip(steps, figure.frames)
                     ],
                 }
             ],
@@ -183,10 +184,16 @@ class CategoricalAnimatedLatticeSeries:
 
         figure.show()
 
+    @classmethod
+    def channels(cls, data: List[List[Tuple[float, int]]]) -> Tuple[np.ndarray, np.ndarray]:
+        # Values and categories of a lattice of (value, category) cells.
+        cells = np.asarray(data, dtype=float)
+        return cells[..., 0], cells[..., 1].astype(int)
+
     @classmethod
     def heatmap(
         cls,
-        data: List[List[Tuple[float, int]]],
+        data: List[List[Tuple[float, int]]] | Tuple[np.ndarray, np.ndarray],
         zname: str,
         zmin: float | None,
         zmax: float | None,
@@ -194,25 +201,14 @@ class CategoricalAnimatedLatticeSeries:
         all_categories_name: str,
         colorscale: str = "Viridis",
         show_labels: bool = False,
-    ) -> go.Heatmap:
-        df = pd.DataFrame(
-            [
-                (i, j, value, category)
-                for i, row in enumerate(data)
-                for j, (value, category) in enumerate(row)
-            ]
-        )
-        df.columns = ["y", "x", zname, "category"]
-        z_matrix = df.pivot(index="y", columns="x", values=zname).values
-        category_matrix = df.pivot(index="y", columns="x", values="category").values
-
-        z_matrix, category_matrix = cls.update_z(
+    ) -> "go.Heatmap":
+        z_matrix, category_matrix = data if isinstance(data, tuple) else cls.channels(data)
+        z_matrix, text_matrix = cls.update_z(
             selected_category, all_categories_name, z_matrix, category_matrix
         )
-
         return go.Heatmap(
             z=z_matrix,
-            text=category_matrix if show_labels else None,
+            text=text_matrix if show_labels else None,
             texttemplate="%{text}" if show_labels else None,
             customdata=category_matrix,
             colorscale=colorscale,
@@ -227,15 +223,15 @@ class CategoricalAnimatedLatticeSeries:
         cls,
         selected_category: str,
         all_categories_name: str,
-        z_matrix: List[List[Any]],
-        category_matrix: List[List[str]],
-    ) -> Tuple[List[List[Any]], List[List[str]]]:
+        z_matrix: np.ndarray,
+        category_matrix: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
         if selected_category == all_categories_name:
-            return z_matrix, category_matrix
+            return z_matrix, category_matrix.astype(str)
         else:
             mask = category_matrix == int(selected_category)
             z_masked = np.where(mask, z_matrix, np.nan)
-            text_masked = np.where(mask, category_matrix, "")
+            text_masked = np.where(mask, category_matrix.astype(str), "")
             return z_masked, text_masked
 
     @classmethod
@@ -246,19 +242,3 @@ class CategoricalAnimatedLatticeSeries:
             "fromcurrent": True,
             "transition": {"duration": duration, "easing": "linear"},
         }
-
-    @classmethod
-    def calculate_global_min_max(
-        cls, series: List[List[List[Tuple[float, int]]]]
-    ) -> Tuple[float, float]:
-        current_min = current_max = 0.0
-        for iteration in series:
-            lattice = [cell[0] for cell in sum(iteration, [])]
-            try:
-                _min = np.nanmin(lattice)
-                _max = np.nanmax(lattice)
-                current_min = min(current_min, _min)
-                current_max = max(current_max, _max)
-            except RuntimeWarning:
-                pass
-        return _min, _max
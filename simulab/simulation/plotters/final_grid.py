@@ -1,10 +1,18 @@
-from typing import Any, Dict, List, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
 
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
+from simulab.simulation.core.lazy import lazy_import
 from simulab.simulation.core.runner import Runner
+from simulab.simulation.plotters.frames import downsample
+from simulab.simulation.plotters.statistics import global_range, statistics, value_range
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from plotly import subplots
+else:
+    go = lazy_import("plotly.graph_objects", extra="plots")
+    subplots = lazy_import("plotly.subplots", extra="plots")
 
 
 class FinalGridSeries:
@@ -20,17 +28,28 @@ class FinalGridSeries:
         colorscale: str = "Viridis",
         zmin: float | None = None,
         zmax: float | None = None,
+        page: int = 0,
+        page_size: int | None = 10,
+        max_side: int | None = 100,
+        pooling: str | None = None,
     ) -> None:
+        pages = cls.page_count(runner, page_size)
+        assert 0 <= page < pages, f"Page should be in [0, {pages-1}]"
         params = attributes_to_consider if attributes_to_consider else []
         params_set = set(params).union(runner.experiment_parameters_set.parameters_to_vary)
-        rows = cls.process_series(runner, series_name, params_set)
-        _zmin, _zmax = cls.calculate_global_min_max(rows)
-        zmin = _zmin if zmin is None else zmin
-        zmax = _zmax if zmax is None else zmax
+        rows = cls.process_series(
+            runner, series_name, params_set, page, page_size, max_side, pooling
+        )
+        if zmin is None or zmax is None:
+            # The same colors in every page.
+            _zmin, _zmax = cls.series_min_max(runner, series_name)
+            zmin = _zmin if zmin is None else zmin
+            zmax = _zmax if zmax is None else zmax
 
         figure = cls.make_figure(rows)
+        _plot_title = f"{plot_title}<br>Page {page + 1} of {pages}" if pages > 1 else plot_title
         cls.configure_figure(
-            figure, runner, plot_title, leyend, height, rows, zmin, zmax, colorscale
+            figure, runner, _plot_title, leyend, height, rows, zmin, zmax, colorscale
         )
         cls.configure_heatmaps(figure, rows)
         figure.show()
@@ -55,20 +74,29 @@ class FinalGridSeries:
             agent_types_amount = max_agent_types * len(states)
             tickvals = list(range(agent_types_amount))
             labelalias = {i: f"{i%max_agent_types} {states[i//max_agent_types]}" for i in tickvals}
+            categorical = True
         except KeyError:
             # Its a lattice of agent types with a single state...
-            lattice = sum(experiment.series[series_name][0], [])  # type: ignore[var-annotated]
-            _min, _max = min(lattice), max(lattice)
+            _min, _max = statistics(experiment.series[series_name], steps=(0,)).range
             if _max - _min > max_agent_types:
                 # ...and with intensity levels
                 tickvals = np.linspace(_min, _max + 1, num=(8 * len(runner.experiments)))
                 labelalias = {i: str(i) for i in tickvals}
+                categorical = False
             else:
                 # ...so we should plot just the different agent types
                 tickvals = list(range(max_agent_types))
                 labelalias = {i: f"{i}" for i in tickvals}
+                categorical = True
         finally:
-            return {"tickvals": tickvals, "labelalias": labelalias}
+            return {"tickvals": tickvals, "labelalias": labelalias, "categorical": categorical}
+
+    @classmethod
+    def page_count(cls, runner: Runner, page_size: int | None) -> int:
+        assert page_size is None or page_size > 0, "Page size should be greater than 0."
+        if page_size is None:
+            return 1
+        return max(1, -(-len(runner.experiments) // page_size))
 
     @classmethod
     def process_series(
@@ -76,16 +104,29 @@ class FinalGridSeries:
         runner: Runner,
         series_name: str,
         params: Set[str],
+        page: int = 0,
+        page_size: int | None = None,
+        max_side: int | None = None,
+        pooling: str | None = None,
     ) -> List[Dict[str, Any]]:
+        # Rows of the experiments in the page, with the first and the last lattices reduced
+        # to at most max_side cells per side: by their mean, or by their most common value if
+        # the series is categorical (unless other pooling is given).
         rows = []
         metadata = cls.get_series_metadata(series_name, runner)
+        method = pooling if pooling else ("mode" if metadata["categorical"] else "mean")
+        first = page * page_size if page_size else 0
+        last = first + page_size if page_size else len(runner.experiments)
 
-        for index, experiment in enumerate(runner.experiments, start=1):
+        for index, experiment in enumerate(runner.experiments[first:last], start=1):
             series = experiment.series[series_name]
+            first_lattice, factor = cls.thumbnail(series[0], max_side, method)
+            last_lattice, _ = cls.thumbnail(series[-1], max_side, method)
             data = {
                 "index": index,
-                "first_lattice": series[0],
-                "last_lattice": series[-1],
+                "first_lattice": first_lattice,
+                "last_lattice": last_lattice,
+                "factor": factor,
                 "title": "<br>".join(
                     [f"{attribute}={getattr(experiment, attribute)}" for attribute in params]
                 ),
@@ -96,22 +137,30 @@ class FinalGridSeries:
             rows.append(data)
         return rows
 
+    @classmethod
+    def thumbnail(cls, lattice: Any, max_side: int | None, method: str) -> Tuple[Any, int]:
+        if max_side is None:
+            return lattice, 1
+        return downsample(np.asarray(lattice, dtype=float), max_side, method)
+
+    @classmethod
+    def series_min_max(cls, runner: Runner, series_name: str) -> Tuple[float, float]:
+        # Only the first and the last lattices of each experiment are read, one at a time.
+        return value_range(
+            lattice
+            for experiment in runner.experiments
+            for lattice in (experiment.series[series_name][0], experiment.series[series_name][-1])
+        )
+
     @classmethod
     def calculate_global_min_max(cls, rows: List[Dict[str, Any]]) -> Tuple[float, float]:
-        all_values: List[float] = []
-        for row in rows:
-            all_values.extend(sum(row["first_lattice"], []))
-            all_values.extend(sum(row["last_lattice"], []))
-        try:
-            return np.nanmin(all_values), np.nanmax(all_values)
-        except RuntimeWarning:
-            return 0, 0
+        return global_range(statistics([row["first_lattice"], row["last_lattice"]]) for row in rows)
 
     @classmethod
-    def make_figure(cls, rows: List[Dict[str, Any]]) -> go.Figure:
+    def make_figure(cls, rows: List[Dict[str, Any]]) -> "go.Figure":
         subplot_titles = [row["subplot_titles"][i] for row in rows for i in range(2)]
         row_titles = [row["title"] for row in rows]
-        figure = make_subplots(
+        figure = subplots.make_subplots(
             len(rows),
             2,
             subplot_titles=subplot_titles,
@@ -123,7 +172,7 @@ class FinalGridSeries:
     @classmethod
     def configure_figure(
         cls,
-        figure: go.Figure,
+        figure: "go.Figure",
         runner: Runner,
         plot_title: str,
         leyend: str,
@@ -175,10 +224,13 @@ class FinalGridSeries:
     @classmethod
     def configure_heatmaps(
         cls,
-        figure: go.Figure,
+        figure: "go.Figure",
         rows: List[Dict[str, Any]],
     ) -> None:
         for row in rows:
+            # Thumbnails keep the coordinates of the original lattice.
+            factor = row.get("factor", 1)
+            position = {"dx": factor, "dy": factor, "x0": (factor - 1) / 2, "y0": (factor - 1) / 2}
             lattice_data = [(1, "first_lattice"), (2, "last_lattice")]
             for column, lattice in lattice_data:
                 figure.add_trace(
@@ -186,6 +238,7 @@ class FinalGridSeries:
                         z=row[lattice],
                         coloraxis="coloraxis",
                         hovertemplate="x: %{y}<br>y: %{x}<br>z: %{z}<extra></extra>",
+                        **position,
                     ),
                     row=row["index"],
                     col=column,
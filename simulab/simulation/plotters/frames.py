@@ -0,0 +1,159 @@
+import base64
+import json
+import struct
+import warnings
+import zlib
+from typing import TYPE_CHECKING, Any, List, Tuple
+
+import numpy as np
+
+from simulab.simulation.core.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import plotly.colors as colors
+else:
+    colors = lazy_import("plotly.colors", extra="plots")
+
+ENCODINGS = ("float", "uint8", "png")
+LEVELS = 256
+POOLINGS = ("mean", "mode", "nearest")
+# Evenly spaced stops of the Plotly colorscales most used for lattices, so that they can be
+# sampled without importing Plotly (others, and explicit colorscales, need it).
+COLORSCALES = {
+    "viridis": "440154 482878 3e4989 31688e 26828e 1f9e89 35b779 6ece58 b5de2b fde725",
+    "cividis": "00224e 123570 3b496c 575d6d 707173 8a8678 a59c74 c3b369 e1cc55 fee838",
+    "plasma": "0d0887 46039f 7201a8 9c179e bd3786 d8576b ed7953 fb9f3a fdca26 f0f921",
+    "inferno": "000004 1b0c41 4a0c6b 781c6d a52c60 cf4446 ed6925 fb9b06 f7d13d fcffa4",
+    "magma": "000004 180f3d 440f76 721f81 9e2f7f cd4071 f1605d fd9668 feca8d fcfdbf",
+    "greys": "ffffff f0f0f0 d9d9d9 bdbdbd 969696 737373 525252 252525 000000",
+    "blues": "f7fbff deebf7 c6dbef 9ecae1 6baed6 4292c6 2171b5 08519c 08306b",
+    "hot": "000000 e60000 ffd200 ffffff",
+    "rdbu": "67001f b2182b d6604d f4a582 fddbc7 f7f7f7 d1e5f0 92c5de 4393c3 2166ac 053061",
+}
+
+
+def evenly_spaced(total: int, amount: int) -> List[int]:
+    # At most amount evenly spaced indexes of total, including the first and the last one.
+    if total <= amount:
+        return list(range(total))
+    return sorted(set(np.linspace(0, total - 1, amount).round().astype(int).tolist()))
+
+
+def frame_indexes(total: int, max_frames: int) -> List[int]:
+    assert max_frames >= 2, "At least 2 frames are needed."
+    return evenly_spaced(total, max_frames)
+
+
+def downsample(lattice: np.ndarray, max_side: int, method: str = "mean") -> Tuple[np.ndarray, int]:
+    # Reduces the lattice by blocks of factor x factor cells, to at most max_side cells per
+    # side, by their mean (ignoring NaNs), by their most common value ("mode", for
+    # categorical values) or by the first cell of each block ("nearest"). Returns the
+    # lattice and the factor.
+    assert max_side > 0, "Max side should be greater than 0."
+    assert method in POOLINGS, f"Method should be one of {POOLINGS}."
+    rows, columns = lattice.shape
+    factor = -(-max(rows, columns) // max_side)
+    if factor <= 1:
+        return lattice, 1
+    if method == "nearest":
+        return lattice[::factor, ::factor], factor
+    padded = np.full((-(-rows // factor) * factor, -(-columns // factor) * factor), np.nan)
+    padded[:rows, :columns] = lattice
+    blocks = padded.reshape(padded.shape[0] // factor, factor, padded.shape[1] // factor, factor)
+    if method == "mode":
+        # One count per category, which are expected to be few. Ties go to the lowest one.
+        categories = np.unique(lattice[np.isfinite(lattice)])
+        if not categories.size:
+            return blocks[:, 0, :, 0], factor
+        counts = np.stack([(blocks == category).sum(axis=(1, 3)) for category in categories])
+        return np.where(counts.max(axis=0) > 0, categories[counts.argmax(axis=0)], np.nan), factor
+    with warnings.catch_warnings():
+        # Blocks of NaNs stay NaN.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(blocks, axis=(1, 3)), factor
+
+
+def quantize(lattice: np.ndarray, zmin: float, zmax: float) -> np.ndarray:
+    # Maps [zmin, zmax] to the levels 0..255 (NaNs to 0).
+    scale = (LEVELS - 1) / (zmax - zmin) if zmax > zmin else 0.0
+    levels = np.nan_to_num((lattice - zmin) * scale, nan=0.0)
+    return np.clip(np.rint(levels), 0, LEVELS - 1).astype(np.uint8)
+
+
+def level_ticks(zmin: float, zmax: float, amount: int = 5) -> Tuple[List[float], List[str]]:
+    values = np.linspace(zmin, zmax, amount)
+    return np.linspace(0, LEVELS - 1, amount).tolist(), [f"{value:.3g}" for value in values]
+
+
+def palette(colorscale: str | List[Any]) -> np.ndarray:
+    # The colorscale sampled in 256 RGB colors, one per level.
+    name = colorscale.lower() if isinstance(colorscale, str) else ""
+    if name.removesuffix("_r") in COLORSCALES:
+        colors_hex = COLORSCALES[name.removesuffix("_r")].split()
+        stops = np.array([list(bytes.fromhex(color)) for color in colors_hex], dtype=float)
+        stops = stops[::-1] if name.endswith("_r") else stops
+        positions, samples = np.linspace(0, 1, len(stops)), np.linspace(0, 1, LEVELS)
+        channels = [np.interp(samples, positions, stops[:, channel]) for channel in range(3)]
+        return np.stack(channels, axis=1).round().astype(np.uint8)
+    scale = colors.get_colorscale(colorscale) if isinstance(colorscale, str) else colorscale
+    sampled = colors.sample_colorscale(scale, np.linspace(0, 1, LEVELS).tolist())
+    return np.array([colors.unlabel_rgb(color) for color in sampled]).round().astype(np.uint8)
+
+
+def png(levels: np.ndarray, rgb: np.ndarray) -> bytes:
+    # An indexed PNG (one byte per cell and a palette), written with the standard library.
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    height, width = levels.shape
+    header = struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)
+    rows = np.hstack([np.zeros((height, 1), dtype=np.uint8), levels.astype(np.uint8)])
+    return b"".join(
+        [
+            b"\x89PNG\r\n\x1a\n",
+            chunk(b"IHDR", header),
+            chunk(b"PLTE", rgb.astype(np.uint8).tobytes()),
+            chunk(b"IDAT", zlib.compress(rows.tobytes(), 9)),
+            chunk(b"IEND", b""),
+        ]
+    )
+
+
+def gif_header(height: int, width: int, rgb: np.ndarray, loop: int = 0) -> bytes:
+    # Start of an animated GIF with a global palette of 256 colors, repeated loop times
+    # (0 is forever).
+    screen = struct.pack("<6sHHBBB", b"GIF89a", width, height, 0xF7, 0, 0)
+    repeat = b"!\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00"
+    return screen + rgb.astype(np.uint8).tobytes() + repeat
+
+
+def gif_frame(levels: np.ndarray, delay: int) -> bytes:
+    # One GIF image, shown delay hundredths of a second. Its LZW codes are all literals,
+    # resetting the table every 254 of them to keep codes of 9 bits, so the encoding is
+    # vectorized (the frame is about 9/8 of its raw size).
+    height, width = levels.shape
+    pixels = levels.astype(np.uint16).ravel()
+    codes = np.append(np.insert(pixels, np.arange(0, pixels.size, LEVELS - 2), LEVELS), LEVELS + 1)
+    bits = ((codes[:, np.newaxis] >> np.arange(9)) & 1).astype(np.uint8)
+    data = np.packbits(bits.ravel(), bitorder="little").tobytes()
+    blocks = b"".join(
+        bytes([len(data[i : i + 255])]) + data[i : i + 255] for i in range(0, len(data), 255)
+    )
+    control = b"!\xf9\x04" + struct.pack("<BHBB", 0, delay, 0, 0)
+    descriptor = b"," + struct.pack("<HHHHB", 0, 0, width, height, 0)
+    return control + descriptor + b"\x08" + blocks + b"\x00"
+
+
+GIF_TRAILER = b";"
+
+
+def data_uri(content: bytes) -> str:
+    return "data:image/png;base64," + base64.b64encode(content).decode("ascii")
+
+
+def payload_size(frame: Any) -> int:
+    # Approximate bytes of a frame in the figure JSON.
+    if isinstance(frame, str):
+        return len(frame)
+    return len(json.dumps(np.asarray(frame).tolist()))
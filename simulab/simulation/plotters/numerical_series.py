@@ -1,7 +1,14 @@
-import numpy as np
-import plotly.graph_objects as go
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
+from simulab.simulation.core.lazy import lazy_import
 from simulab.simulation.core.runner import Runner
+from simulab.simulation.plotters.frames import evenly_spaced
+from simulab.simulation.plotters.statistics import BANDS, SeriesBands
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+else:
+    go = lazy_import("plotly.graph_objects", extra="plots")
 
 
 class NumericalSeries:
@@ -17,7 +24,11 @@ class NumericalSeries:
         leyend: str = "",
         xaxes_log: bool = False,
         yaxes_log: bool = False,
+        band: str | None = "std",
+        quantiles: Tuple[float, float] = (0.05, 0.95),
+        max_traces: int | None = 20,
     ) -> None:
+        assert band is None or band in BANDS, f"Band should be None or one of {BANDS}."
         try:
             _use_series_history = (
                 len(runner.experiments) == 1
@@ -35,23 +46,11 @@ class NumericalSeries:
                     raise KeyError(f"History of series named {series_name} not found.")
                 else:
                     series_collection = [
-                        {"y": series, "name": f"# {_id}", "mode": "lines"}
-                        for _id, series in enumerate(series_history)
+                        {"y": series_history[_id], "name": f"# {_id}", "mode": "lines"}
+                        for _id in cls.shown_runs(len(series_history), max_traces)
                     ]
-
-                    min_length = min(map(lambda each: len(each), series_history))
-                    series_history = [each[:min_length] for each in series_history]
-                    average = np.mean(np.array(series_history), axis=0, dtype="object")
-                    series_collection.append(
-                        {
-                            "y": average,
-                            "name": "Average",
-                            "line": {  # type: ignore[dict-item]
-                                "color": "firebrick",
-                                "width": 4,
-                                "dash": "dot",
-                            },
-                        }
+                    series_collection += cls.aggregated(
+                        SeriesBands(series_history), band, quantiles
                     )
                     plot_title = f"{plot_title}<br>n = {len(series_history)}"
             else:
@@ -79,3 +78,44 @@ class NumericalSeries:
             type="log" if yaxes_log else "linear",
         )
         figure.show()
+
+    @classmethod
+    def shown_runs(cls, total: int, max_traces: int | None) -> List[int]:
+        # Evenly spaced runs, so that figures of many repetitions stay readable.
+        return list(range(total)) if max_traces is None else evenly_spaced(total, max_traces)
+
+    @classmethod
+    def aggregated(
+        cls,
+        bands: SeriesBands,
+        band: str | None = "std",
+        quantiles: Tuple[float, float] = (0.05, 0.95),
+    ) -> List[Dict[str, Any]]:
+        # The average of the runs (over those that reached each step) and, below it, the
+        # band between the lower and the upper bound.
+        traces: List[Dict[str, Any]] = []
+        if band is not None:
+            lower, upper = bands.band(band, quantiles)
+            name = "± std" if band == "std" else f"q{quantiles[0]:g} - q{quantiles[1]:g}"
+            traces += [
+                {"y": upper, "name": name, "mode": "lines", "line": {"width": 0}},
+                {
+                    "y": lower,
+                    "name": name,
+                    "mode": "lines",
+                    "line": {"width": 0},
+                    "fill": "tonexty",
+                    "fillcolor": "rgba(178, 34, 34, 0.2)",
+                    "showlegend": False,
+                },
+            ]
+        traces.append(
+            {
+                "y": bands.mean,
+                "name": "Average",
+                "customdata": bands.count,
+                "hovertemplate": "%{y}<br>n = %{customdata}",
+                "line": {"color": "firebrick", "width": 4, "dash": "dot"},
+            }
+        )
+        return traces
@@ -0,0 +1,202 @@
+import os
+import shutil
+import subprocess
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import Any, Deque, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from simulab.simulation.core.runner import Runner
+from simulab.simulation.plotters.frames import (
+    GIF_TRAILER,
+    downsample,
+    frame_indexes,
+    gif_frame,
+    gif_header,
+    palette,
+    png,
+    quantize,
+)
+from simulab.simulation.plotters.statistics import value_range
+
+FORMATS = ("png", "gif", "mp4")
+
+
+def _encoded(
+    lattice: Any,
+    output_format: str,
+    rgb: np.ndarray,
+    zmin: float,
+    zmax: float,
+    max_side: int | None,
+    scale: int,
+    delay: int,
+) -> Tuple[Tuple[int, int], bytes]:
+    # Shape and bytes of one frame: a PNG file, a GIF image or raw RGB pixels. It is a
+    # module function so that process pools can run it.
+    values = np.asarray(lattice, dtype=float)
+    if max_side is not None:
+        values, _ = downsample(values, max_side)
+    levels = quantize(values, zmin, zmax)
+    if scale > 1:
+        levels = levels.repeat(scale, axis=0).repeat(scale, axis=1)
+    if output_format == "png":
+        return levels.shape, png(levels, rgb)
+    elif output_format == "gif":
+        return levels.shape, gif_frame(levels, delay)
+    return levels.shape, rgb[levels].tobytes()
+
+
+class LatticeRenderer:
+    # Writes lattice series as images without Plotly, on machines without a display: a
+    # directory of PNG files, an animated GIF or an MP4 video (with ffmpeg). Frames are read,
+    # encoded and written one at a time, so the memory used does not depend on the length of
+    # the series, which can be a SpilledSeries on disk.
+    @classmethod
+    def save(
+        cls,
+        series_name: str,
+        runner: Runner,
+        experiment_id: int,
+        path: str,
+        **kwargs: Any,
+    ) -> List[str]:
+        assert (
+            0 <= experiment_id < len(runner.experiments)
+        ), f"Experiment id should be in [0, {len(runner.experiments)-1}]"
+        return cls.render(runner.experiments[experiment_id].series[series_name], path, **kwargs)
+
+    @classmethod
+    def render(
+        cls,
+        series: Sequence[Any],
+        path: str,
+        output_format: str | None = None,
+        colorscale: str = "Viridis",
+        zmin: float | None = None,
+        zmax: float | None = None,
+        max_frames: int | None = None,
+        max_side: int | None = None,
+        scale: int = 1,
+        fps: float = 10,
+        executor: Executor | None = None,
+        in_flight: int = 8,
+    ) -> List[str]:
+        # Renders the steps of the series (at most max_frames, evenly spaced) with the colors
+        # and the range of AnimatedLatticeSeries, downsampled to max_side cells per side and
+        # then enlarged scale times. Frames are encoded by the executor if given, with at most
+        # in_flight of them pending. Returns the written files.
+        _format = output_format if output_format else cls.format_of(path)
+        assert _format in FORMATS, f"Output format should be one of {FORMATS}."
+        assert len(series) > 0, "There are no steps to render."
+        assert scale >= 1, "Scale should be at least 1."
+        assert fps > 0, "Frames per second should be greater than 0."
+        steps = frame_indexes(len(series), max_frames) if max_frames else range(len(series))
+        single = _format == "png" and cls.is_file(path)
+        assert not single or len(steps) == 1, "A .png file holds one step, use a directory."
+        if zmin is None or zmax is None:
+            _zmin, _zmax = value_range(series)
+            zmin = _zmin if zmin is None else zmin
+            zmax = _zmax if zmax is None else zmax
+        encode = partial(
+            _encoded,
+            output_format=_format,
+            rgb=palette(colorscale),
+            zmin=zmin,
+            zmax=zmax,
+            max_side=max_side,
+            scale=scale,
+            delay=max(1, round(100 / fps)),
+        )
+        frames = cls.encoded(encode, (series[step] for step in steps), executor, in_flight)
+
+        if single:
+            with open(path, "wb") as file:
+                file.write(next(frames)[1])
+            return [path]
+        elif _format == "png":
+            os.makedirs(path, exist_ok=True)
+            digits = len(str(len(series) - 1))
+            paths = []
+            for step, (_, content) in zip(steps, frames):
+                paths.append(os.path.join(path, f"frame_{step:0{digits}d}.png"))
+                with open(paths[-1], "wb") as file:
+                    file.write(content)
+            return paths
+        elif _format == "gif":
+            with open(path, "wb") as file:
+                for index, ((height, width), content) in enumerate(frames):
+                    if index == 0:
+                        file.write(gif_header(height, width, palette(colorscale)))
+                    file.write(content)
+                file.write(GIF_TRAILER)
+            return [path]
+        cls.write_video(path, frames, fps)
+        return [path]
+
+    @classmethod
+    def format_of(cls, path: str) -> str:
+        # Files are written as their extension says, and anything else is a directory of PNGs.
+        extension = os.path.splitext(path)[1].lower().lstrip(".")
+        return extension if extension in FORMATS else "png"
+
+    @classmethod
+    def is_file(cls, path: str) -> bool:
+        return os.path.splitext(path)[1].lower().lstrip(".") in FORMATS
+
+    @classmethod
+    def encoded(
+        cls,
+        encode: Any,
+        lattices: Iterator[Any],
+        executor: Executor | None = None,
+        in_flight: int = 8,
+    ) -> Iterator[Tuple[Tuple[int, int], bytes]]:
+        # Encoded frames in order. With an executor, the next lattices are submitted while
+        # the first ones are written.
+        if executor is None:
+            yield from (encode(lattice) for lattice in lattices)
+            return
+        assert in_flight > 0, "At least one frame should be in flight."
+        pending: Deque[Future[Tuple[Tuple[int, int], bytes]]] = deque()
+        for lattice in lattices:
+            pending.append(executor.submit(encode, lattice))
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    @classmethod
+    def write_video(
+        cls, path: str, frames: Iterator[Tuple[Tuple[int, int], bytes]], fps: float
+    ) -> None:
+        # Raw RGB frames are piped to ffmpeg, padded to even sides as H.264 needs.
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg is needed to write MP4 files, and it was not found.")
+        process: subprocess.Popen[bytes] | None = None
+        errors = b""
+        try:
+            for (height, width), content in frames:
+                if process is None:
+                    process = subprocess.Popen(
+                        [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo"]
+                        + ["-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps)]
+                        + ["-i", "-", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+                        + ["-pix_fmt", "yuv420p", path],
+                        stdin=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                    )
+                assert process.stdin is not None
+                process.stdin.write(content)
+        except BrokenPipeError:
+            # ffmpeg stopped, its return code and errors are reported below.
+            pass
+        finally:
+            if process is not None:
+                _, errors = process.communicate()
+        if process is not None and process.returncode != 0:
+            message = errors.decode(errors="replace").strip()
+            raise RuntimeError(f"ffmpeg could not write the video: {message}")
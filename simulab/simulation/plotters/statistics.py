@@ -0,0 +1,186 @@
+import warnings
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+HISTOGRAM_BINS = 256
+CACHE_SIZE = 64
+BANDS = ("std", "quantiles")
+
+Key = Tuple[int, Tuple[int, ...], int | None]
+
+
+class SeriesStatistics:
+    # Summary of the finite values of some steps of a series: range, mean and a histogram of
+    # HISTOGRAM_BINS bins over the range, from which quantiles are interpolated.
+    __slots__ = ("count", "minimum", "maximum", "mean", "counts", "edges")
+
+    def __init__(self, steps: Callable[[], Iterator[np.ndarray]]) -> None:
+        # steps gives the finite values of each step. It is read twice, first for the range
+        # and then for the histogram over it, so only one step is in memory at a time.
+        self.count, total = 0, 0.0
+        self.minimum, self.maximum = np.inf, -np.inf
+        for values in steps():
+            if values.size:
+                self.count += int(values.size)
+                total += float(values.sum())
+                self.minimum = min(self.minimum, float(values.min()))
+                self.maximum = max(self.maximum, float(values.max()))
+        if not self.count:
+            self.minimum = self.maximum = 0.0
+        self.mean = total / self.count if self.count else 0.0
+        bounds = (
+            self.minimum,
+            self.maximum if self.maximum > self.minimum else self.minimum + 1,
+        )
+        self.counts = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+        for values in steps():
+            self.counts += np.histogram(values, bins=HISTOGRAM_BINS, range=bounds)[0]
+        self.edges = np.linspace(*bounds, HISTOGRAM_BINS + 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"SeriesStatistics(count={self.count}, minimum={self.minimum}, "
+            f"maximum={self.maximum}, mean={self.mean})"
+        )
+
+    @property
+    def range(self) -> Tuple[float, float]:
+        return self.minimum, self.maximum
+
+    def quantile(self, q: float) -> float:
+        # Exact for 0 and 1, otherwise within a bin of the true value.
+        assert 0 <= q <= 1, "Quantiles should be between 0 and 1."
+        if not self.count:
+            return 0.0
+        cumulative = np.concatenate(([0], np.cumsum(self.counts)))
+        value = float(np.interp(q * self.count, cumulative, self.edges))
+        return min(max(value, self.minimum), self.maximum)
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        return [self.quantile(q) for q in qs]
+
+
+def _finite(lattice: Any, channel: int | None) -> np.ndarray:
+    values = np.asarray(lattice, dtype=float)
+    if channel is not None:
+        values = values[..., channel]
+    return values[np.isfinite(values)]
+
+
+# Statistics by id of the series, steps and channel, with the length and the id of the last
+# value of the series when they were computed. Entries do not reference the series, and
+# are removed by a finalizer when it is collected, before its id can be reused.
+_cache: "OrderedDict[Key, Tuple[Tuple[int, int], SeriesStatistics]]" = OrderedDict()
+_finalizers: "Dict[int, weakref.finalize[[int], Any]]" = {}
+
+
+def _forget(identity: int) -> None:
+    _finalizers.pop(identity, None)
+    for key in [key for key in _cache if key[0] == identity]:
+        del _cache[key]
+
+
+def _watched(series: Sequence[Any]) -> bool:
+    if id(series) not in _finalizers:
+        try:
+            _finalizers[id(series)] = weakref.finalize(series, _forget, id(series))
+        except TypeError:
+            # Like plain lists, which cannot be weakly referenced.
+            return False
+    return True
+
+
+def statistics(
+    series: Sequence[Any],
+    steps: Sequence[int] | None = None,
+    channel: int | None = None,
+) -> SeriesStatistics:
+    # Statistics of the lattices of a series (only the given steps, and only one channel for
+    # lattices of tuples), reduced step by step. They are cached for series that can be
+    # weakly referenced, like those of the models, so other plots of the same run reuse them
+    # while the series does not grow.
+    _steps = tuple(range(len(series))) if steps is None else tuple(s % len(series) for s in steps)
+    key = (id(series), _steps, channel)
+    version = (len(series), id(series[-1]) if len(series) else 0)
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == version:
+        _cache.move_to_end(key)
+        return cached[1]
+
+    result = SeriesStatistics(lambda: (_finite(series[step], channel) for step in _steps))
+    if _watched(series):
+        _cache[key] = (version, result)
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def global_range(all_statistics: Iterable[SeriesStatistics]) -> Tuple[float, float]:
+    # Range of several series, ignoring those without finite values.
+    ranges = [each.range for each in all_statistics if each.count]
+    if not ranges:
+        return 0.0, 0.0
+    return min(minimum for minimum, _ in ranges), max(maximum for _, maximum in ranges)
+
+
+def value_range(lattices: Iterable[Any]) -> Tuple[float, float]:
+    # Range of the finite values of the lattices, as SeriesStatistics, but reading one at a
+    # time (for lattices stored on disk, or too many to stack).
+    minimum, maximum = np.inf, -np.inf
+    for lattice in lattices:
+        values = np.asarray(lattice, dtype=float)
+        finite = values[np.isfinite(values)]
+        if finite.size:
+            minimum, maximum = min(minimum, float(finite.min())), max(maximum, float(finite.max()))
+    return (minimum, maximum) if minimum <= maximum else (0.0, 0.0)
+
+
+def padded(series_collection: Sequence[Sequence[float]]) -> np.ndarray:
+    # Series of different lengths as the rows of a float matrix, padded with NaNs.
+    values = np.full((len(series_collection), max(map(len, series_collection), default=0)), np.nan)
+    for row, series in enumerate(series_collection):
+        values[row, : len(series)] = series
+    return values
+
+
+class SeriesBands:
+    # Step by step aggregate of several runs of a numerical series, which may have stopped at
+    # different steps: how many runs reached each step, and the mean, standard deviation
+    # and quantiles of their values there.
+    __slots__ = ("values", "count", "mean", "std")
+
+    def __init__(self, series_collection: Sequence[Sequence[float]]) -> None:
+        assert series_collection, "There are no series to aggregate."
+        self.values = padded(series_collection)
+        self.count = np.isfinite(self.values).sum(axis=0)
+        with warnings.catch_warnings():
+            # Steps without finite values are NaN.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            self.mean = np.nanmean(self.values, axis=0)
+            self.std = np.nanstd(self.values, axis=0)
+
+    def __len__(self) -> int:
+        return int(self.values.shape[1])
+
+    def quantile(self, q: float) -> np.ndarray:
+        assert 0 <= q <= 1, "Quantiles should be between 0 and 1."
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.asarray(np.nanquantile(self.values, q, axis=0))
+
+    def band(
+        self, kind: str = "std", quantiles: Tuple[float, float] = (0.05, 0.95)
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # Lower and upper bounds: the mean plus and minus one standard deviation, or the
+        # given quantiles.
+        assert kind in BANDS, f"Band should be one of {BANDS}."
+        if kind == "std":
+            return self.mean - self.std, self.mean + self.std
+        return self.quantile(quantiles[0]), self.quantile(quantiles[1])
+
+
+def clear_cache() -> None:
+    _cache.clear()
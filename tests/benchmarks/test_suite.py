@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+from benchmarks.__main__ import main
+from benchmarks.suite import compare, load, measure, measure_import, run, save
+
+
+def test_measure() -> None:
+    result = measure("RealStateMarket", "Moore", 8, steps=2, plots=False)
+    assert set(result) == {"initialize", "run_step", "snapshot", "criterion"}
+    assert all(seconds >= 0 for seconds in result.values())
+    assert "criterion" not in measure("GameOfLife", "VonNeumann", 8, steps=1, plots=False)
+
+
+def test_run_skips_sizes_over_budget() -> None:
+    skipped = []
+    results = run(
+        models=["Condensation"],
+        neighborhoods=["VonNeumann"],
+        sizes=(16, 8, 32),
+        steps=1,
+        plots=False,
+        budget=0,
+        report=lambda name, metrics: skipped.append(name) if metrics is None else None,
+        imports=False,
+    )
+    assert list(results) == ["Condensation/VonNeumann/8"]
+    assert skipped == ["Condensation/VonNeumann/16", "Condensation/VonNeumann/32"]
+
+
+def test_compare_against_baseline(tmp_path: Path) -> None:
+    results = {"A/B/8": {"run_step": 1.0, "snapshot": 1.0}, "A/B/16": {"run_step": 1.0}}
+    baseline = {"A/B/8": {"run_step": 0.5, "snapshot": 0.9}}
+    save(baseline, tmp_path / "baseline.json")
+    assert load(tmp_path / "baseline.json") == baseline
+    assert compare(results, baseline) == [("A/B/8", "run_step", 2.0)]
+    assert compare(results, baseline, tolerance=1.5) == []
+    assert compare({"import/A": {"heavy_modules": 1}}, {"import/A": {"heavy_modules": 0}}) == [
+        ("import/A", "heavy_modules", float("inf"))
+    ]
+    assert compare({"import/A": {"heavy_modules": 0}}, {"import/A": {"heavy_modules": 0}}) == []
+
+
+def test_imports_do_not_load_heavy_modules() -> None:
+    for module in ("simulab.models.abstract.model", "simulab.simulation.plotters.final_grid"):
+        result = measure_import(module)
+        assert result["heavy_modules"] == 0
+        assert result["seconds"] > 0
+
+
+def test_command_line(tmp_path: Path) -> None:
+    output, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+    arguments = ["--models", "Schelling", "--neighborhoods", "Moore", "--sizes", "8"]
+    arguments += ["--steps", "1", "--no-plots", "--no-imports", "--output", str(output)]
+    assert main(arguments) == 0
+    assert "python" in json.loads(output.read_text())["environment"]
+
+    save({"Schelling/Moore/8": {"run_step": 1e-9}}, baseline)
+    assert main(arguments + ["--baseline", str(baseline)]) == 1
+    save({"Schelling/Moore/8": {"run_step": 1e3}}, baseline)
+    assert main(arguments + ["--baseline", str(baseline)]) == 0
@@ -0,0 +1,55 @@
+import pickle
+from copy import copy, deepcopy
+
+import numpy as np
+import pytest
+
+from simulab.models.abstract.agent import Agent
+from simulab.models.computational.real_state_market.agent import RealStateAgent
+from simulab.simulation.core.lattice import Lattice
+
+
+def test_agents_have_no_instance_dict() -> None:
+    for agent in [Agent(1), Agent.of(1), RealStateAgent(0, (1, 2), 0.5)]:
+        assert not hasattr(agent, "__dict__")
+
+
+def test_shared_agents_are_interned_and_immutable() -> None:
+    agent = Agent.of(np.int64(1))
+    assert agent is Agent.of(1)
+    assert type(agent.agent_type) is int
+    assert agent.is_shared and not Agent(1).is_shared
+    assert agent == Agent(1) and agent != Agent.of(0)
+    with pytest.raises(AttributeError):
+        agent.agent_type = 0
+
+
+def test_shared_agents_are_looked_up_by_their_normalized_type() -> None:
+    agent = Agent.of(2)
+    assert Agent.of("2") is agent  # type: ignore[arg-type]
+    assert agent.is_shared
+
+
+def test_copies_share_basic_agents_only() -> None:
+    lattice = Lattice([[Agent.of(0), Agent.of(1)], [Agent(1), Agent.of(0)]])
+    copied = deepcopy(lattice)
+    assert copied.at(0, 1) is lattice.at(0, 1)
+    assert copied.at(1, 0) is not lattice.at(1, 0)
+    assert copied.at(1, 0) == lattice.at(1, 0)
+    assert copy(Agent.of(1)) is Agent.of(1)
+    assert pickle.loads(pickle.dumps(Agent.of(1))) is Agent.of(1)
+
+
+def test_real_state_agent_copies() -> None:
+    agent = RealStateAgent(1, (2, 3), 0.25, capital=2.0)
+    for clone in [copy(agent), deepcopy(agent), pickle.loads(pickle.dumps(agent))]:
+        assert clone is not agent
+        assert (clone.agent_type, clone.position, clone.utility, clone.capital) == (
+            1,
+            (2, 3),
+            0.25,
+            2.0,
+        )
+    clone = copy(agent)
+    clone.capital = 3.0
+    assert agent.capital == 2.0
@@ -0,0 +1,91 @@
+from typing import List
+
+import pytest
+
+from simulab.models.abstract.model import AbstractLatticeModel, as_series, as_series_with
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.lattice import Lattice
+
+
+class Chain(AbstractLatticeModel):
+    def step(self, i: int, j: int, configuration: Lattice) -> None:
+        pass
+
+    @as_series
+    def a(self) -> int:
+        return 1
+
+    @as_series
+    def x(self) -> int:
+        return 1
+
+    @as_series_with(depends=("a",))
+    def b(self) -> int:
+        return int(self.series["a"][-1]) + 1
+
+    # Depends on a root series and on a deeper one.
+    @as_series_with(depends=("a", "b"))
+    def c(self) -> int:
+        return int(self.series["b"][-1]) + 1
+
+    @as_series_with(depends=("x", "c"))
+    def d(self) -> int:
+        return int(self.series["c"][-1]) + 1
+
+    @property
+    def not_a_series(self) -> List[int]:
+        raise AssertionError("Properties should not be evaluated.")
+
+
+class Shorter(Chain):
+    def d(self) -> int:
+        return 0
+
+
+def test_series_are_registered_once_per_class() -> None:
+    assert sorted(Chain._series) == ["a", "b", "c", "d", "x"]
+    order = Chain._sorted_series_names
+    assert set(order) == {"a", "b", "c", "d", "x"}
+    for name, function in Chain._series.items():
+        assert all(order.index(dep) < order.index(name) for dep in function.__depends__ or ())
+    assert Shorter._sorted_series_names == ["a", "x", "b", "c"]
+    assert "not_a_series" not in Chain._series
+
+
+def test_runs_use_the_registry() -> None:
+    model = Chain(length=4)
+    model.run_with(2, WithoutCriterion(), ())
+    assert model.series == {"a": [1] * 3, "x": [1] * 3, "b": [2] * 3, "c": [3] * 3, "d": [4] * 3}
+    first = model.series
+    model.run_with(1, WithoutCriterion(), ())
+    assert model.series is not first and len(model.series["d"]) == 2
+
+
+def test_schelling_registry() -> None:
+    assert Schelling._sorted_series_names == [
+        "agent_types_lattice",
+        "dissatisfaction_threshold_lattice",
+        "satisfaction_level_lattice",
+        "total_average_satisfaction_level",
+    ]
+
+
+def test_unknown_and_circular_dependencies() -> None:
+    with pytest.raises(AssertionError, match="unknown 'missing'"):
+
+        class Unknown(Chain):
+            @as_series_with(depends=("missing",))
+            def e(self) -> int:
+                return 0
+
+    with pytest.raises(AssertionError, match="Circular"):
+
+        class Circular(Chain):
+            @as_series_with(depends=("f",))
+            def e(self) -> int:
+                return 0
+
+            @as_series_with(depends=("e",))
+            def f(self) -> int:
+                return 0
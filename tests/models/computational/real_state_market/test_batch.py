@@ -0,0 +1,50 @@
+from copy import deepcopy
+from typing import Type
+
+import numpy as np
+import pytest
+
+from simulab.models.computational.real_state_market.batch import TransactionBatch
+from simulab.models.computational.real_state_market.model import RealStateMarket
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.neighborhood import Moore, Neighborhood, VonNeumann
+
+
+def lattice_of(model: RealStateMarket, attribute: str) -> np.ndarray:
+    return np.array(
+        [[getattr(agent, attribute) for agent in row] for row in model.configuration.configuration]
+    )
+
+
+@pytest.mark.parametrize("neighborhood", [VonNeumann, Moore])
+def test_batch_matches_sequential_transactions(neighborhood: Type[Neighborhood]) -> None:
+    model = RealStateMarket(length=12, neighborhood=neighborhood, agent_types=2)
+    model.run_with(0, WithoutCriterion(), ())
+    sequential, batched = deepcopy(model), deepcopy(model)
+
+    candidates = np.random.randint(0, 12, size=(500, 2, 2))
+    for position_1, position_2 in candidates:
+        agent_1 = sequential.get_real_state_agent(*position_1)
+        agent_2 = sequential.get_real_state_agent(*position_2)
+        agent_1.try_sale_against(agent_2, model=sequential, configuration=sequential.configuration)
+    TransactionBatch(batched).run(candidates)
+
+    assert (lattice_of(sequential, "agent_type") == lattice_of(batched, "agent_type")).all()
+    assert np.allclose(lattice_of(sequential, "capital"), lattice_of(batched, "capital"))
+    assert np.allclose(lattice_of(sequential, "utility"), lattice_of(batched, "utility"))
+    for i in range(12):
+        for j in range(12):
+            assert tuple(batched.get_real_state_agent(i, j).position) == (i, j)
+
+
+def test_batched_market_run() -> None:
+    model = RealStateMarket(length=10, neighborhood=Moore, batched_transactions=True)
+    model.run_with(5, WithoutCriterion(), ())
+    initial, final = model.series["agent_types_lattice"][0], model.series["agent_types_lattice"][-1]
+    assert sorted(sum(initial, [])) == sorted(sum(final, []))
+    assert initial != final
+
+
+def test_batched_transactions_need_sequential_updates() -> None:
+    with pytest.raises(AssertionError):
+        RealStateMarket(length=10, batched_transactions=True, update_simultaneously=True)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from simulab.models.computational.real_state_market.formulas import PriceFormula, UtilityFormula
 
 
@@ -13,3 +15,19 @@ def test_price_formula() -> None:
     assert price.B == 0.5
     assert price.neighborhood_size == 8
     assert price.apply(3) == 0.3125
+
+
+def test_utility_formula_over_arrays() -> None:
+    utility = UtilityFormula(0.3)
+    capitals = np.array([[1.0, 2.0], [0.5, 4.0]])
+    prices = np.array([[0.25, 0.5], [1.0, 0.75]])
+    expected = [[utility.apply(c, p) for c, p in zip(*row)] for row in zip(capitals, prices)]
+    assert np.allclose(utility.apply_all(capitals, prices), expected)
+
+
+def test_price_formula_table() -> None:
+    price = PriceFormula(1 / 16, 0.5, 8)
+    table = price.table()
+    assert len(table) == 8 + 2
+    assert table.tolist() == [price.apply(amount) for amount in range(8 + 2)]
+    assert price.apply_all(np.array([3, 3])).tolist() == [0.3125, 0.3125]
@@ -1,9 +1,12 @@
+from typing import Type
+
+import numpy as np
 import pytest
 
 from simulab.models.computational.real_state_market.model import RealStateMarket
 from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
 from simulab.simulation.core.experiment import ExperimentParametersSet
-from simulab.simulation.core.neighborhood import Moore
+from simulab.simulation.core.neighborhood import ExpandedMoore, Moore, Neighborhood, VonNeumann
 from simulab.simulation.core.runner import Runner
 
 experiment_parameters_set = ExperimentParametersSet(
@@ -28,3 +31,26 @@ def test_real_state_market() -> None:
     runner.start()
     for series in runner.experiments[0].series.values():
         assert len(series) == 5 + 1
+
+
+@pytest.mark.parametrize("neighborhood", [VonNeumann, Moore, ExpandedMoore(2)])
+def test_vectorized_utilities_match_scalar_ones(neighborhood: Type[Neighborhood]) -> None:
+    model = RealStateMarket(A=1 / 64, length=12, neighborhood=neighborhood, agent_types=3)
+    model.run_with(2, WithoutCriterion(), ())
+    expected = [[model.updated_utility_of(i, j) for j in range(12)] for i in range(12)]
+    assert np.allclose(model.updated_utility_level_lattice(), expected)  # type: ignore[call-arg]
+    flattened = model.updated_utility_level_lattice(flatten=True)  # type: ignore[call-arg]
+    assert np.allclose(flattened, sum(expected, []))
+
+
+def test_initial_agents_utility() -> None:
+    model = RealStateMarket(length=8, neighborhood=Moore)
+    model.run_with(0, WithoutCriterion(), ())
+    for i in range(8):
+        for j in range(8):
+            agent = model.get_real_state_agent(i, j)
+            similar_amount = model.similar_neighbors_amount(i, j, count_myself=True)
+            assert agent.capital == 1.0
+            assert agent.utility == pytest.approx(
+                model.utility(1.0, model.property_price(similar_amount))
+            )
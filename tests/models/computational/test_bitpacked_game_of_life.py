@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from simulab.models.computational.game_of_life.bitpacked import (
+    BitPackedGameOfLife,
+    next_generation,
+    pack,
+    unpack,
+)
+from simulab.models.computational.game_of_life.model import GameOfLife
+from simulab.models.computational.game_of_life.seeds import Glider
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.lattice import Lattice
+from simulab.simulation.core.neighborhood import Moore, VonNeumann
+
+
+@pytest.mark.parametrize("length", [5, 64, 70, 130])
+def test_pack_and_unpack_are_inverse(length: int) -> None:
+    cells = np.random.randint(2, size=(length, length))
+    words = pack(cells)
+    assert words.dtype == np.dtype("<u8")
+    assert words.shape == (length, -(-length // 64))
+    assert (unpack(words, length) == cells).all()
+
+
+@pytest.mark.parametrize("length", [6, 64, 70])
+def test_bitpacked_engine_matches_game_of_life(length: int) -> None:
+    configuration = np.random.randint(2, size=(length, length))
+    reference = GameOfLife(
+        seeds=[], length=length, configuration=Lattice(configuration), neighborhood=Moore
+    )
+    engine = BitPackedGameOfLife(seeds=[], length=length, configuration=Lattice(configuration))
+    reference.run_with(4, WithoutCriterion(), ())
+    engine.run_with(4, WithoutCriterion(), ())
+
+    for expected, result in zip(
+        reference.series["agent_types_lattice"], engine.series["agent_types_lattice"]
+    ):
+        assert np.array_equal(expected, result)
+
+
+def test_glider_wraps_around_the_board() -> None:
+    engine = BitPackedGameOfLife(seeds=[Glider(0, 0)], length=8)
+    engine.run_with(32, WithoutCriterion(), ())
+    first, last = engine.series["agent_types_lattice"][0], engine.series["agent_types_lattice"][-1]
+    assert np.array_equal(first, last)
+    assert engine.get_agent(0, 1).agent_type == 1
+
+
+def test_next_generation_of_empty_board_is_empty() -> None:
+    words = pack(np.zeros((10, 100)))
+    assert not next_generation(words, 100).any()
+
+
+def test_bitpacked_engine_requires_moore_neighborhood() -> None:
+    with pytest.raises(AssertionError):
+        BitPackedGameOfLife(seeds=[], length=10, neighborhood=VonNeumann)
+
+
+def test_per_cell_steps_read_the_packed_words() -> None:
+    cells = np.random.randint(2, size=(70, 70))
+    engine = BitPackedGameOfLife(seeds=[], length=70, configuration=Lattice(cells))
+    engine.run_with(0, WithoutCriterion(), ())
+    configuration = Lattice.zeros(70)
+    for i in range(70):
+        for j in range(70):
+            engine.step(i, j, configuration)
+    expected = unpack(next_generation(pack(cells), 70), 70)
+    assert np.array_equal(configuration.configuration, expected)
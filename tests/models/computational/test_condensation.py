@@ -1,10 +1,15 @@
+from typing import List
+
+import numpy as np
 import pytest
 
 from simulab.models.computational.condensation.model import Condensation
 from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
 from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.lattice import Lattice
 from simulab.simulation.core.neighborhood import Moore
 from simulab.simulation.core.runner import Runner
+from simulab.simulation.core.scheduler import Checkerboard, RowMajor, Scheduler
 
 experiment_parameters_set = ExperimentParametersSet(
     length=[50],
@@ -27,3 +32,73 @@ def test_real_state_market() -> None:
     runner.start()
     for series in runner.experiments[0].series.values():
         assert len(series) == 5 + 1
+
+
+def test_active_set_updates_match_full_sweeps() -> None:
+    configuration = Lattice.with_probability(0.3, 20)
+    full = Condensation(probability=0.3, length=20, configuration=configuration, neighborhood=Moore)
+    active = Condensation(
+        probability=0.3,
+        length=20,
+        configuration=configuration,
+        neighborhood=Moore,
+        update_active_only=True,
+        full_sweep_threshold=1.0,
+    )
+    full.run_with(8, WithoutCriterion(), ())
+    active.run_with(8, WithoutCriterion(), ())
+    assert full.series["agent_types_lattice"] == active.series["agent_types_lattice"]
+    assert len(active._active) < 20 * 20  # type: ignore[arg-type]
+
+
+class PerCellCondensation(Condensation):
+    def _independent_batch(self) -> bool:
+        return False
+
+
+@pytest.mark.parametrize("scheduler", [RowMajor(), Checkerboard()])
+def test_batches_match_per_cell_steps(scheduler: Scheduler) -> None:
+    configuration = Lattice.with_probability(0.3, 20)
+    models = [
+        model(
+            probability=0.3,
+            length=20,
+            configuration=configuration,
+            neighborhood=Moore,
+            scheduler=scheduler,
+        )
+        for model in [Condensation, PerCellCondensation]
+    ]
+    for model in models:
+        model.run_with(8, WithoutCriterion(), ())
+    assert models[0].series["agent_types_lattice"] == models[1].series["agent_types_lattice"]
+
+
+def test_lattice_arrays_are_built_once_per_step(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = Condensation(probability=0.3, length=20, neighborhood=Moore, scheduler=Checkerboard())
+    model.run_with(0, WithoutCriterion(), ())
+    counted: List[np.ndarray] = []
+    count = model.neighborhood.count
+    monkeypatch.setattr(
+        model.neighborhood, "count", lambda mask: counted.append(mask) or count(mask)
+    )
+    for _ in range(3):
+        model.run_step()
+    assert len(counted) == 3
+
+
+def test_small_active_sets_do_not_scan_the_lattice(monkeypatch: pytest.MonkeyPatch) -> None:
+    configuration = Lattice.zeros(40)
+    for i, j in [(10, 10), (10, 11), (10, 12), (11, 10)]:
+        configuration.set(i, j, 1)
+    model = Condensation(
+        probability=0.0,
+        length=40,
+        configuration=configuration,
+        neighborhood=Moore,
+        update_active_only=True,
+    )
+    model.run_with(1, WithoutCriterion(), ())
+    assert model._active is not None and 0 < len(model._active) < 40
+    monkeypatch.setattr(model, "_process_lattice_with", None)
+    model.run_step()
@@ -1,11 +1,12 @@
 import pytest
 
 from simulab.models.computational.game_of_life.model import GameOfLife
-from simulab.models.computational.game_of_life.seeds import Blinker
+from simulab.models.computational.game_of_life.seeds import Blinker, Glider
 from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
 from simulab.simulation.core.experiment import ExperimentParametersSet
 from simulab.simulation.core.neighborhood import Moore
 from simulab.simulation.core.runner import Runner
+from simulab.simulation.core.scheduler import Checkerboard, RowMajor, Scheduler
 
 experiment_parameters_set = ExperimentParametersSet(
     length=[30, 40],
@@ -28,3 +29,35 @@ def test_real_state_market() -> None:
     runner.start()
     for series in runner.experiments[0].series.values():
         assert len(series) == 5 + 1
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.1, 1.0])
+def test_active_set_updates_match_full_sweeps(threshold: float) -> None:
+    seeds = [Glider(1, 1), Blinker(10, 10)]
+    full = GameOfLife(seeds=seeds, length=20, neighborhood=Moore)
+    active = GameOfLife(
+        seeds=seeds,
+        length=20,
+        neighborhood=Moore,
+        update_active_only=True,
+        full_sweep_threshold=threshold,
+    )
+    full.run_with(12, WithoutCriterion(), ())
+    active.run_with(12, WithoutCriterion(), ())
+    assert full.series["agent_types_lattice"] == active.series["agent_types_lattice"]
+
+
+class PerCellGameOfLife(GameOfLife):
+    def _independent_batch(self) -> bool:
+        return False
+
+
+@pytest.mark.parametrize("scheduler", [RowMajor(), Checkerboard()])
+def test_batches_match_per_cell_steps(scheduler: Scheduler) -> None:
+    seeds = [Glider(1, 1), Blinker(10, 10)]
+    batched = GameOfLife(seeds=seeds, length=20, neighborhood=Moore, scheduler=scheduler)
+    per_cell = PerCellGameOfLife(seeds=seeds, length=20, neighborhood=Moore, scheduler=scheduler)
+    assert batched._independent_batch() and not per_cell._independent_batch()
+    batched.run_with(12, WithoutCriterion(), ())
+    per_cell.run_with(12, WithoutCriterion(), ())
+    assert batched.series["agent_types_lattice"] == per_cell.series["agent_types_lattice"]
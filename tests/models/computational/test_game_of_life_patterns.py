@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from simulab.models.computational.game_of_life.model import GameOfLife
+from simulab.models.computational.game_of_life.patterns import (
+    Pattern,
+    load_pattern,
+    parse_plaintext,
+    parse_rle,
+)
+from simulab.models.computational.game_of_life.seeds import Blinker, Glider, Pulsar, Seed
+from simulab.simulation.core.lattice import Lattice
+
+GLIDER_RLE = """#N Glider
+#C A comment
+x = 3, y = 3, rule = B3/S23
+bob$2bo$3o!
+"""
+
+GLIDER_PLAINTEXT = """!Name: Glider
+!
+.O.
+..O
+OOO
+"""
+
+
+def test_parse_rle() -> None:
+    assert np.array_equal(parse_rle(GLIDER_RLE), Glider.pattern)
+
+
+def test_parse_rle_with_empty_rows_and_multiline_body() -> None:
+    cells = parse_rle("x = 4, y = 5\n2o$\n3$3bo!")
+    assert cells.shape == (5, 4)
+    assert cells[0].tolist() == [1, 1, 0, 0]
+    assert cells[4].tolist() == [0, 0, 0, 1]
+    assert cells[1:4].sum() == 0
+
+
+def test_parse_plaintext() -> None:
+    assert np.array_equal(parse_plaintext(GLIDER_PLAINTEXT), Glider.pattern)
+
+
+def test_load_pattern_caches_read_only_arrays(tmp_path: Path) -> None:
+    path = tmp_path / "glider.rle"
+    path.write_text(GLIDER_RLE)
+    cells = load_pattern(str(path))
+    assert cells is load_pattern(str(path))
+    assert not cells.flags.writeable
+
+    with pytest.raises(ValueError):
+        load_pattern(str(tmp_path / "glider.lif"))
+
+
+def test_load_pattern_reads_edited_files_again(tmp_path: Path) -> None:
+    path = tmp_path / "pattern.cells"
+    path.write_text(GLIDER_PLAINTEXT)
+    glider = load_pattern(path)
+    path.write_text("OOO")
+    # Some file systems keep the modification time in seconds.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    blinker = load_pattern(path)
+    assert blinker.shape == (1, 3) and glider.shape == (3, 3)
+    assert blinker is load_pattern(path)
+
+
+def test_pattern_from_file(tmp_path: Path) -> None:
+    path = tmp_path / "glider.cells"
+    path.write_text(GLIDER_PLAINTEXT)
+    pattern = Pattern.from_file(1, 2, path)
+    assert str(pattern) == "glider(1,2)"
+    assert np.array_equal(pattern.pattern, Glider.pattern)
+
+
+def test_apply_all_matches_applying_one_by_one() -> None:
+    seeds = [Glider(0, 0), Blinker(10, 10), Pulsar(20, 20), Pattern.from_rle(5, 30, GLIDER_RLE)]
+    one_by_one = Lattice.zeros(40)
+    for seed in seeds:
+        seed.apply_on(one_by_one)
+    at_once = Lattice.zeros(40)
+    Seed.apply_all(seeds, on=at_once)
+
+    assert one_by_one.configuration == at_once.configuration
+    assert np.array(at_once.configuration)[10:13, 10].tolist() == [1, 1, 1]
+
+
+def test_game_of_life_with_patterns() -> None:
+    model = GameOfLife(seeds=[Pattern.from_plaintext(1, 1, GLIDER_PLAINTEXT)], length=10)
+    assert np.array(model._initial_lattice().configuration).sum() == 5
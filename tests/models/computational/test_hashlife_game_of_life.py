@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from simulab.models.computational.game_of_life.bitpacked import BitPackedGameOfLife
+from simulab.models.computational.game_of_life.hashlife import HashLife, HashLifeGameOfLife
+from simulab.models.computational.game_of_life.seeds import Glider, Pulsar
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.lattice import Lattice
+
+
+def test_quadtree_round_trip_is_canonical() -> None:
+    engine = HashLife()
+    cells = np.random.randint(2, size=(16, 16))
+    node = engine.from_array(cells)
+    assert node.level == 4
+    assert node.population == cells.sum()
+    assert (engine.to_array(node) == cells).all()
+    assert engine.from_array(cells) is node
+    assert engine.cell(node, 3, 5) == cells[3, 5]
+
+
+@pytest.mark.parametrize("generations_per_step", [1, 3, 8])
+def test_hashlife_matches_bitpacked_engine(generations_per_step: int) -> None:
+    configuration = Lattice(np.random.randint(2, size=(16, 16)))
+    reference = BitPackedGameOfLife(seeds=[], length=16, configuration=configuration)
+    engine = HashLifeGameOfLife(
+        seeds=[],
+        length=16,
+        configuration=configuration,
+        generations_per_step=generations_per_step,
+    )
+    reference.run_with(4 * generations_per_step, WithoutCriterion(), ())
+    engine.run_with(4, WithoutCriterion(), ())
+
+    expected = reference.series["agent_types_lattice"][::generations_per_step]
+    assert engine.generation == 4 * generations_per_step
+    assert np.array_equal(expected, engine.series["agent_types_lattice"])
+
+
+def test_bounded_cache_keeps_results_correct() -> None:
+    configuration = Lattice(np.random.randint(2, size=(8, 8)))
+    reference = BitPackedGameOfLife(seeds=[], length=8, configuration=configuration)
+    engine = HashLifeGameOfLife(seeds=[], length=8, configuration=configuration, cache_size=16)
+    reference.run_with(10, WithoutCriterion(), ())
+    engine.run_with(10, WithoutCriterion(), ())
+    assert len(engine._engine) <= 2 * 16
+    assert np.array_equal(
+        reference.series["agent_types_lattice"], engine.series["agent_types_lattice"]
+    )
+
+
+def test_hashlife_jumps_a_million_generations() -> None:
+    # On a 16 board the glider comes back every 64 generations, and 10**6 = 0 (mod 64).
+    glider = HashLifeGameOfLife(seeds=[Glider(0, 0)], length=16, generations_per_step=10**6)
+    glider.run_with(1, WithoutCriterion(), ())
+    first, last = glider.series["agent_types_lattice"]
+    assert glider.generation == 10**6
+    assert first == last
+
+    # The pulsar has period 3, and 10**6 = 1 (mod 3).
+    pulsar = HashLifeGameOfLife(seeds=[Pulsar(8, 8)], length=32, generations_per_step=10**6)
+    reference = BitPackedGameOfLife(seeds=[Pulsar(8, 8)], length=32)
+    pulsar.run_with(1, WithoutCriterion(), ())
+    reference.run_with(1, WithoutCriterion(), ())
+    assert pulsar.series["agent_types_lattice"][-1] == reference.series["agent_types_lattice"][-1]
+
+
+def test_hashlife_requires_power_of_two_length() -> None:
+    with pytest.raises(AssertionError):
+        HashLifeGameOfLife(seeds=[], length=30)
+
+
+def test_per_cell_steps_read_the_quadtree() -> None:
+    cells = np.random.randint(2, size=(16, 16))
+    engine = HashLifeGameOfLife(seeds=[], length=16, configuration=Lattice(cells))
+    engine.run_with(0, WithoutCriterion(), ())
+    reference = BitPackedGameOfLife(seeds=[], length=16, configuration=Lattice(cells))
+    configuration = Lattice.zeros(16)
+    for i in range(16):
+        for j in range(16):
+            engine.step(i, j, configuration)
+    reference.run_with(1, WithoutCriterion(), ())
+    assert np.array_equal(configuration.configuration, reference.series["agent_types_lattice"][-1])
+
+
+def test_empty_nodes_share_the_bounded_table() -> None:
+    engine = HashLife(cache_size=4)
+    node = engine.empty(10)
+    assert node.level == 10 and node.population == 0
+    assert len(engine) <= 4
+    assert engine.empty(3) is engine.empty(3)
@@ -27,3 +27,8 @@ def test_schelling() -> None:
     runner.start()
     for series in runner.experiments[0].series.values():
         assert len(series) == 5 + 1
+
+
+def test_active_set_updates_are_rejected() -> None:
+    with pytest.raises(AssertionError):
+        Schelling(tolerance=3, length=10, update_active_only=True)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from simulab.models.computational.schelling.vacancy import VacancySchelling
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.neighborhood import Moore
+
+
+@pytest.mark.parametrize("nearest_vacancy", [False, True])
+def test_vacancy_schelling_keeps_counts_consistent(nearest_vacancy: bool) -> None:
+    model = VacancySchelling(
+        tolerance=4,
+        density=0.8,
+        nearest_vacancy=nearest_vacancy,
+        length=30,
+        neighborhood=Moore,
+    )
+    model.run_with(5, WithoutCriterion(), ())
+
+    first = np.array(model.series["agent_types_lattice"][0])
+    last = np.array(model.series["agent_types_lattice"][-1])
+    assert (first != last).any()
+    assert np.array_equal(np.bincount(first.ravel()), np.bincount(last.ravel()))
+    assert model.series["vacancy_rate"][-1] == pytest.approx(0.2)
+
+    expected = np.where(last == model.EMPTY, 0, model.neighborhood.similar_count(last))
+    assert np.array_equal(model.satisfaction_level_lattice(), expected)
+    satisfaction = model.series["total_average_satisfaction_level"]
+    assert satisfaction[-1] > satisfaction[0]
+
+
+def test_nearest_vacancy_is_the_closest_acceptable_one() -> None:
+    # A lonely agent and two satisfied rings, each one around an acceptable vacancy.
+    configuration = np.full((15, 15), 2)
+    configuration[0, 0] = 0
+    for center in [3, 7]:
+        configuration[center - 1 : center + 2, center - 1 : center + 2] = 0
+        configuration[center, center] = 2
+    model = VacancySchelling(
+        tolerance=2, nearest_vacancy=True, length=15, configuration=configuration
+    )
+    model.run_with(1, WithoutCriterion(), ())
+    last = np.array(model.series["agent_types_lattice"][-1])
+    assert last[0, 0] == 2 and last[3, 3] == 0 and last[7, 7] == 2
+
+
+def test_vacancy_schelling_needs_sequential_updates() -> None:
+    with pytest.raises(AssertionError):
+        VacancySchelling(tolerance=2, length=10, update_simultaneously=True)
+    with pytest.raises(AssertionError):
+        VacancySchelling(tolerance=2, density=1, length=10)
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from collections import deque
+
+import pytest
+
+from simulab.models.computational.real_state_market.model import RealStateMarket
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.equilibrium_criterion import EquilibriumCriterion, WithoutCriterion
+from simulab.simulation.core.neighborhood import Moore
+from simulab.simulation.core.profiling import Hook
+
+
+def test_stream_matches_run_with() -> None:
+    model = Schelling(tolerance=3, length=10, neighborhood=Moore)
+    snapshots = list(model.stream(5, series=("agent_types_lattice",)))
+    assert len(snapshots) == 6
+    assert all(list(snapshot) == ["agent_types_lattice"] for snapshot in snapshots)
+    assert isinstance(model.series["agent_types_lattice"], deque)
+    assert len(model.series["agent_types_lattice"]) == 1
+    assert "satisfaction_level_lattice" not in model.series
+
+    model.run_with(5, WithoutCriterion(), ())
+    assert len(model.series["agent_types_lattice"]) == 6
+    assert len(model.series["satisfaction_level_lattice"]) == 6
+
+
+def test_stream_is_lazy() -> None:
+    model = Schelling(tolerance=3, length=10)
+    steps = model.stream(1000)
+    first = next(steps)
+    assert set(first) == set(model._sorted_series_names)
+    assert model.series["agent_types_lattice"][-1] == first["agent_types_lattice"]
+    steps.close()
+
+
+def test_stream_keeps_dependencies_and_criterion_window() -> None:
+    model = RealStateMarket(length=8, neighborhood=Moore)
+    criterion = EquilibriumCriterion("total_average_utility_level", window_size=3, tolerance=10)
+    snapshots = list(model.stream(20, criterion, series=("total_average_utility_level",)))
+    assert len(snapshots) == 4
+    assert model.series["total_average_utility_level"].maxlen == 4
+    assert model.series["utility_level_lattice"].maxlen == 1
+
+
+def test_stream_with_unknown_series() -> None:
+    with pytest.raises(ValueError):
+        next(Schelling(tolerance=3, length=10).stream(1, series=("unknown",)))
+
+
+def test_async_stream() -> None:
+    async def consume() -> list:  # type: ignore[type-arg]
+        model = Schelling(tolerance=3, length=10)
+        return [
+            snapshot["total_average_satisfaction_level"]
+            async for snapshot in model.astream(3, series=("total_average_satisfaction_level",))
+        ]
+
+    assert len(asyncio.run(consume())) == 4
+
+
+def test_async_stream_closes_the_run_when_stopped_early() -> None:
+    class Finished(Hook):
+        experiments = 0
+
+        def after_experiment(self, model: Schelling) -> None:  # type: ignore[override]
+            self.experiments += 1
+
+    hook = Finished()
+
+    async def consume() -> None:
+        model = Schelling(tolerance=3, length=10, hooks=[hook])
+        steps = model.astream(100)
+        async for _ in steps:
+            break
+        await steps.aclose()  # type: ignore[attr-defined]
+
+    asyncio.run(consume())
+    assert hook.experiments == 1
+
+
+def test_async_stream_cancelled_during_a_step() -> None:
+    class Slow(Hook):
+        finished = False
+
+        def before_step(self, model: Schelling, step: int) -> None:  # type: ignore[override]
+            time.sleep(0.2)
+
+        def after_experiment(self, model: Schelling) -> None:  # type: ignore[override]
+            self.finished = True
+
+    hook = Slow()
+
+    async def consume() -> None:
+        async for _ in Schelling(tolerance=3, length=10, hooks=[hook]).astream(100):
+            pass
+
+    async def main() -> None:
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert hook.finished
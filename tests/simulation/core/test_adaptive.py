@@ -0,0 +1,94 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from simulab.models.abstract.model import AbstractLatticeModel, as_series
+from simulab.simulation.core.adaptive import AdaptiveSweep, SweepPoint
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.lattice import Lattice
+
+
+class Transition(AbstractLatticeModel):
+    # Its level jumps from 0 to 1 at threshold, with some noise if asked.
+    def __init__(  # type: ignore[no-untyped-def]
+        self, p: float, threshold: float = 0.37, noise: float = 0.0, *args, **kwargs
+    ):
+        super(Transition, self).__init__(*args, **kwargs)
+        self.p = p
+        self.threshold = threshold
+        self.noise = noise
+
+    def step(self, i: int, j: int, configuration: Lattice) -> None:
+        pass
+
+    @as_series
+    def level(self) -> float:
+        return float(self.p > self.threshold) + self.noise * random.random()
+
+
+def sweep(**kwargs: Any) -> AdaptiveSweep:
+    options = dict(
+        model=Transition,
+        experiment_parameters_set=ExperimentParametersSet(
+            p=[0.0, 0.25, 0.5, 0.75, 1.0], length=[2]
+        ),
+        equilibrium_criterion=WithoutCriterion(),
+        series_name="level",
+        max_steps=1,
+    )
+    options.update(kwargs)
+    return AdaptiveSweep(**options)  # type: ignore[arg-type]
+
+
+def test_new_values_go_to_the_transition() -> None:
+    adaptive = sweep(budget=12, batch=1)
+    adaptive.start()
+    assert len(adaptive.points) == len(adaptive.experiments) == 12
+    assert adaptive.values == sorted(adaptive.values)
+    added = sorted(set(adaptive.values) - {0.0, 0.25, 0.5, 0.75, 1.0})
+    assert all(0.25 < value < 0.5 for value in added)
+    below = max(value for value in adaptive.values if value <= 0.37)
+    above = min(value for value in adaptive.values if value > 0.37)
+    assert above - below == 0.25 / 2**7
+    assert adaptive.experiment_parameters_set["p"] == adaptive.values
+    assert [experiment.p for experiment in adaptive.experiments] == adaptive.values
+
+
+def test_tolerance_and_width_stop_the_sweep() -> None:
+    adaptive = sweep(budget=100, min_width=0.01)
+    adaptive.start()
+    assert len(adaptive.points) == 10
+    flat = sweep(
+        experiment_parameters_set=ExperimentParametersSet(p=[0.5, 0.75, 1.0], length=[2]),
+        budget=100,
+    )
+    flat.start()
+    assert flat.values == [0.5, 0.75, 1.0]
+
+
+def test_repetitions_and_parallel_runs() -> None:
+    random.seed(3)
+    with ThreadPoolExecutor(4) as executor:
+        adaptive = sweep(
+            experiment_parameters_set=ExperimentParametersSet(
+                p=[0, 10, 20], length=[2], noise=[0.5], threshold=[100]
+            ),
+            repetitions=3,
+            budget=9,
+            executor=executor,
+        )
+        adaptive.start()
+    assert len(adaptive.points) == 9
+    assert all(isinstance(value, int) for value in adaptive.values)
+    assert all(len(point.metrics) == 3 and point.std > 0 for point in adaptive.points)
+
+
+def test_wrong_sweeps() -> None:
+    with pytest.raises(AssertionError, match="only one"):
+        sweep(experiment_parameters_set=ExperimentParametersSet(p=[0, 1], length=[2, 3]))
+    with pytest.raises(AssertionError, match="budget"):
+        sweep(budget=2)
+    assert SweepPoint(1, [1.0, 3.0]).std == 1.0
@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, List
+
+import pytest
+
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.runner import AsyncRunner, Execute, Progress
+
+
+def runner(max_steps: int = 3, **kwargs) -> AsyncRunner:  # type: ignore[no-untyped-def]
+    return AsyncRunner(
+        Schelling,
+        ExperimentParametersSet(length=[10], tolerance=[2, 3, 4]),
+        WithoutCriterion(),
+        max_steps=max_steps,
+        **kwargs,
+    )
+
+
+def test_async_runner_reports_progress() -> None:
+    async def main() -> List[Progress]:
+        _runner = runner()
+        events = [event async for event in _runner.progress()]
+        await _runner.run()
+        return events
+
+    events = asyncio.run(main())
+    for experiment in range(3):
+        steps = [e.step for e in events if e.experiment == experiment and not e.finished]
+        finished = [e for e in events if e.experiment == experiment and e.finished]
+        assert steps == [0, 1, 2, 3]
+        assert len(finished) == 1 and finished[0].error is None
+
+
+def test_async_runner_streams_finished_experiments() -> None:
+    async def main() -> List[Schelling]:
+        return [experiment async for experiment in runner().as_completed()]  # type: ignore[misc]
+
+    experiments = asyncio.run(main())
+    assert sorted(experiment.tolerance for experiment in experiments) == [2, 3, 4]
+    assert all(len(experiment.series["agent_types_lattice"]) == 4 for experiment in experiments)
+
+
+def test_async_runner_with_repetitions() -> None:
+    _runner = AsyncRunner(
+        Schelling,
+        ExperimentParametersSet(length=[10], tolerance=[3]),
+        WithoutCriterion(),
+        max_steps=2,
+        repeat=Execute("total_average_satisfaction_level", times=3),
+    )
+    (experiment,) = asyncio.run(_runner.run())
+    assert len(experiment.series_history["total_average_satisfaction_level"]) == 3
+
+
+def test_async_runner_cancellation() -> None:
+    async def main() -> List[Progress]:
+        _runner = runner(max_steps=10**6)
+        events = []
+        async for event in _runner.progress():
+            events.append(event)
+            if event.step == 5:
+                _runner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await _runner.run()
+        return events
+
+    events = asyncio.run(main())
+    finished = [event for event in events if event.finished]
+    assert len(finished) == 3
+    assert all(isinstance(event.error, asyncio.CancelledError) for event in finished)
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=3)
+        self.submitted: List["Future[Any]"] = []
+
+    def submit(self, *args, **kwargs) -> "Future[Any]":  # type: ignore[no-untyped-def]
+        self.submitted.append(super().submit(*args, **kwargs))
+        return self.submitted[-1]
+
+
+def test_async_runner_stops_threads_without_cancelling_them() -> None:
+    async def main() -> None:
+        _runner = runner(max_steps=10**6, executor=executor)
+        async for event in _runner.progress():
+            if event.step == 5:
+                _runner.cancel()
+        assert all(future.cancelled() for future in _runner.futures)
+
+    with RecordingExecutor() as executor:
+        asyncio.run(main())
+    for future in executor.submitted:
+        assert not isinstance(future.exception(), asyncio.CancelledError)
+    assert len(executor.submitted) == 3
+
+
+def test_async_runner_in_processes() -> None:
+    async def main() -> List[Schelling]:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await runner(executor=executor).run()  # type: ignore[return-value]
+
+    experiments = asyncio.run(main())
+    assert all(len(experiment.series["agent_types_lattice"]) == 4 for experiment in experiments)
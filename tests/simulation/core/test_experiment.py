@@ -1,6 +1,15 @@
 import pytest
 
-from simulab.simulation.core.experiment import ExperimentParameters, ExperimentParametersSet
+from simulab.models.computational.real_state_market.model import RealStateMarket
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.experiment import (
+    ExperimentParameters,
+    ExperimentParametersSet,
+    Interval,
+    SampledParametersSet,
+)
+from simulab.simulation.core.neighborhood import Moore, VonNeumann
+from simulab.simulation.core.runner import Runner
 
 
 def test_experiment_parameters_creation() -> None:
@@ -76,3 +85,76 @@ def test_experiment_parameters_set_parameters_to_vary() -> None:
     data = {"length": lengths, "tolerance": tolerances}
     parameters_set = ExperimentParametersSet(**data)
     assert parameters_set.parameters_to_vary == ["length", "tolerance"]
+
+
+def test_intervals() -> None:
+    assert Interval(1, 3).value(0.5) == 2
+    assert [Interval(2, 4, integer=True).value(unit) for unit in (0, 0.34, 0.67, 0.9999)] == [
+        2,
+        3,
+        4,
+        4,
+    ]
+    assert Interval(1e-3, 1e-1, log=True).value(0.5) == pytest.approx(1e-2)
+    assert Interval(1, 100, integer=True, log=True).value(0.99) <= 100
+    with pytest.raises(AssertionError):
+        Interval(0, 1, log=True)
+
+
+def test_sampled_parameters_set() -> None:
+    parameters_set = SampledParametersSet(
+        samples=32,
+        design="latin_hypercube",
+        seed=5,
+        alpha=Interval(0.1, 0.9),
+        A=Interval(1 / 256, 1 / 16, log=True),
+        agent_types=Interval(2, 5, integer=True),
+        neighborhood=[Moore, VonNeumann],
+        length=[10],
+    )
+    assert len(parameters_set) == 32
+    assert parameters_set.parameters_to_vary == ["alpha", "A", "agent_types", "neighborhood"]
+    samples = list(parameters_set)
+    assert samples == list(parameters_set) == parameters_set.samples()
+    assert all(0.1 <= sample.alpha < 0.9 and sample.length == 10 for sample in samples)
+    assert sorted(int((sample.alpha - 0.1) / 0.8 * 32) for sample in samples) == list(range(32))
+    assert set(parameters_set["agent_types"]) == {2, 3, 4, 5}
+    assert parameters_set["neighborhood"].count(Moore) == 16
+    assert samples == list(
+        SampledParametersSet(
+            samples=32,
+            design="latin_hypercube",
+            seed=5,
+            alpha=Interval(0.1, 0.9),
+            A=Interval(1 / 256, 1 / 16, log=True),
+            agent_types=Interval(2, 5, integer=True),
+            neighborhood=[Moore, VonNeumann],
+            length=[10],
+        )
+    )
+    with pytest.raises(AssertionError):
+        SampledParametersSet(samples=4, alpha=(0.1, 0.9))
+
+
+def test_sampled_parameters_set_without_varying_parameters() -> None:
+    parameters_set = SampledParametersSet(samples=3, length=[6])
+    assert parameters_set.parameters_to_vary == []
+    assert [parameters.length for parameters in parameters_set] == [6, 6, 6]
+
+
+def test_runner_with_sampled_parameters() -> None:
+    runner = Runner(
+        RealStateMarket,
+        SampledParametersSet(
+            samples=4, alpha=Interval(0.1, 0.9), B=Interval(0.1, 0.9), length=[6], A=[1 / 64]
+        ),
+        WithoutCriterion(),
+        max_steps=2,
+    )
+    runner.start()
+    assert len(runner.experiments) == 4
+    assert len({experiment.alpha for experiment in runner.experiments}) == 4
+    assert all(
+        len(experiment.series["total_average_capital_level"]) == 3
+        for experiment in runner.experiments
+    )
@@ -54,3 +54,20 @@ def test_lattice_random() -> None:
 def test_lattice_at() -> None:
     grid = Lattice.zeros(3)
     assert all([grid.at(i, j) == 0 for i in range(3) for j in range(3)])
+
+
+def test_lattice_with_vacancies() -> None:
+    grid = Lattice.with_vacancies(3, 0.75, 20)
+    cells = sum(grid.configuration, [])
+    assert cells.count(3) == 100
+    assert set(cells) <= {0, 1, 2, 3}
+
+
+def test_lattice_by_type() -> None:
+    grid = Lattice([[0, 1], [1, 1]])
+    assert grid.by_type() == {0: {(0, 0)}, 1: {(0, 1), (1, 0), (1, 1)}}
+    grid.set(1, 1, 2)
+    assert grid.by_type() == {0: {(0, 0)}, 1: {(0, 1), (1, 0)}, 2: {(1, 1)}}
+    copied = grid.copy_at([(0, 0)])
+    copied.set(0, 0, 1)
+    assert copied.by_type()[0] == set() and grid.by_type()[0] == {(0, 0)}
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+import pytest
+
+from simulab.simulation.core.lazy import LazyModule, lazy_import
+
+
+def test_lazy_module_is_imported_on_first_use() -> None:
+    module = lazy_import("colorsys")
+    assert "not loaded" in repr(module)
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "(loaded)" in repr(module)
+
+
+def test_missing_optional_module_names_its_extra() -> None:
+    module = LazyModule("simulab_missing_module", extra="plots")
+    with pytest.raises(ImportError, match=r"pip install simulab\[plots\]"):
+        module.anything
+    with pytest.raises(ImportError):
+        LazyModule("simulab_missing_module").anything
+
+
+def test_simulab_modules_do_not_import_heavy_dependencies() -> None:
+    code = (
+        "import pkgutil, sys, importlib, simulab\n"
+        "for info in pkgutil.walk_packages(simulab.__path__, 'simulab.'):\n"
+        "    importlib.import_module(info.name)\n"
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'plotly', 'pandas', 'networkx'}))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert output.returncode == 0, output.stderr
+    assert output.stdout.strip() == "[]"
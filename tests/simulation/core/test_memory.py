@@ -0,0 +1,211 @@
+import asyncio
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from simulab.models.abstract.model import AbstractLatticeModel
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.equilibrium_criterion import EquilibriumCriterion, WithoutCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.memory import (
+    MemoryBudget,
+    SpilledSeries,
+    annotation_bytes,
+    estimate,
+    sizeof,
+)
+from simulab.simulation.core.runner import AsyncRunner, Execute, Runner
+
+
+def runner(
+    budget: MemoryBudget,
+    max_steps: int = 20,
+    **kwargs: Any,
+) -> Runner:
+    return Runner(
+        Schelling,
+        ExperimentParametersSet(length=[12], tolerance=[3]),
+        WithoutCriterion(),
+        max_steps=max_steps,
+        memory_budget=budget,
+        **kwargs,
+    )
+
+
+def series_sizes(series: Dict[str, Any]) -> int:
+    return sum(sizeof(values) for values in series.values())
+
+
+def test_annotation_bytes() -> None:
+    assert annotation_bytes(List[List[int]], 10) == annotation_bytes(List[List[bool]], 10)
+    assert annotation_bytes(List[List[float]], 10) > annotation_bytes(List[List[int]], 10)
+    assert annotation_bytes(List[List[Tuple[float, int]]], 10) > annotation_bytes(
+        List[List[float]], 10
+    )
+    assert annotation_bytes(float, 10) == 24
+
+
+def test_estimate_is_close_to_the_measured_series() -> None:
+    model = Schelling(length=20, tolerance=3)
+    model.run_with(10, WithoutCriterion(), ())
+    measured = series_sizes(model.series)
+    assert 0.5 < estimate(model, 10) / measured < 2
+
+
+def test_estimate_grows_with_steps_and_repetitions() -> None:
+    model = Schelling(length=20, tolerance=3)
+    assert estimate(model, 20) > estimate(model, 10)
+    saving = ("agent_types_lattice",)
+    assert estimate(model, 10, 3, saving) > estimate(model, 10, 3) == estimate(model, 10)
+
+
+def test_runner_refuses_to_start_over_the_budget() -> None:
+    _runner = runner(MemoryBudget(limit=2**10))
+    with pytest.raises(MemoryError, match="over the memory budget"):
+        _runner.start()
+    assert all(len(experiment.series_history) == 0 for experiment in _runner.experiments)
+
+
+def test_runner_starts_within_the_budget() -> None:
+    budget = MemoryBudget(limit=2**30)
+    _runner = runner(budget)
+    assert _runner.estimated_memory() < budget.limit
+    _runner.start()
+    experiment = _runner.experiments[0]
+    assert 0 < budget.usage() <= budget.peak
+    assert budget.usage() == budget.usage(experiment)
+    assert budget.steps(experiment) == list(range(21))
+
+
+def test_refuse_policy_stops_the_run_when_the_usage_is_over_the_budget() -> None:
+    budget = MemoryBudget(limit=2**30, measure_every=1)
+    experiment = runner(budget, max_steps=50).experiments[0]
+    experiment.run_with(5, WithoutCriterion(), ())
+    budget.limit = 2 * budget.usage()
+    with pytest.raises(MemoryError, match="policy 'refuse'"):
+        experiment.run_with(50, WithoutCriterion(), ())
+
+
+def test_spill_policy_moves_series_to_disk(tmp_path: Any) -> None:
+    np.random.seed(0)
+    reference = Schelling(length=12, tolerance=3)
+    reference.run_with(20, WithoutCriterion(), ())
+
+    budget = MemoryBudget(limit=series_sizes(reference.series) // 3, policy="spill")
+    budget.directory = str(tmp_path)
+    np.random.seed(0)
+    _runner = runner(budget)
+    _runner.start()
+    experiment = _runner.experiments[0]
+    spilled = [name for name, values in experiment.series.items() if type(values) is SpilledSeries]
+    assert spilled and budget.peak <= budget.limit
+    for name in experiment.series:
+        assert list(experiment.series[name]) == reference.series[name]
+    assert len(list(tmp_path.iterdir())) == len(budget.spilled)
+    budget.cleanup()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_decimate_policy_keeps_the_criterion_window() -> None:
+    criterion = EquilibriumCriterion("total_average_satisfaction_level", 3, tolerance=0.0)
+    budget = MemoryBudget(limit=2**30, policy="decimate", measure_every=1)
+    _runner = Runner(
+        Schelling,
+        ExperimentParametersSet(length=[12], tolerance=[3]),
+        criterion,
+        max_steps=40,
+        memory_budget=budget,
+    )
+    experiment = _runner.experiments[0]
+    experiment.run_with(10, WithoutCriterion(), ())
+    budget.limit, budget.peak = budget.usage() // 2, 0
+
+    _runner.start()
+    steps = budget.steps(experiment)
+    assert budget.peak <= budget.limit
+    assert steps[0] == 0 and steps[-4:] == list(range(37, 41))
+    assert len(steps) < 41
+    assert all(len(values) == len(steps) for values in experiment.series.values())
+
+
+def test_spilled_series_reads_like_a_list(tmp_path: Any) -> None:
+    values = [[[i, i + 1], [i + 2, i + 3]] for i in range(10)]
+    series = SpilledSeries(str(tmp_path / "series.pickle"), keep=3, values=values[:6])
+    series.extend(values[6:])
+    assert series.in_memory == 3
+    assert len(series) == 10
+    assert list(series) == values
+    assert series[2] == values[2] and series[-1] == values[-1]
+    assert series[3:8:2] == values[3:8:2]
+    with pytest.raises(IndexError):
+        series[10]
+    assert list(pickle.loads(pickle.dumps(series))) == values
+    series.close()
+    assert not (tmp_path / "series.pickle").exists()
+
+
+def test_pickled_budget_keeps_its_settings() -> None:
+    budget = MemoryBudget(limit=2**20, policy="decimate")
+    runner(budget)
+    copy = pickle.loads(pickle.dumps(budget))
+    assert (copy.limit, copy.policy) == (budget.limit, budget.policy)
+    assert (copy.usage(), copy.peak, copy.spilled) == (0, 0, [])
+
+
+def test_pickled_budget_leaves_the_watched_models() -> None:
+    budget = MemoryBudget(limit=2**30)
+    _runner = runner(budget)
+    _runner.start()
+    assert budget.usage() > 0
+    assert len(pickle.dumps(budget)) < 2**10
+
+
+def test_budget_runs_in_processes() -> None:
+    async def main() -> List[AbstractLatticeModel]:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            _runner = AsyncRunner(
+                Schelling,
+                ExperimentParametersSet(length=[12], tolerance=[3, 4]),
+                WithoutCriterion(),
+                max_steps=5,
+                memory_budget=MemoryBudget(limit=2**30),
+                executor=executor,
+            )
+            return await _runner.run()
+
+    experiments = asyncio.run(main())
+    assert all(len(experiment.series["agent_types_lattice"]) == 6 for experiment in experiments)
+
+
+def test_budget_assertions() -> None:
+    with pytest.raises(AssertionError):
+        MemoryBudget(limit=0)
+    with pytest.raises(AssertionError):
+        MemoryBudget(limit=2**20, policy="swap")
+    with pytest.raises(AssertionError):
+        Schelling(length=10, tolerance=3, hooks=[MemoryBudget(limit=2**20)]).run_with(
+            1, WithoutCriterion(), ()
+        )
+
+
+def test_repetitions_are_tracked() -> None:
+    budget = MemoryBudget(limit=2**30)
+    _runner = runner(budget, max_steps=5, repeat=Execute("agent_types_lattice", times=3))
+    _runner.start()
+    experiment = _runner.experiments[0]
+    assert len(experiment.series_history["agent_types_lattice"]) == 3
+    lattice = sizeof(experiment.series["agent_types_lattice"])
+    assert budget.usage() > 3 * lattice
+
+
+def test_saved_series_are_counted_once() -> None:
+    saved = MemoryBudget(limit=2**30)
+    saving = runner(saved, max_steps=5, repeat=Execute(*Schelling._sorted_series_names))
+    saving.start()
+    unsaved = MemoryBudget(limit=2**30)
+    not_saving = runner(unsaved, max_steps=5)
+    not_saving.start()
+    assert saved.usage() == unsaved.usage() > 0
@@ -1,6 +1,9 @@
+from typing import List, Tuple, Type
+
+import numpy as np
 import pytest
 
-from simulab.simulation.core.neighborhood import ExpandedMoore, Moore, VonNeumann
+from simulab.simulation.core.neighborhood import ExpandedMoore, Moore, Neighborhood, VonNeumann
 
 
 def test_von_neumann_size() -> None:
@@ -143,3 +146,44 @@ def test_expanded_moore_with_vision_range_of_size_three() -> None:
     assert expanded_moore_class.size() == len(expected_indexes)
     for i, j in expanded_moore.indexes_for(3, 3):
         assert (i, j) in expected_indexes
+
+
+@pytest.mark.parametrize("neighborhood", [VonNeumann, Moore, ExpandedMoore(2)])
+def test_vectorized_counts_match_indexes_for(neighborhood: Type[Neighborhood]) -> None:
+    world = 7
+    instance = neighborhood(world)
+    agent_types = np.random.randint(3, size=(world, world))
+    counts = instance.count(agent_types == 1)
+    similar = instance.similar_count(agent_types)
+    for i in range(world):
+        for j in range(world):
+            neighbors = [agent_types[x, y] for x, y in instance.indexes_for(i, j)]
+            assert counts[i, j] == neighbors.count(1)
+            assert similar[i, j] == neighbors.count(agent_types[i, j])
+
+
+class Knight(Neighborhood):
+    # Only defined by indexes_for, as neighborhoods were before OFFSETS.
+    @classmethod
+    def size(cls) -> int:
+        return 2
+
+    def indexes_for(self, i: int, j: int) -> List[Tuple[int, int]]:
+        return [(self._norm(i + 1), self._norm(j + 2)), (self._norm(i - 2), self._norm(j - 1))]
+
+
+@pytest.mark.parametrize("neighborhood", [Knight, Moore])
+def test_counts_of_neighborhoods_with_and_without_offsets(
+    neighborhood: Type[Neighborhood],
+) -> None:
+    world = 6
+    instance = neighborhood(world)
+    agent_types = np.random.randint(3, size=(world, world))
+    counts = instance.count(agent_types == 1)
+    similar = instance.similar_count(agent_types)
+    assert instance.neighbor_indexes().shape == (world * world, instance.size())
+    for i in range(world):
+        for j in range(world):
+            neighbors = [agent_types[x, y] for x, y in instance.indexes_for(i, j)]
+            assert counts[i, j] == neighbors.count(1)
+            assert similar[i, j] == neighbors.count(agent_types[i, j])
@@ -0,0 +1,33 @@
+from collections import Counter
+
+import pytest
+
+from simulab.simulation.core.pool import IndexedPool
+
+
+def test_indexed_pool_add_and_remove() -> None:
+    pool = IndexedPool([(0, 0), (0, 1), (1, 1)])
+    pool.add((0, 1))
+    assert len(pool) == 3
+
+    pool.remove((0, 0))
+    pool.discard((5, 5))
+    assert (0, 0) not in pool
+    assert set(pool) == {(0, 1), (1, 1)}
+
+    pool.remove((1, 1))
+    pool.add((2, 2))
+    assert set(pool) == {(0, 1), (2, 2)}
+    with pytest.raises(KeyError):
+        pool.remove((1, 1))
+
+
+def test_indexed_pool_sample() -> None:
+    pool = IndexedPool(range(4))
+    pool.remove(0)
+    samples = Counter(pool.sample() for _ in range(3000))
+    assert set(samples) == {1, 2, 3}
+    assert min(samples.values()) > 800
+
+    with pytest.raises(AssertionError):
+        IndexedPool[int]().sample()
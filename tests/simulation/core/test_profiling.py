@@ -0,0 +1,120 @@
+import gc
+from typing import List, Tuple
+
+import pytest
+
+from simulab.models.abstract.model import AbstractLatticeModel
+from simulab.models.computational.condensation.model import Condensation
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core import profiling
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.neighborhood import Moore
+from simulab.simulation.core.profiling import Hook, Profiler
+from simulab.simulation.core.runner import Runner
+
+
+class Recorder(Hook):
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, int | None]] = []
+
+    def before_experiment(self, model: AbstractLatticeModel) -> None:
+        self.events.append(("before_experiment", None))
+
+    def after_experiment(self, model: AbstractLatticeModel) -> None:
+        self.events.append(("after_experiment", None))
+
+    def before_step(self, model: AbstractLatticeModel, step: int) -> None:
+        self.events.append(("before_step", step))
+
+    def after_step(self, model: AbstractLatticeModel, step: int) -> None:
+        self.events.append(("after_step", step))
+
+
+def test_hooks_are_called_around_each_step() -> None:
+    recorder = Recorder()
+    model = Schelling(length=10, tolerance=3, hooks=[recorder])
+    model.run_with(2, WithoutCriterion(), ())
+    assert recorder.events == [
+        ("before_experiment", None),
+        ("before_step", 1),
+        ("after_step", 1),
+        ("before_step", 2),
+        ("after_step", 2),
+        ("after_experiment", None),
+    ]
+
+
+def test_hooks_are_called_when_a_stream_is_closed() -> None:
+    recorder = Recorder()
+    model = Schelling(length=10, tolerance=3, hooks=[recorder])
+    steps = model.stream(10)
+    next(steps)
+    next(steps)
+    steps.close()
+    assert recorder.events[-1] == ("after_experiment", None)
+
+
+def test_profiler_reports_sections() -> None:
+    profiler = Profiler()
+    model = Schelling(length=10, tolerance=3, hooks=[profiler])
+    model.run_with(3, WithoutCriterion(), ())
+    report = profiler.report(model)
+    assert report["experiment"]["calls"] == 1
+    assert report["initialize"]["calls"] == 1
+    assert report["step"]["calls"] == 3
+    assert report["criterion"]["calls"] == 3
+    assert "copy" not in report
+    for name in model._sorted_series_names:
+        assert report[f"series.{name}"]["calls"] == 4
+    assert report["experiment"]["seconds"] >= report["step"]["seconds"] > 0
+    assert report["step"]["max_seconds"] >= report["step"]["mean_seconds"]
+
+
+def test_profiler_measures_the_copy_of_simultaneous_updates() -> None:
+    profiler = Profiler()
+    model = Condensation(length=10, probability=0.5, neighborhood=Moore, hooks=[profiler])
+    model.run_with(2, WithoutCriterion(), ())
+    report = profiler.report(model)
+    assert report["copy"]["calls"] == 2
+    assert report["copy"]["seconds"] <= report["step"]["seconds"]
+
+
+def test_runner_adds_hooks_to_every_experiment() -> None:
+    profiler = Profiler()
+    runner = Runner(
+        Schelling,
+        ExperimentParametersSet(length=[10], tolerance=[2, 3]),
+        WithoutCriterion(),
+        max_steps=2,
+        hooks=[profiler],
+    )
+    runner.start()
+    assert all(experiment.hooks == [profiler] for experiment in runner.experiments)
+    reports = profiler.reports()
+    assert len(reports) == 2
+    assert all(report["step"]["calls"] == 2 for report in reports)
+    summary = profiler.summary()
+    assert summary.count("# Experiment") == 2
+    assert "series.total_average_satisfaction_level" in summary
+
+
+def test_models_without_hooks_are_not_measured() -> None:
+    model = Schelling(length=10, tolerance=3)
+    model.run_with(2, WithoutCriterion(), ())
+    assert model.hooks == []
+
+
+def test_profiler_keeps_collected_experiments_apart(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Every model gets the same id, as a collected model's id reused by the next one would
+    monkeypatch.setattr(profiling, "id", lambda _: 0, raising=False)
+    profiler = Profiler()
+    for _ in range(5):
+        model = Schelling(tolerance=3, length=5, hooks=[profiler])
+        model.run_with(2, WithoutCriterion(), ())
+        del model
+        gc.collect()
+    reports = profiler.reports()
+    assert len(reports) == 5
+    assert all(report["step"]["calls"] == 2 for report in reports)
+    assert all(report["experiment"]["calls"] == 1 for report in reports)
@@ -1,3 +1,75 @@
+import pytest
+
+from simulab.models.computational.condensation.model import Condensation
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.equilibrium_criterion import EquilibriumCriterion, WithoutCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.neighborhood import Moore
+from simulab.simulation.core.runner import Execute, Runner
+
+
 def test_runner_creation() -> None:
-    # Runner()
-    pass
+    runner = Runner(
+        Schelling,
+        ExperimentParametersSet(length=[10, 20], tolerance=[2, 3]),
+        WithoutCriterion(),
+        max_steps=5,
+    )
+    assert len(runner.experiments) == 4
+    assert [(e.length, e.tolerance) for e in runner.experiments] == [
+        (10, 2),
+        (10, 3),
+        (20, 2),
+        (20, 3),
+    ]
+
+
+def test_runner_with_wrong_parameters() -> None:
+    with pytest.raises(TypeError) as error:
+        Runner(Schelling, ExperimentParametersSet(length=[10], size=[3]), WithoutCriterion())
+    assert "ExperimentParametersSet" in error.value.args[0]
+
+
+def test_runner_start() -> None:
+    runner = Runner(
+        Condensation,
+        ExperimentParametersSet(length=[10], probability=[0.5, 0.6], neighborhood=[Moore]),
+        WithoutCriterion(),
+        max_steps=4,
+    )
+    runner.start()
+    for experiment in runner.experiments:
+        assert all(len(series) == 4 + 1 for series in experiment.series.values())
+
+
+def test_runner_stops_in_equilibrium() -> None:
+    runner = Runner(
+        Schelling,
+        ExperimentParametersSet(length=[10], tolerance=[3]),
+        EquilibriumCriterion("total_average_satisfaction_level", window_size=2, tolerance=10),
+        max_steps=50,
+    )
+    runner.start()
+    assert len(runner.experiments[0].series["total_average_satisfaction_level"]) == 3
+
+
+def test_runner_repetitions() -> None:
+    runner = Runner(
+        Schelling,
+        ExperimentParametersSet(length=[10], tolerance=[3]),
+        WithoutCriterion(),
+        max_steps=2,
+        repeat=Execute("total_average_satisfaction_level", "agent_types_lattice", times=3),
+    )
+    runner.start()
+    history = runner.experiments[0].series_history
+    assert len(history["total_average_satisfaction_level"]) == 3
+    assert all(len(series) == 3 for series in history["agent_types_lattice"])
+
+    with pytest.raises(AssertionError):
+        Runner(
+            Schelling,
+            ExperimentParametersSet(length=[10], tolerance=[2, 3]),
+            WithoutCriterion(),
+            repeat=Execute("total_average_satisfaction_level", times=2),
+        )
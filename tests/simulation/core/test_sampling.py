@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from simulab.simulation.core.sampling import DESIGNS, primes, unit_samples
+
+
+def test_designs_are_deterministic_from_the_seed() -> None:
+    for design in DESIGNS:
+        points = unit_samples(design, 64, 5, seed=7)
+        assert points.shape == (64, 5) and (0 <= points).all() and (points < 1).all()
+        assert (points == unit_samples(design, 64, 5, seed=7)).all()
+        assert (points != unit_samples(design, 64, 5, seed=8)).any()
+    with pytest.raises(AssertionError):
+        unit_samples("grid", 4, 2)
+
+
+def test_latin_hypercube_strata() -> None:
+    points = unit_samples("latin_hypercube", 50, 6, seed=1)
+    for column in points.T:
+        assert sorted((column * 50).astype(int).tolist()) == list(range(50))
+
+
+def test_sobol_sequence() -> None:
+    assert unit_samples("sobol", 8, 3, seed=None).tolist() == [
+        [0.0, 0.0, 0.0],
+        [0.5, 0.5, 0.5],
+        [0.75, 0.25, 0.25],
+        [0.25, 0.75, 0.75],
+        [0.375, 0.375, 0.625],
+        [0.875, 0.875, 0.125],
+        [0.625, 0.125, 0.875],
+        [0.125, 0.625, 0.375],
+    ]
+    # The first 2^k points have one point in each interval of 1 / 2^k, also scrambled.
+    for seed in (None, 3):
+        points = unit_samples("sobol", 1024, 16, seed=seed)
+        for column in points.T:
+            assert sorted((column * 1024).astype(int).tolist()) == list(range(1024))
+    with pytest.raises(AssertionError, match="halton"):
+        unit_samples("sobol", 4, 17)
+
+
+def test_halton_sequence() -> None:
+    assert primes(5) == [2, 3, 5, 7, 11]
+    points = unit_samples("halton", 4, 2, seed=None)
+    assert np.allclose(points, [[0, 0], [1 / 2, 1 / 3], [1 / 4, 2 / 3], [3 / 4, 1 / 9]])
+    scrambled = unit_samples("halton", 27, 2, seed=2)
+    assert sorted((scrambled[:, 1] * 27 + 1e-9).astype(int).tolist()) == list(range(27))
+
+
+@pytest.mark.parametrize("design", DESIGNS)
+def test_designs_without_dimensions(design: str) -> None:
+    assert unit_samples(design, 3, 0).shape == (3, 0)
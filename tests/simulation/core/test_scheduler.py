@@ -0,0 +1,131 @@
+from collections import Counter
+from typing import List, Type
+
+import numpy as np
+import pytest
+
+from simulab.models.abstract.agent import Agent
+from simulab.models.abstract.model import AbstractLatticeModel, as_series
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.lattice import Lattice
+from simulab.simulation.core.neighborhood import ExpandedMoore, Moore, Neighborhood, VonNeumann
+from simulab.simulation.core.scheduler import (
+    COLORINGS_CACHE_SIZE,
+    ByAgentType,
+    Checkerboard,
+    EventDriven,
+    RandomAsynchronous,
+    RandomPermutation,
+    RowMajor,
+)
+
+
+def schelling(length: int = 12, **kwargs) -> Schelling:  # type: ignore[no-untyped-def]
+    model = Schelling(tolerance=3, length=length, neighborhood=Moore, **kwargs)
+    model.run_with(0, WithoutCriterion(), ())
+    return model
+
+
+def test_sweeps_update_every_position_once() -> None:
+    model = schelling()
+    all_positions = Counter((i, j) for i in range(12) for j in range(12))
+    for scheduler in [RowMajor(), RandomPermutation(), ByAgentType(), Checkerboard()]:
+        positions = [position for batch in scheduler.batches(model) for position in batch]
+        assert Counter(positions) == all_positions
+    assert RandomPermutation().batches(model) != RowMajor().batches(model)
+
+
+def test_random_asynchronous_batches() -> None:
+    batches = list(RandomAsynchronous(batch_size=50).batches(schelling()))
+    assert [len(batch) for batch in batches] == [50, 50, 44]
+    assert all(0 <= i < 12 and 0 <= j < 12 for batch in batches for i, j in batch)
+    assert len(list(RandomAsynchronous().batches(schelling()))) == 12
+
+
+@pytest.mark.parametrize(
+    "neighborhood, amount",
+    [(VonNeumann, 2), (Moore, 4), (ExpandedMoore(vision_range=2), 9)],
+)
+def test_checkerboard_colors_have_no_neighbors(
+    neighborhood: Type[Neighborhood],
+    amount: int,
+) -> None:
+    colors = Checkerboard.colors(12, neighborhood.OFFSETS)
+    assert len(colors) == amount
+    for color in colors:
+        positions = set(color)
+        for i, j in color:
+            assert positions.isdisjoint(neighborhood(12).indexes_for(i, j))
+
+    with pytest.raises(AssertionError):
+        Checkerboard.colors(10, ExpandedMoore(vision_range=2).OFFSETS)
+
+
+def test_agent_type_positions_stay_consistent() -> None:
+    model = Schelling(tolerance=5, length=12, neighborhood=Moore, scheduler=ByAgentType())
+    model.run_with(5, WithoutCriterion(), ())
+    assert model.series["agent_types_lattice"][0] != model.series["agent_types_lattice"][-1]
+
+    types = np.array(model.series["agent_types_lattice"][-1])
+    for agent_type, positions in model.configuration.by_type().items():
+        assert positions == set(zip(*np.nonzero(types == agent_type)))
+
+
+def test_update_sorted_by_agent_type_uses_its_scheduler() -> None:
+    model = Schelling(tolerance=3, length=12, update_sorted_by_agent_type=True)
+    assert isinstance(model.scheduler, ByAgentType)
+    assert isinstance(Schelling(tolerance=3, length=12).scheduler, RowMajor)
+    with pytest.raises(AssertionError):
+        Schelling(
+            tolerance=3, length=12, update_sorted_by_agent_type=True, scheduler=Checkerboard()
+        )
+
+
+class Majority(AbstractLatticeModel):
+    # Cells take the type of most of their neighbors, so only the unstable ones have a rate.
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        super(Majority, self).__init__(*args, **kwargs)
+        self.updates = 0
+
+    def __majority(self, i: int, j: int) -> int:
+        return int(self.similar_neighbors_amount(i, j, agent_type=1) * 2 > self.neighborhood.size())
+
+    def rate(self, i: int, j: int) -> float:
+        return float(self.get_agent(i, j).agent_type != self.__majority(i, j))
+
+    def step(self, i: int, j: int, configuration: Lattice) -> None:
+        self.updates += 1
+        configuration.set(i, j, _with=Agent.of(self.__majority(i, j)))
+
+    @as_series
+    def agent_types_lattice(self) -> List[List[int]]:
+        return self._process_lattice_with(lambda i, j: self.get_agent(i, j).agent_type)
+
+
+def test_event_driven_processes_only_active_cells() -> None:
+    scheduler = EventDriven(time_step=3.0)
+    model = Majority(length=30, neighborhood=Moore, scheduler=scheduler)
+    model.run_with(20, WithoutCriterion(), ())
+
+    assert scheduler.time(model) == pytest.approx(60)
+    assert all(model.rate(i, j) == 0 for i in range(30) for j in range(30))
+    assert model.updates < 30 * 30
+    assert len(model.series["agent_types_lattice"]) == 21
+
+
+def test_event_driven_with_unit_rates() -> None:
+    scheduler = EventDriven(time_step=2.0)
+    model = Schelling(tolerance=3, length=30, scheduler=scheduler)
+    model.run_with(0, WithoutCriterion(), ())
+    events = sum(len(batch) for batch in scheduler.batches(model))
+    assert 0.9 < events / (2 * 30 * 30) < 1.1
+
+    model.run_with(1, WithoutCriterion(), ())
+    assert scheduler.time(model) == pytest.approx(2)
+
+
+def test_checkerboard_colorings_are_bounded() -> None:
+    for length in range(2, 2 * (COLORINGS_CACHE_SIZE + 2), 2):
+        Checkerboard.colors(length, VonNeumann.OFFSETS)
+    assert Checkerboard.colors.cache_info().currsize <= COLORINGS_CACHE_SIZE
@@ -0,0 +1,53 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from simulab.simulation.plotters.animated_lattice import AnimatedLatticeSeries
+
+
+def series(steps: int, length: int) -> list:  # type: ignore[type-arg]
+    return [np.random.random((length, length)).tolist() for _ in range(steps)]
+
+
+def test_frames_are_decimated_and_downsampled() -> None:
+    steps, traces = AnimatedLatticeSeries.encoded_frames(
+        series(50, 40), max_frames=10, max_side=20, encoding="uint8"
+    )
+    assert len(steps) == len(traces) == 10 and steps[0] == 0 and steps[-1] == 49
+    assert all(isinstance(trace, go.Heatmap) for trace in traces)
+    assert np.asarray(traces[0].z).shape == (20, 20)
+    assert np.asarray(traces[0].z).dtype == np.uint8
+    assert traces[0].dx == 2 and traces[0].x0 == 0.5
+
+
+def test_frames_fit_in_the_size_budget() -> None:
+    _series = series(100, 30)
+    steps, traces = AnimatedLatticeSeries.encoded_frames(
+        _series, max_bytes=10 * 2**10, encoding="uint8"
+    )
+    assert 2 <= len(steps) < 100
+    total = sum(len(str(np.asarray(trace.z).tolist())) for trace in traces)
+    assert total < 2 * 10 * 2**10
+
+
+def test_frame_encodings() -> None:
+    _series = [[[0.0, 1.0], [2.0, 3.0]], [[3.0, 2.0], [1.0, 0.0]]]
+    _, traces = AnimatedLatticeSeries.encoded_frames(_series, encoding="float")
+    assert np.asarray(traces[0].z).tolist() == _series[0]
+    assert (traces[0].zmin, traces[0].zmax) == (0.0, 3.0)
+
+    _, traces = AnimatedLatticeSeries.encoded_frames(_series, encoding="uint8")
+    assert np.asarray(traces[1].z).tolist() == [[255, 170], [85, 0]]
+    assert list(traces[1].colorbar.ticktext) == ["0", "0.75", "1.5", "2.25", "3"]
+
+    _, traces = AnimatedLatticeSeries.encoded_frames(_series, encoding="png", zmin=0, zmax=6)
+    assert isinstance(traces[0], go.Image)
+    assert traces[0].source.startswith("data:image/png;base64,")
+
+
+def test_frames_show_the_values_and_range_of_the_whole_series() -> None:
+    _series = [[[float(step)]] for step in range(10)]
+    _series[4] = [[100.0]]
+    steps, traces = AnimatedLatticeSeries.encoded_frames(_series, max_frames=2)
+    assert steps == [0, 9]
+    assert np.asarray(traces[1].z).tolist() == [[9.0]]
+    assert (traces[1].zmin, traces[1].zmax) == (0.0, 100.0)
@@ -0,0 +1,79 @@
+from typing import List
+from unittest import mock
+
+import numpy as np
+import plotly.graph_objects as go
+
+from simulab.models.computational.real_state_market.model import RealStateMarket
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.runner import Runner
+from simulab.simulation.plotters.categorical_animated_lattice import (
+    CategoricalAnimatedLatticeSeries,
+)
+
+SERIES = "capital_level_and_agent_type_lattice"
+
+
+def started_runner() -> Runner:
+    runner = Runner(
+        RealStateMarket,
+        ExperimentParametersSet(length=[6], A=[1 / 64]),
+        WithoutCriterion(),
+        max_steps=4,
+    )
+    runner.start()
+    return runner
+
+
+def figures(  # type: ignore[no-untyped-def]
+    runner: Runner | None = None, **kwargs
+) -> List[go.Figure]:
+    _runner = runner if runner else started_runner()
+    shown: List[go.Figure] = []
+    with mock.patch.object(go.Figure, "show", autospec=True, side_effect=shown.append):
+        CategoricalAnimatedLatticeSeries.show_up(SERIES, _runner, 0, "Capital", **kwargs)
+    return shown
+
+
+def test_one_frame_per_step_with_a_trace_per_category() -> None:
+    (figure,) = figures()
+    assert [frame.name for frame in figure.frames] == [f"Step {step}" for step in range(5)]
+    assert all(len(frame.data) == 3 for frame in figure.frames)
+    assert [trace.visible for trace in figure.data] == [True, False, False]
+    dropdown = figure.layout.updatemenus[0].buttons
+    assert [list(button.args[0]["visible"]) for button in dropdown] == [
+        [True, False, False],
+        [False, True, False],
+        [False, False, True],
+    ]
+    assert [step.label for step in figure.layout.sliders[0].steps] == ["0", "1", "2", "3", "4"]
+
+
+def test_categories_are_masked() -> None:
+    (figure,) = figures(show_labels=True)
+    everything, first, second = figure.frames[-1].data
+    types = np.asarray(everything.customdata)
+    values = np.asarray(everything.z, dtype=float)
+    assert np.array_equal(np.isnan(np.asarray(first.z, dtype=float)), types != 0)
+    assert np.allclose(np.asarray(second.z, dtype=float)[types == 1], values[types == 1])
+    assert set(np.asarray(first.text)[types != 0].tolist()) == {""}
+
+
+def test_frames_are_decimated() -> None:
+    (figure,) = figures(max_frames=2)
+    assert [frame.name for frame in figure.frames] == ["Step 0", "Step 4"]
+
+
+def test_color_range_covers_every_step() -> None:
+    runner = started_runner()
+    series = runner.experiments[0].series[SERIES]
+    series[2] = [[(1e6, agent_type) for _, agent_type in row] for row in series[2]]
+    (figure,) = figures(runner, max_frames=2)
+    assert [frame.name for frame in figure.frames] == ["Step 0", "Step 4"]
+    assert figure.data[0].zmax == 1e6
+
+
+def test_channels() -> None:
+    values, types = CategoricalAnimatedLatticeSeries.channels([[(1.5, 0), (2.5, 1)]])
+    assert values.tolist() == [[1.5, 2.5]] and types.tolist() == [[0, 1]]
@@ -0,0 +1,64 @@
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from simulab.models.computational.schelling.model import Schelling
+from simulab.simulation.core.equilibrium_criterion import WithoutCriterion
+from simulab.simulation.core.experiment import ExperimentParametersSet
+from simulab.simulation.core.runner import Runner
+from simulab.simulation.plotters.final_grid import FinalGridSeries
+
+
+@pytest.fixture(scope="module")
+def runner() -> Runner:
+    runner = Runner(
+        Schelling,
+        ExperimentParametersSet(length=[12], agent_types=[2], tolerance=[2, 3, 4]),
+        WithoutCriterion(),
+        max_steps=2,
+    )
+    runner.start()
+    return runner
+
+
+def test_pages(runner: Runner) -> None:
+    assert FinalGridSeries.page_count(runner, None) == 1
+    assert FinalGridSeries.page_count(runner, 2) == 2
+    rows = FinalGridSeries.process_series(runner, "agent_types_lattice", {"tolerance"}, 1, 2)
+    assert [row["title"] for row in rows] == ["tolerance=4"]
+    assert rows[0]["index"] == 1
+    rows = FinalGridSeries.process_series(runner, "agent_types_lattice", {"tolerance"}, 0, 2)
+    assert [row["title"] for row in rows] == ["tolerance=2", "tolerance=3"]
+
+
+def test_categorical_thumbnails_keep_the_categories(runner: Runner) -> None:
+    (row,) = FinalGridSeries.process_series(
+        runner, "agent_types_lattice", set(), page_size=1, max_side=4
+    )
+    assert row["factor"] == 3 and row["first_lattice"].shape == (4, 4)
+    assert set(np.unique(row["last_lattice"])) <= {0.0, 1.0}
+
+    figure = FinalGridSeries.make_figure([row])
+    FinalGridSeries.configure_heatmaps(figure, [row])
+    assert all(isinstance(trace, go.Heatmap) for trace in figure.data)
+    assert figure.data[0].dx == 3 and figure.data[0].x0 == 1
+
+
+def test_numerical_thumbnails_are_block_means(runner: Runner) -> None:
+    (row,) = FinalGridSeries.process_series(
+        runner, "satisfaction_level_lattice", set(), page_size=1, max_side=6
+    )
+    lattice = np.asarray(runner.experiments[0].series["satisfaction_level_lattice"][0])
+    assert row["first_lattice"][0, 0] == pytest.approx(lattice[:2, :2].mean())
+
+
+def test_range_of_every_page(runner: Runner) -> None:
+    lattices = [
+        np.asarray(experiment.series["satisfaction_level_lattice"][step])
+        for experiment in runner.experiments
+        for step in (0, -1)
+    ]
+    assert FinalGridSeries.series_min_max(runner, "satisfaction_level_lattice") == (
+        min(lattice.min() for lattice in lattices),
+        max(lattice.max() for lattice in lattices),
+    )
@@ -0,0 +1,79 @@
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from simulab.simulation.plotters.frames import (
+    data_uri,
+    downsample,
+    evenly_spaced,
+    frame_indexes,
+    level_ticks,
+    palette,
+    payload_size,
+    png,
+    quantize,
+)
+
+
+def test_frame_indexes() -> None:
+    assert frame_indexes(5, 10) == [0, 1, 2, 3, 4]
+    indexes = frame_indexes(501, 100)
+    assert len(indexes) == 100 and indexes[0] == 0 and indexes[-1] == 500
+    assert indexes == sorted(set(indexes))
+    with pytest.raises(AssertionError):
+        frame_indexes(10, 1)
+    assert evenly_spaced(10, 1) == [0]
+
+
+def test_downsample() -> None:
+    lattice = np.arange(36, dtype=float).reshape(6, 6)
+    assert downsample(lattice, 6)[1] == 1
+    reduced, factor = downsample(lattice, 3)
+    assert factor == 2 and reduced.shape == (3, 3)
+    assert reduced[0, 0] == np.mean([0, 1, 6, 7])
+    nearest, _ = downsample(lattice, 3, method="nearest")
+    assert nearest[1, 1] == lattice[2, 2]
+    # Blocks on the border ignore the padding.
+    reduced, factor = downsample(np.ones((5, 5)), 2)
+    assert factor == 3 and reduced.shape == (2, 2) and (reduced == 1).all()
+
+
+def test_mode_downsampling() -> None:
+    lattice = np.array([[0, 1, 2, 2, 5], [1, 1, 2, 0, 5], [np.nan] * 5], dtype=float)
+    mode, factor = downsample(lattice, 3, method="mode")
+    assert factor == 2
+    assert mode[0].tolist() == [1.0, 2.0, 5.0]
+    assert np.isnan(mode[1]).all()
+    with pytest.raises(AssertionError):
+        downsample(lattice, 3, method="median")
+
+
+def test_quantize() -> None:
+    levels = quantize(np.array([[0.0, 0.5], [1.0, np.nan]]), 0.0, 1.0)
+    assert levels.dtype == np.uint8
+    assert levels.tolist() == [[0, 128], [255, 0]]
+    assert quantize(np.array([[3.0]]), 3.0, 3.0).tolist() == [[0]]
+    assert level_ticks(0.0, 1.0, 3) == ([0.0, 127.5, 255.0], ["0", "0.5", "1"])
+
+
+def test_png() -> None:
+    levels = np.array([[0, 255], [128, 1]], dtype=np.uint8)
+    rgb = palette("Viridis")
+    assert rgb.shape == (256, 3) and rgb.dtype == np.uint8
+    content = png(levels, rgb)
+    assert content.startswith(b"\x89PNG\r\n\x1a\n")
+    width, height = struct.unpack(">II", content[16:24])
+    assert (width, height) == (2, 2)
+    start = content.index(b"IDAT") + 4
+    (size,) = struct.unpack(">I", content[start - 8 : start - 4])
+    rows = zlib.decompress(content[start : start + size])
+    assert rows == bytes([0, 0, 255, 0, 128, 1])
+    assert data_uri(content).startswith("data:image/png;base64,")
+
+
+def test_payload_size() -> None:
+    floats = np.random.random((50, 50))
+    assert payload_size(quantize(floats, 0, 1)) < payload_size(floats) / 3
+    assert payload_size("abc") == 3
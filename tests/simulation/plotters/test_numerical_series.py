@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+from typing import List
+from unittest import mock
+
+import numpy as np
+import plotly.graph_objects as go
+
+from simulab.simulation.plotters.numerical_series import NumericalSeries
+
+
+def figure(history: List[List[float]], **kwargs) -> go.Figure:  # type: ignore[no-untyped-def]
+    runner = SimpleNamespace(experiments=[SimpleNamespace(series_history={"level": history})])
+    shown: List[go.Figure] = []
+    with mock.patch.object(go.Figure, "show", autospec=True, side_effect=shown.append):
+        NumericalSeries.show_up("level", runner, "Level", "Level", **kwargs)  # type: ignore
+    return shown[0]
+
+
+def test_ragged_runs_are_averaged_by_step() -> None:
+    *runs, upper, lower, average = figure([[1.0, 2.0, 3.0], [3.0, 4.0], [2.0]]).data
+    assert [run.name for run in runs] == ["# 0", "# 1", "# 2"]
+    assert average.name == "Average" and average.y.dtype == float
+    assert average.y.tolist() == [2.0, 3.0, 3.0]
+    assert average.customdata.tolist() == [3, 2, 1]
+    assert np.allclose(upper.y, average.y + [np.sqrt(2 / 3), 1.0, 0.0])
+    assert lower.fill == "tonexty"
+
+
+def test_quantile_bands_and_subsampled_runs() -> None:
+    history = [[float(run)] * (10 + run % 3) for run in range(1000)]
+    result = figure(history, band="quantiles", quantiles=(0.1, 0.9), max_traces=5)
+    assert [trace.name for trace in result.data[:5]] == ["# 0", "# 250", "# 500", "# 749", "# 999"]
+    upper, lower, average = result.data[5:]
+    assert upper.name == "q0.1 - q0.9"
+    assert np.allclose(upper.y[:10], 899.1) and np.allclose(lower.y[:10], 99.9)
+    assert len(average.y) == 12 and average.customdata[-1] == 333
+    assert "n = 1000" in result.layout.title.text
+
+
+def test_without_band_nor_runs() -> None:
+    (average,) = figure([[1.0, 2.0], [3.0, 4.0]], band=None, max_traces=0).data
+    assert average.y.tolist() == [2.0, 3.0]
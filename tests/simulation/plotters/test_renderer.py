@@ -0,0 +1,150 @@
+import shutil
+import struct
+import subprocess
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from simulab.simulation.core.memory import SpilledSeries
+from simulab.simulation.plotters.frames import palette
+from simulab.simulation.plotters.renderer import LatticeRenderer
+from simulab.simulation.plotters.statistics import value_range
+
+
+def series(steps: int, length: int) -> List[np.ndarray]:
+    return [np.full((length, length), float(step)) for step in range(steps)]
+
+
+def png_levels(content: bytes) -> np.ndarray:
+    width, height = struct.unpack(">II", content[16:24])
+    start = content.index(b"IDAT") + 4
+    size = struct.unpack(">I", content[start - 8 : start - 4])[0]
+    rows = np.frombuffer(zlib.decompress(content[start : start + size]), dtype=np.uint8)
+    return rows.reshape(height, width + 1)[:, 1:]
+
+
+def gif_images(content: bytes) -> Tuple[Tuple[int, int], List[np.ndarray]]:
+    # A minimal decoder of the GIFs written by the renderer.
+    width, height = struct.unpack("<HH", content[6:10])
+    position, images = 13 + 768 + 19, []
+    while content[position : position + 1] == b"!":
+        position += 8 + 10 + 1
+        data = b""
+        while content[position]:
+            data += content[position + 1 : position + 1 + content[position]]
+            position += 1 + content[position]
+        position += 1
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little")
+        codes = bits[: len(bits) // 9 * 9].reshape(-1, 9) @ (1 << np.arange(9))
+        end = int(np.flatnonzero(codes == 257)[0])
+        assert all(codes[:end:255] == 256)
+        images.append(np.delete(codes[:end], np.s_[::255]).reshape(height, width))
+    assert content[position:] == b";"
+    return (height, width), images
+
+
+def test_png_frames(tmp_path: Path) -> None:
+    paths = LatticeRenderer.render(series(12, 6), str(tmp_path / "frames"), max_frames=4)
+    assert [Path(path).name for path in paths] == [
+        "frame_00.png",
+        "frame_04.png",
+        "frame_07.png",
+        "frame_11.png",
+    ]
+    assert png_levels(Path(paths[0]).read_bytes()).tolist() == [[0] * 6] * 6
+    assert png_levels(Path(paths[-1]).read_bytes()).tolist() == [[255] * 6] * 6
+
+
+def test_gif_is_downsampled_and_scaled(tmp_path: Path) -> None:
+    lattices = [np.arange(400, dtype=float).reshape(20, 20), np.full((20, 20), np.nan)]
+    path = str(tmp_path / "movie.gif")
+    assert LatticeRenderer.render(lattices, path, max_side=10, scale=3, zmin=0, zmax=399) == [path]
+    content = Path(path).read_bytes()
+    assert content[:6] == b"GIF89a"
+    assert content[13 : 13 + 768] == palette("Viridis").tobytes()
+    shape, images = gif_images(content)
+    assert shape == (30, 30) and len(images) == 2
+    assert images[0][0, :6].tolist() == [7] * 3 + [8] * 3
+    assert images[1].max() == 0
+
+
+def test_parallel_rendering_keeps_the_order(tmp_path: Path) -> None:
+    lattices = series(30, 8)
+    sequential = Path(LatticeRenderer.render(lattices, str(tmp_path / "a.gif"))[0]).read_bytes()
+    with ThreadPoolExecutor(4) as executor:
+        path = LatticeRenderer.render(lattices, str(tmp_path / "b.gif"), executor=executor)
+    assert Path(path[0]).read_bytes() == sequential
+    with ProcessPoolExecutor(2) as executor:
+        path = LatticeRenderer.render(
+            lattices, str(tmp_path / "c.gif"), executor=executor, in_flight=3
+        )
+    assert Path(path[0]).read_bytes() == sequential
+
+
+def test_spilled_series_and_range(tmp_path: Path) -> None:
+    spilled = SpilledSeries(str(tmp_path / "series.pkl"), keep=1, values=series(5, 4))
+    spilled[2][0, 0] = np.inf
+    assert value_range(spilled) == (0.0, 4.0)
+    paths = LatticeRenderer.render(spilled, str(tmp_path / "frames"), colorscale="Greys_r")
+    assert len(paths) == 5
+    assert png_levels(Path(paths[2]).read_bytes()).tolist() == [[128] * 4] * 4
+    spilled.close()
+
+
+def test_rendering_does_not_import_plotly(tmp_path: Path) -> None:
+    code = (
+        "import sys\n"
+        "from simulab.simulation.plotters.renderer import LatticeRenderer\n"
+        f"LatticeRenderer.render([[[0, 1], [2, 3]]], {str(tmp_path / 'a.gif')!r})\n"
+        "print('plotly' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent.parent.parent,
+        text=True,
+    )
+    assert output.stdout.strip() == "False"
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+def test_mp4(tmp_path: Path) -> None:
+    path = str(tmp_path / "movie.mp4")
+    LatticeRenderer.render(series(10, 7), path, fps=5)
+    assert Path(path).stat().st_size > 0
+
+
+def test_mp4_without_ffmpeg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    with pytest.raises(RuntimeError, match="ffmpeg is needed"):
+        LatticeRenderer.render(series(2, 2), str(tmp_path / "movie.mp4"))
+
+
+@pytest.mark.parametrize("read_frames", [True, False])
+def test_ffmpeg_errors_are_reported(
+    read_frames: bool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ffmpeg = tmp_path / "ffmpeg"
+    ffmpeg.write_text(
+        "#!/bin/sh\n"
+        + ("cat > /dev/null\n" if read_frames else "")
+        + "echo 'bad codec' >&2\nexit 1\n"
+    )
+    ffmpeg.chmod(0o755)
+    monkeypatch.setattr(shutil, "which", lambda name: str(ffmpeg))
+    with pytest.raises(RuntimeError, match="bad codec"):
+        LatticeRenderer.render(series(200, 64), str(tmp_path / "movie.mp4"))
+
+
+def test_single_png(tmp_path: Path) -> None:
+    path = str(tmp_path / "last.png")
+    assert LatticeRenderer.render(series(3, 4)[-1:], path, zmin=0, zmax=2) == [path]
+    assert png_levels(Path(path).read_bytes()).tolist() == [[255] * 4] * 4
+    with pytest.raises(AssertionError, match="one step"):
+        LatticeRenderer.render(series(3, 4), path)
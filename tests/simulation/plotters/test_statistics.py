@@ -0,0 +1,117 @@
+import gc
+import weakref
+from typing import Any, Callable, Iterator, List
+
+import numpy as np
+import pytest
+
+from simulab.models.abstract.model import SeriesList
+from simulab.simulation.plotters import statistics as module
+from simulab.simulation.plotters.animated_lattice import AnimatedLatticeSeries
+from simulab.simulation.plotters.final_grid import FinalGridSeries
+from simulab.simulation.plotters.statistics import (
+    HISTOGRAM_BINS,
+    SeriesBands,
+    SeriesStatistics,
+    global_range,
+    statistics,
+)
+
+
+def series() -> List[Any]:
+    return [[[1.0, 2.0], [3.0, float("nan")]], [[-4.0, 0.0], [5.0, 6.0]], [[0.5, 0.5], [0.5, 0.5]]]
+
+
+def test_statistics_of_a_series() -> None:
+    result = statistics(series())
+    assert result.range == (-4.0, 6.0)
+    assert result.count == 11
+    assert result.mean == pytest.approx(15.0 / 11)
+    assert result.quantile(0.5) == pytest.approx(0.5, abs=10 / HISTOGRAM_BINS)
+    assert result.quantiles([0, 1]) == [-4.0, 6.0]
+    assert result.counts.sum() == 11 and len(result.edges) == HISTOGRAM_BINS + 1
+
+
+def test_statistics_of_some_steps_and_channels() -> None:
+    assert statistics(series(), steps=(0, -1)).range == (0.5, 3.0)
+    cells = [[[(1.0, 0), (9.0, 1)]], [[(-1.0, 1), (2.0, 0)]]]
+    assert statistics(cells, channel=0).range == (-1.0, 9.0)
+    assert statistics(cells, channel=1).range == (0.0, 1.0)
+
+
+def test_previous_plotters_returned_the_last_step_range() -> None:
+    # The running minimum and maximum, not those of the last step.
+    assert AnimatedLatticeSeries.calculate_global_min_max(series()) == (-4.0, 6.0)
+    rows = [
+        {"first_lattice": [[1.0, 2.0]], "last_lattice": [[3.0, 4.0]]},
+        {"first_lattice": [[-1.0, 0.0]], "last_lattice": [[0.5, 0.5]]},
+    ]
+    assert FinalGridSeries.calculate_global_min_max(rows) == (-1.0, 4.0)
+
+
+def test_statistics_are_cached_per_series(monkeypatch: pytest.MonkeyPatch) -> None:
+    _series = SeriesList(series())
+    computed = []
+    original = SeriesStatistics.__init__
+
+    def counting(self: SeriesStatistics, steps: Callable[[], Iterator[np.ndarray]]) -> None:
+        computed.append(steps)
+        original(self, steps)
+
+    monkeypatch.setattr(SeriesStatistics, "__init__", counting)
+    first = statistics(_series)
+    assert statistics(_series) is first
+    assert len(computed) == 1
+
+    _series.append([[100.0, 0.0], [0.0, 0.0]])
+    assert statistics(_series).maximum == 100.0
+    assert statistics(list(_series)) is not statistics(list(_series))
+    assert len(computed) == 4
+    module.clear_cache()
+    statistics(_series)
+    assert len(computed) == 5
+
+
+def test_cached_statistics_do_not_keep_the_series_alive() -> None:
+    module.clear_cache()
+    _series = SeriesList(series())
+    reference = weakref.ref(_series)
+    statistics(_series)
+    assert len(module._cache) == 1
+    del _series
+    gc.collect()
+    assert reference() is None and not module._cache
+
+
+def test_statistics_read_one_step_at_a_time() -> None:
+    steps = []
+
+    class Series(list):  # type: ignore[type-arg]
+        def __getitem__(self, index: Any) -> Any:
+            steps.append(index)
+            return super().__getitem__(index)
+
+    result = statistics(Series(series()), steps=(0, 2))
+    assert result.range == (0.5, 3.0) and result.count == 7
+    assert steps == [-1, 0, 2, 0, 2]
+
+
+def test_empty_values() -> None:
+    result = statistics([[[float("nan")]]])
+    assert result.count == 0 and result.range == (0.0, 0.0)
+    assert global_range([result, statistics([[[2.0, 3.0]]])]) == (2.0, 3.0)
+    assert global_range([result]) == (0.0, 0.0)
+
+
+def test_series_bands() -> None:
+    bands = SeriesBands([[1, 2, 3], [3, 4], [np.nan, 6]])
+    assert len(bands) == 3
+    assert bands.count.tolist() == [2, 3, 1]
+    assert bands.mean.tolist() == [2.0, 4.0, 3.0]
+    assert bands.std.tolist() == [1.0, np.std([2, 4, 6]), 0.0]
+    lower, upper = bands.band()
+    assert lower.tolist() == [1.0, 4.0 - np.std([2, 4, 6]), 3.0]
+    lower, upper = bands.band("quantiles", (0.0, 0.5))
+    assert lower.tolist() == [1.0, 2.0, 3.0] and upper.tolist() == [2.0, 4.0, 3.0]
+    with pytest.raises(AssertionError):
+        bands.band("minmax")